@@ -0,0 +1,541 @@
+# app/logic/corpus.py
+"""
+연습 문장 코퍼스 (mmap 바이너리 파일)
+
+이 모듈은:
+- 큰 연습 문장 모음(수십만~수백만 문장)을 메모리에 올리지 않고 쓴다.
+  파일을 mmap으로 열고 필요한 문장만 그 자리에서 디코딩한다.
+- 문장마다 모국어 문장(prompt), 번역(target), 정규화된 target,
+  target 단어 ID(채점용)를 미리 저장한다.
+- 순차 / 무작위 / 간격 반복(spaced) 순서로 문장을 꺼낼 수 있다.
+- 파일은 추가만 한다. (기존 문장의 위치와 단어 ID는 바뀌지 않음)
+
+파일 구성 (path = "lesson.tlc"):
+- lesson.tlc       : 헤더 + 문장 레코드를 이어 붙인 것
+- lesson.tlc.idx   : 헤더 + 문장 i의 레코드 위치 (u64)
+- lesson.tlc.vocab : 단어 목록 (한 줄에 하나, 줄 번호 = 단어 ID)
+
+레코드: <HHHH (prompt, target, 정규화 target 바이트 수, 단어 수)
+        + UTF-8 문자열 3개 + 단어 ID (u32 × 단어 수)
+
+UI / Flet에 의존하지 않는다.
+
+빌드: python -m app.logic.corpus build lesson.tlc sentences.tsv --src ko --dst es
+"""
+
+from __future__ import annotations
+import argparse
+import math
+import mmap
+import os
+import random
+import struct
+import sys
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from app.text.align import align_words
+from app.text.compare import ignore_words_for
+from app.text.normalize import normalize_spoken
+
+from .practice import PracticeItem
+
+MAGIC = b"TLCORP1\0"
+INDEX_MAGIC = b"TLCIDX1\0"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sI8s8s4x")
+_RECORD = struct.Struct("<HHHH")
+_OFFSET = struct.Struct("<Q")
+
+INDEX_SUFFIX = ".idx"
+VOCAB_SUFFIX = ".vocab"
+
+# 간격 반복: 맞힐 때마다 다음 복습까지 꺼내는 문장 수가 늘어난다
+DEFAULT_GAPS = (3, 8, 20, 50)
+
+# 사전에 없는 발화 단어 (어떤 목표 단어와도 같지 않음)
+_UNKNOWN = -1
+
+
+class CorpusError(ValueError):
+    """코퍼스 파일 형식 오류"""
+
+
+@dataclass(frozen=True)
+class CorpusSentence:
+    """
+    코퍼스 문장 하나.
+
+    - normalized: normalize_spoken(target, dst_lang) 결과
+    - word_ids: normalized.split()의 단어 ID
+    """
+
+    index: int
+    prompt: str
+    target: str
+    normalized: str
+    word_ids: Tuple[int, ...]
+
+
+def _paths(path: str) -> Tuple[str, str, str]:
+    return path, path + INDEX_SUFFIX, path + VOCAB_SUFFIX
+
+
+def _lang_field(lang: str) -> bytes:
+    raw = lang.encode("ascii")
+    if len(raw) > 8:
+        raise ValueError(f"language code too long: {lang}")
+    return raw
+
+
+# =========================
+# 읽기
+# =========================
+
+class Corpus:
+    """
+    mmap으로 연 코퍼스 (읽기 전용).
+
+    - 여는 데 드는 시간은 문장 수와 무관하다. (헤더 확인 + mmap 두 번)
+    - 단어 목록은 채점에 처음 필요할 때 읽는다.
+    - 파일에 문장이 추가되면 reopen()으로 다시 연다.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._data_path, self._index_path, self._vocab_path = _paths(path)
+        self._data: Optional[mmap.mmap] = None
+        self._index: Optional[mmap.mmap] = None
+        self._vocab: Optional[List[str]] = None
+        self._vocab_ids: Optional[Dict[str, int]] = None
+        self._count = 0
+        self.src_lang = ""
+        self.dst_lang = ""
+        self.reopen()
+
+    def reopen(self) -> None:
+        self.close()
+        with open(self._data_path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with open(self._index_path, "rb") as f:
+            self._index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._data) < _HEADER.size:
+            raise CorpusError(f"not a corpus file: {self._data_path}")
+        magic, version, src, dst = _HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise CorpusError(f"not a corpus file: {self._data_path}")
+        if self._index[: len(INDEX_MAGIC)] != INDEX_MAGIC:
+            raise CorpusError(f"not a corpus index: {self._index_path}")
+
+        self.src_lang = src.rstrip(b"\0").decode("ascii")
+        self.dst_lang = dst.rstrip(b"\0").decode("ascii")
+        # 쓰다가 끊긴 마지막 항목(8바이트 미만)은 무시한다
+        self._count = (len(self._index) - len(INDEX_MAGIC)) // _OFFSET.size
+        self._vocab = None
+        self._vocab_ids = None
+
+    def close(self) -> None:
+        for m in (self._data, self._index):
+            if m is not None:
+                m.close()
+        self._data = self._index = None
+
+    def __enter__(self) -> "Corpus":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> CorpusSentence:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        data = self._data
+        (offset,) = _OFFSET.unpack_from(self._index, len(INDEX_MAGIC) + index * _OFFSET.size)
+        p_len, t_len, n_len, n_words = _RECORD.unpack_from(data, offset)
+        pos = offset + _RECORD.size
+        prompt = data[pos : pos + p_len].decode("utf-8")
+        pos += p_len
+        target = data[pos : pos + t_len].decode("utf-8")
+        pos += t_len
+        normalized = data[pos : pos + n_len].decode("utf-8")
+        pos += n_len
+        word_ids = struct.unpack_from(f"<{n_words}I", data, pos)
+        return CorpusSentence(index, prompt, target, normalized, word_ids)
+
+    def __iter__(self) -> Iterator[CorpusSentence]:
+        return self.sequential()
+
+    # -------------------------
+    # 순서
+    # -------------------------
+
+    def sequential(self, start: int = 0) -> Iterator[CorpusSentence]:
+        for i in range(start, self._count):
+            yield self[i]
+
+    def random(self, seed: Optional[int] = None) -> Iterator[CorpusSentence]:
+        """
+        모든 문장을 한 번씩 무작위 순서로 꺼낸다.
+
+        순열을 목록으로 만들지 않고 i → (a·i + c) mod n (gcd(a, n) = 1)로 계산한다.
+        """
+        n = self._count
+        if n == 0:
+            return
+        rng = random.Random(seed)
+        a = rng.randrange(1, n) if n > 1 else 1
+        while math.gcd(a, n) != 1:
+            a += 1
+        c = rng.randrange(n)
+        for i in range(n):
+            yield self[(a * i + c) % n]
+
+    def spaced(
+        self,
+        order: Optional[Iterable[int]] = None,
+        gaps: Sequence[int] = DEFAULT_GAPS,
+    ) -> "SpacedIterator":
+        """새 문장 사이에 이미 본 문장을 점점 긴 간격으로 다시 꺼낸다. (SpacedIterator)"""
+        return SpacedIterator(self, range(self._count) if order is None else order, gaps)
+
+    def lesson(self, order: str = "random", seed: Optional[int] = None) -> Iterator[PracticeItem]:
+        """
+        PracticeSession용 문장 이터레이터.
+
+        order: "sequential" | "random" | "spaced"
+        """
+        if order == "sequential":
+            sentences: Iterable[CorpusSentence] = self.sequential()
+        elif order == "random":
+            sentences = self.random(seed)
+        elif order == "spaced":
+            sentences = self.spaced()
+        else:
+            raise ValueError(f"unknown lesson order: {order}")
+        for s in sentences:
+            yield self._practice_item(s)
+
+    def practice_item(self, index: int) -> PracticeItem:
+        """index번 문장의 PracticeItem (item_id = index)"""
+        return self._practice_item(self[index])
+
+    def _practice_item(self, s: CorpusSentence) -> PracticeItem:
+        return PracticeItem(s.prompt, s.target, self.dst_lang, s.normalized, s.index)
+
+    # -------------------------
+    # 단어 / 채점
+    # -------------------------
+
+    @property
+    def vocab(self) -> List[str]:
+        """단어 ID → 단어 (처음 쓸 때 읽는다)"""
+        if self._vocab is None:
+            with open(self._vocab_path, "r", encoding="utf-8", newline="\n") as f:
+                self._vocab = f.read().split("\n")[:-1]
+        return self._vocab
+
+    def word_id(self, word: str) -> int:
+        """단어의 ID (없으면 -1)"""
+        if self._vocab_ids is None:
+            self._vocab_ids = {w: i for i, w in enumerate(self.vocab)}
+        return self._vocab_ids.get(word, _UNKNOWN)
+
+    def words(self, sentence: CorpusSentence) -> List[str]:
+        vocab = self.vocab
+        return [vocab[i] for i in sentence.word_ids]
+
+    def compare(
+        self,
+        sentence: CorpusSentence,
+        spoken: Optional[str],
+        level: Optional[str] = None,
+    ) -> List[Tuple[str, bool]]:
+        """
+        compare_sentence(sentence.normalized, normalize_spoken(spoken), level)와 같은 결과.
+
+        목표 문장은 저장된 단어 ID를 그대로 쓰고 발화만 ID로 바꿔 정렬한다.
+        반환하는 단어는 정규화된 형태다. (표시용 sentence.target과 대소문자 / 구두점이 다를 수 있다)
+        """
+        spoken_ids = [self.word_id(w) for w in normalize_spoken(spoken, self.dst_lang).split()]
+        ignore = {self.word_id(w) for w in ignore_words_for(level)}
+        ignore.discard(_UNKNOWN)
+        vocab = self.vocab
+        return [
+            (vocab[i], ok) for i, ok in align_words(sentence.word_ids, spoken_ids, ignore)
+        ]
+
+
+class SpacedIterator:
+    """
+    간격 반복 순서.
+
+    - order에서 새 문장을 하나씩 꺼내고, 본 문장은 gaps[단계]개 뒤에 다시 꺼낸다.
+    - grade(index, ok): 맞히면 다음 단계(간격 증가), 틀리면 첫 단계로.
+      grade하지 않은 문장은 맞힌 것으로 본다.
+    - 마지막 단계까지 맞힌 문장은 더 꺼내지 않는다.
+    """
+
+    def __init__(self, corpus: Corpus, order: Iterable[int], gaps: Sequence[int] = DEFAULT_GAPS) -> None:
+        if not gaps:
+            raise ValueError("gaps must not be empty")
+        self._corpus = corpus
+        self._order = iter(order)
+        self._gaps = tuple(gaps)
+        self._step = 0
+        self._stage: Dict[int, int] = {}
+        self._due: Deque[Tuple[int, int]] = deque()  # (step, index), step 순
+        self._last: Optional[int] = None
+
+    def __iter__(self) -> "SpacedIterator":
+        return self
+
+    def __next__(self) -> CorpusSentence:
+        self._schedule_last()
+        if self._due and self._due[0][0] <= self._step:
+            _, index = self._due.popleft()
+        else:
+            index = next(self._order, None)
+            if index is None:
+                if not self._due:
+                    raise StopIteration
+                # 새 문장이 없으면 다음 복습을 앞당긴다
+                _, index = self._due.popleft()
+        self._step += 1
+        self._last = index
+        return self._corpus[index]
+
+    def grade(self, index: int, ok: bool) -> None:
+        """방금 꺼낸 문장의 결과를 알린다."""
+        if ok:
+            self._stage[index] = self._stage.get(index, 0) + 1
+        else:
+            self._stage[index] = 0
+        if index == self._last:
+            self._schedule(index)
+            self._last = None
+
+    def _schedule_last(self) -> None:
+        if self._last is not None:
+            index, self._last = self._last, None
+            self._stage[index] = self._stage.get(index, 0) + 1
+            self._schedule(index)
+
+    def _schedule(self, index: int) -> None:
+        # 단계 = 연속으로 맞힌 횟수 (0이면 방금 틀림 → 첫 간격)
+        stage = self._stage.get(index, 0)
+        if stage > len(self._gaps):
+            self._stage.pop(index, None)
+            return
+        due = self._step + self._gaps[max(stage, 1) - 1]
+        # due는 대부분 끝에 붙으므로 뒤에서부터 자리를 찾는다
+        pos = len(self._due)
+        while pos > 0 and self._due[pos - 1][0] > due:
+            pos -= 1
+        self._due.insert(pos, (due, index))
+
+
+# =========================
+# 쓰기
+# =========================
+
+class CorpusWriter:
+    """
+    코퍼스에 문장을 추가한다. (파일이 없으면 새로 만든다)
+
+    쓰는 순서: 단어 목록 → 레코드 → 인덱스.
+    인덱스에 들어간 문장만 보이므로 중간에 끊겨도 열 수 있다.
+    """
+
+    def __init__(self, path: str, src_lang: str = "ko", dst_lang: str = "es") -> None:
+        self.path = path
+        data_path, index_path, vocab_path = _paths(path)
+        self._vocab_ids: Dict[str, int] = {}
+
+        if os.path.exists(data_path):
+            with Corpus(path) as existing:
+                self.src_lang, self.dst_lang = existing.src_lang, existing.dst_lang
+                self._vocab_ids = {w: i for i, w in enumerate(existing.vocab)}
+                self._count = len(existing)
+            self._data = open(data_path, "r+b")
+            self._index = open(index_path, "r+b")
+            # 인덱스에 없는 (끊긴) 꼬리는 버린다
+            self._index.truncate(len(INDEX_MAGIC) + self._count * _OFFSET.size)
+            self._index.seek(0, os.SEEK_END)
+            if self._count:
+                self._index.seek(-_OFFSET.size, os.SEEK_END)
+                (last,) = _OFFSET.unpack(self._index.read(_OFFSET.size))
+                p_len, t_len, n_len, n_words = _RECORD.unpack_from(
+                    self._read_at(self._data, last, _RECORD.size)
+                )
+                end = last + _RECORD.size + p_len + t_len + n_len + 4 * n_words
+            else:
+                end = _HEADER.size
+            self._data.truncate(end)
+            self._data.seek(0, os.SEEK_END)
+        else:
+            self.src_lang, self.dst_lang = src_lang, dst_lang
+            self._count = 0
+            self._data = open(data_path, "wb")
+            self._data.write(
+                _HEADER.pack(MAGIC, VERSION, _lang_field(src_lang), _lang_field(dst_lang))
+            )
+            self._index = open(index_path, "wb")
+            self._index.write(INDEX_MAGIC)
+            open(vocab_path, "wb").close()
+
+        self._vocab = open(vocab_path, "a", encoding="utf-8", newline="\n")
+
+    def __enter__(self) -> "CorpusWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, prompt: str, target: str) -> int:
+        """문장을 추가하고 문장 번호를 반환한다."""
+        return self.add_many([(prompt, target)])
+
+    def add_many(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        """(prompt, target) 쌍들을 추가한다. 마지막 문장 번호를 반환한다."""
+        records: List[bytes] = []
+        offsets: List[bytes] = []
+        new_words: List[str] = []
+        offset = self._data.tell()
+
+        for prompt, target in pairs:
+            normalized = normalize_spoken(target, self.dst_lang)
+            words = normalized.split()
+            p, t, n = prompt.encode("utf-8"), target.encode("utf-8"), normalized.encode("utf-8")
+            # 길이는 모두 16비트 필드에 들어간다 (단어장에 넣기 전에 확인)
+            if max(len(p), len(t), len(n), len(words)) > 0xFFFF:
+                raise ValueError(f"sentence too long: {prompt[:40]}")
+            ids = []
+            for w in words:
+                wid = self._vocab_ids.get(w)
+                if wid is None:
+                    wid = self._vocab_ids[w] = len(self._vocab_ids)
+                    new_words.append(w)
+                ids.append(wid)
+            record = b"".join((
+                _RECORD.pack(len(p), len(t), len(n), len(ids)),
+                p, t, n,
+                struct.pack(f"<{len(ids)}I", *ids),
+            ))
+            records.append(record)
+            offsets.append(_OFFSET.pack(offset))
+            offset += len(record)
+
+        if new_words:
+            self._vocab.write("".join(w + "\n" for w in new_words))
+            self._vocab.flush()
+        self._data.write(b"".join(records))
+        self._data.flush()
+        self._index.write(b"".join(offsets))
+        self._index.flush()
+        self._count += len(records)
+        return self._count - 1
+
+    def close(self) -> None:
+        for f in (self._vocab, self._data, self._index):
+            f.close()
+
+    @staticmethod
+    def _read_at(f, offset: int, size: int) -> bytes:
+        f.seek(offset)
+        return f.read(size)
+
+
+def build_corpus(
+    path: str,
+    pairs: Iterable[Tuple[str, str]],
+    src_lang: str = "ko",
+    dst_lang: str = "es",
+    chunk: int = 10000,
+) -> int:
+    """(prompt, target) 쌍들로 코퍼스를 만들거나 이어 쓴다. 전체 문장 수를 반환한다."""
+    with CorpusWriter(path, src_lang, dst_lang) as writer:
+        batch: List[Tuple[str, str]] = []
+        for pair in pairs:
+            batch.append(pair)
+            if len(batch) >= chunk:
+                writer.add_many(batch)
+                batch = []
+        if batch:
+            writer.add_many(batch)
+        return len(writer)
+
+
+# =========================
+# CLI
+# =========================
+
+def _read_tsv(path: str, src_lang: str, dst_lang: str, translate: bool) -> Iterator[Tuple[str, str]]:
+    """'모국어<TAB>번역' 줄을 읽는다. 번역이 없는 줄은 --translate일 때만 번역해 쓴다."""
+    from app.text.translate import translate_many
+
+    pending: List[str] = []
+
+    def flush() -> Iterator[Tuple[str, str]]:
+        for prompt, target in zip(pending, translate_many(pending, src_lang, dst_lang)):
+            if target:  # 실패한 번역은 None
+                yield prompt, target
+        pending.clear()
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            prompt, _, target = line.rstrip("\n").partition("\t")
+            prompt, target = prompt.strip(), target.strip()
+            if not prompt:
+                continue
+            if target:
+                yield prompt, target
+            elif translate:
+                pending.append(prompt)
+                if len(pending) >= 50:
+                    yield from flush()
+            else:
+                print(f"skip (no translation): {prompt}", file=sys.stderr)
+    if pending:
+        yield from flush()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.logic.corpus")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="TSV(모국어<TAB>번역)로 코퍼스를 만들거나 이어 쓴다")
+    build.add_argument("corpus")
+    build.add_argument("tsv")
+    build.add_argument("--src", default="ko")
+    build.add_argument("--dst", default="es")
+    build.add_argument("--translate", action="store_true", help="번역이 없는 줄은 번역해서 넣는다")
+
+    info = sub.add_parser("info", help="코퍼스 정보")
+    info.add_argument("corpus")
+
+    args = parser.parse_args(argv)
+    if args.command == "build":
+        count = build_corpus(
+            args.corpus, _read_tsv(args.tsv, args.src, args.dst, args.translate), args.src, args.dst
+        )
+        print(f"{args.corpus}: {count} sentences")
+    else:
+        with Corpus(args.corpus) as corpus:
+            size = sum(os.path.getsize(p) for p in _paths(args.corpus))
+            print(f"{args.corpus}: {len(corpus)} sentences, {corpus.src_lang} -> {corpus.dst_lang}, "
+                  f"{len(corpus.vocab)} words, {size / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,483 @@
+# app/logic/practice.py
+"""
+발음 연습 세션 (MODE 2)
+
+이 모듈은:
+- 레슨(연습 문장 목록)에서 문장을 하나씩 꺼내
+  SpeechBackend로 발화를 듣고, 텍스트 파이프라인으로 채점한다.
+  (normalize_spoken → align_sentence → accuracy)
+- 채점은 스레드에서 하고, 그동안 다음 문장을 보여 주고 듣기 시작한다.
+- 다음 문장(LOOKAHEAD개)은 미리 꺼내 두고 정답 음성도 미리 합성해 둔다.
+  (레슨 번역 / 디스크 읽기 / TTS 합성 대기로 문장 사이가 비지 않게)
+- 진행 상황은 콜백으로 알린다. UI / Flet에 의존하지 않는다. (asyncio만 사용)
+"""
+
+from __future__ import annotations
+import asyncio
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Awaitable, Callable, Deque, Iterable, Iterator, List, Optional, Set, Tuple
+
+from app.speech.speech_backend import SpeechBackend
+from app.text.accuracy import accuracy
+from app.text.compare import align_sentence
+from app.text.normalize import normalize_spoken
+
+if TYPE_CHECKING:
+    from .corpus import Corpus
+    from .scheduler import Scheduler
+
+# 미리 꺼내 두는 다음 문장 수
+LOOKAHEAD = 2
+
+# 문장 하나에 주는 기본 발화 시간(초)
+DEFAULT_ANSWER_SECONDS = 10.0
+
+# 정답 음성을 들려주는 동안 기다리는 시간 추정 (글자 / 초)
+CHARS_PER_SECOND = 14.0
+SLOW_FACTOR = 1.4
+
+# STT는 지역 코드까지 필요하다 (TTS는 "es" 그대로)
+STT_LOCALES = {"ko": "ko-KR", "es": "es-ES", "en": "en-US"}
+
+DEFAULT_PROMPTS: Tuple[str, ...] = (
+    "나는 오늘 커피를 마시고 싶다.",
+    "화장실이 어디에 있나요?",
+    "이것은 얼마예요?",
+    "저는 한국에서 왔어요.",
+    "메뉴를 보여 주세요.",
+    "천천히 말해 주세요.",
+    "지하철역은 어떻게 가나요?",
+    "계산서 주세요.",
+)
+
+
+@dataclass(frozen=True)
+class PracticeItem:
+    """
+    연습 문장 하나.
+
+    - prompt: 화면에 보여 줄 모국어 문장
+    - target: 말해야 하는 문장 (채점 기준)
+    - lang: target 언어 코드 ("es" 등)
+    - normalized: 미리 정규화한 target (코퍼스 등, 없으면 채점할 때 정규화)
+    - item_id: 코퍼스 문장 번호 (있으면 결과를 복습 스케줄러에 기록)
+    """
+
+    prompt: str
+    target: str
+    lang: str
+    normalized: Optional[str] = None
+    item_id: Optional[int] = None
+
+
+@dataclass
+class PracticeResult:
+    """
+    문장 하나의 채점 결과.
+
+    - words: [(목표 단어, 맞음 여부)] (compare_sentence와 같은 모양)
+    - listen_seconds: 듣기 시작부터 인식 결과까지
+    - score_seconds: 채점에 걸린 시간
+    """
+
+    index: int
+    item: PracticeItem
+    spoken: Optional[str]
+    words: List[Tuple[str, bool]] = field(default_factory=list)
+    accuracy: float = 0.0
+    listen_seconds: float = 0.0
+    score_seconds: float = 0.0
+
+
+def stt_locale(lang: str) -> str:
+    """'es' -> 'es-ES' (이미 지역 코드가 있으면 그대로)"""
+    if "-" in lang:
+        return lang
+    return STT_LOCALES.get(lang.lower(), lang)
+
+
+def speech_seconds(text: str, slow: bool = False) -> float:
+    """text를 읽는 데 걸리는 대략적인 시간(초)"""
+    seconds = len(text) / CHARS_PER_SECOND
+    return seconds * SLOW_FACTOR if slow else seconds
+
+
+def score_attempt(
+    target: str,
+    spoken: Optional[str],
+    level: Optional[str] = None,
+    lang: Optional[str] = None,
+    normalized: Optional[str] = None,
+) -> Tuple[List[Tuple[str, bool]], float]:
+    """
+    발화 하나를 채점한다. (순수 함수, 스레드에서 호출 가능)
+
+    normalized: 미리 정규화한 target (있으면 target 정규화를 건너뛴다)
+    반환값: ([(목표 단어, 맞음 여부)], 정확도)
+    """
+    alignment = align_sentence(
+        normalize_spoken(target, lang) if normalized is None else normalized,
+        normalize_spoken(spoken, lang),
+        level,
+    )
+    return list(alignment), accuracy(alignment)
+
+
+def translated_lesson(
+    prompts: Iterable[str],
+    src_lang: str,
+    dst_lang: str,
+    chunk: int = 8,
+) -> Iterator[PracticeItem]:
+    """
+    모국어 문장들을 chunk개씩 번역하면서 PracticeItem으로 내보낸다.
+
+    - 레슨 전체를 먼저 번역하지 않으므로 첫 문장이 바로 나온다.
+    - 번역 캐시에 있는 문장은 네트워크 없이 나온다.
+    - 번역에 실패한 문장은 건너뛴다.
+    """
+    from app.text.translate import translate_many
+
+    it = iter(prompts)
+    while True:
+        batch = [p for p in (next(it, None) for _ in range(chunk)) if p is not None]
+        if not batch:
+            return
+        for prompt, target in zip(batch, translate_many(batch, src_lang, dst_lang)):
+            if target:  # 실패한 번역은 None
+                yield PracticeItem(prompt, target, dst_lang)
+
+
+def scheduled_lesson(
+    corpus: "Corpus",
+    scheduler: Optional[Scheduler] = None,
+    learner: int = 0,
+) -> Iterator[PracticeItem]:
+    """
+    스케줄러(SM-2)가 고른 순서(복습 → 새 문장)로 코퍼스 문장을 내보낸다.
+
+    scheduler: 없으면 전역 스케줄러
+    """
+    from .scheduler import get_scheduler
+
+    scheduler = get_scheduler() if scheduler is None else scheduler
+    for index in scheduler.lesson(range(len(corpus)), learner):
+        yield corpus.practice_item(index)
+
+
+class PracticeSession:
+    """
+    발음 연습 세션.
+
+    흐름 (문장마다):
+    1. on_item: 문장 표시
+    2. 듣기: 무음 감지 / stop_answer() / 제한 시간 중 먼저 오는 것으로 끝 (on_tick으로 남은 초)
+    3. 채점: 스레드에서 실행, 끝나면 on_result (그동안 다음 단계 진행)
+    4. (speak_answer) 미리 합성해 둔 정답 음성 재생
+    5. 다음 문장 (이미 꺼내 둔 것)
+
+    콜백은 모두 run()을 실행하는 이벤트 루프에서 호출된다.
+    """
+
+    def __init__(
+        self,
+        speech_backend: SpeechBackend,
+        lesson: Iterable[PracticeItem],
+        level: Optional[str] = "Beginner",
+        answer_seconds: float = DEFAULT_ANSWER_SECONDS,
+        speak_answer: bool = True,
+        slow: bool = False,
+        on_item: Optional[Callable[[int, PracticeItem], None]] = None,
+        on_tick: Optional[Callable[[int], None]] = None,
+        on_partial: Optional[Callable[[str], None]] = None,
+        on_result: Optional[Callable[[PracticeResult], None]] = None,
+        scheduler: Optional[Scheduler] = None,
+        learner: int = 0,
+    ) -> None:
+        """
+        lesson: PracticeItem을 내보내는 이터러블 (제너레이터 가능, 스레드에서 꺼낸다)
+        level: 채점 난이도 (무시 단어, compare.IGNORE_WORDS)
+        answer_seconds: 문장 하나의 발화 제한 시간
+        speak_answer: 채점 후 정답 음성을 들려준다
+        scheduler: item_id가 있는 문장의 결과를 기록할 곳 (없으면 전역 스케줄러)
+        """
+        self.speech_backend = speech_backend
+        self.level = level
+        self.answer_seconds = answer_seconds
+        self.speak_answer = speak_answer
+        self.slow = slow
+        self.on_item = on_item
+        self.on_tick = on_tick
+        self.on_partial = on_partial
+        self.on_result = on_result
+        self.scheduler = scheduler
+        self.learner = learner
+
+        self.results: List[PracticeResult] = []
+        self._lesson = iter(lesson)
+        self._ahead: Deque[PracticeItem] = deque()
+        self._exhausted = False
+        # 꺼냈지만 아직 기록하지 않은 item_id (멈추면 스케줄러에 돌려준다)
+        self._unrecorded: Set[int] = set()
+        # _fill_ahead가 문장을 하나 꺼낼 때마다 set
+        self._item_ready = asyncio.Event()
+        self._scoring: List[asyncio.Future] = []
+        self._answer_done: Optional[asyncio.Event] = None
+        self._listening = False
+        self._running = False
+        self._stopped = False
+
+    # -------------------------
+    # 제어
+    # -------------------------
+
+    async def run(self) -> List[PracticeResult]:
+        """레슨이 끝나거나 stop()될 때까지 연습을 진행한다. 채점 결과 목록을 반환한다."""
+        self._stopped = False
+        self._running = True
+        filling: Optional[asyncio.Future] = None
+        index = 0
+        try:
+            while not self._stopped:
+                # 다음 문장 꺼내기 + 정답 음성 합성을 지금 문장과 겹쳐서 진행
+                # (꺼내기가 아직 안 끝나도 이미 꺼내 둔 문장이 있으면 기다리지 않는다.
+                #  스케줄러 레슨은 꺼내 둔 문장이 채점될 때까지 다음 문장을 미룰 수 있다)
+                if filling is None or filling.done():
+                    if filling is not None:
+                        filling.result()
+                    filling = asyncio.ensure_future(self._fill_ahead())
+                if not self._ahead and not await self._wait_item(filling):
+                    break
+                item = self._ahead.popleft()
+                await self._practice(index, item)
+                index += 1
+            if self._scoring:
+                await asyncio.gather(*self._scoring)
+        finally:
+            if filling is not None and not filling.done():
+                filling.cancel()
+            await self._cleanup()
+            self._running = False
+        return self.results
+
+    async def _wait_item(self, filling: asyncio.Future) -> bool:
+        """다음 문장이 꺼내질 때까지 기다린다. (꺼내기 전체가 끝날 때까지는 기다리지 않음)"""
+        self._item_ready.clear()
+        ready = asyncio.ensure_future(self._item_ready.wait())
+        try:
+            await asyncio.wait({filling, ready}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            ready.cancel()
+        if not self._ahead and filling.done():
+            filling.result()  # 꺼내다 난 오류는 그대로 올린다
+        return bool(self._ahead)
+
+    def stop_answer(self) -> None:
+        """지금 문장의 발화를 끝낸다. (STOP 버튼)"""
+        if self._answer_done is not None:
+            self._answer_done.set()
+
+    def stop(self) -> None:
+        """세션을 끝낸다. 듣던 발화는 버리고, 이미 시작한 채점은 마친다."""
+        self._stopped = True
+        self.stop_answer()
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def summary(self) -> dict:
+        """지금까지의 결과 요약"""
+        scores = [r.accuracy for r in self.results]
+        return {
+            "count": len(scores),
+            "average": sum(scores) / len(scores) if scores else 0.0,
+            "perfect": sum(1 for s in scores if s >= 1.0),
+        }
+
+    # -------------------------
+    # 내부
+    # -------------------------
+
+    async def _practice(self, index: int, item: PracticeItem) -> None:
+        if self.on_item:
+            self.on_item(index, item)
+
+        started = time.perf_counter()
+        spoken = await self._listen(item)
+        if self._stopped:
+            return
+        listened = time.perf_counter() - started
+
+        loop = asyncio.get_running_loop()
+        scoring = loop.run_in_executor(
+            None, score_attempt, item.target, spoken, self.level, item.lang, item.normalized
+        )
+        task = asyncio.ensure_future(self._report(index, item, spoken, listened, scoring))
+        self._scoring.append(task)
+        task.add_done_callback(self._scoring.remove)
+
+        if self.speak_answer and not self._stopped:
+            self.speech_backend.speak(item.target, lang=item.lang, slow=self.slow)
+            await self._sleep(speech_seconds(item.target, self.slow))
+
+    async def _listen(self, item: PracticeItem) -> Optional[str]:
+        loop = asyncio.get_running_loop()
+        done = asyncio.Event()
+        self._answer_done = done
+
+        def on_silence() -> None:
+            # 오디오 / 인식 스레드에서 호출될 수 있다
+            loop.call_soon_threadsafe(done.set)
+
+        self.speech_backend.start_stt(
+            on_silence=on_silence,
+            on_partial=self._partial_callback(loop),
+            lang=stt_locale(item.lang),
+        )
+        self._listening = True
+        try:
+            deadline = loop.time() + self.answer_seconds
+            while not done.is_set():
+                left = deadline - loop.time()
+                if left <= 0:
+                    break
+                if self.on_tick:
+                    self.on_tick(int(left + 0.999))
+                try:
+                    await asyncio.wait_for(done.wait(), min(1.0, left))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._listening = False
+        spoken = await self.speech_backend.stop_stt_async()
+        return spoken
+
+    def _partial_callback(self, loop: asyncio.AbstractEventLoop) -> Optional[Callable[[str], None]]:
+        if self.on_partial is None:
+            return None
+        callback = self.on_partial
+
+        def on_partial(text: str) -> None:
+            loop.call_soon_threadsafe(callback, text)
+
+        return on_partial
+
+    async def _report(
+        self,
+        index: int,
+        item: PracticeItem,
+        spoken: Optional[str],
+        listened: float,
+        scoring: Awaitable[Tuple[List[Tuple[str, bool]], float]],
+    ) -> None:
+        started = time.perf_counter()
+        try:
+            words, acc = await scoring
+        except Exception as e:
+            print(f"Practice scoring error: {e}")
+            words, acc = [], 0.0
+        result = PracticeResult(
+            index, item, spoken, words, acc,
+            listen_seconds=listened,
+            score_seconds=time.perf_counter() - started,
+        )
+        if item.item_id is not None:
+            # 기록하는 순간 레슨이 같은 문장(틀린 문장)을 다시 꺼낼 수 있으므로 먼저 뺀다
+            self._unrecorded.discard(item.item_id)
+            loop = asyncio.get_running_loop()
+            try:
+                await loop.run_in_executor(None, self._record, item.item_id, acc)
+            except Exception as e:
+                print(f"Practice record error: {e}")
+        self.results.append(result)
+        if self.on_result:
+            self.on_result(result)
+
+    def _record(self, item_id: int, acc: float) -> None:
+        if self.scheduler is None:
+            from .scheduler import get_scheduler
+
+            self.scheduler = get_scheduler()
+        self.scheduler.record(self.learner, item_id, acc)
+
+    def _release(self, item_ids: List[int]) -> None:
+        if self.scheduler is None:
+            from .scheduler import get_scheduler
+
+            self.scheduler = get_scheduler()
+        self.scheduler.release(self.learner, item_ids)
+
+    async def _fill_ahead(self) -> None:
+        """다음 문장을 LOOKAHEAD개까지 꺼내고 정답 음성을 미리 합성한다."""
+        while not self._exhausted and len(self._ahead) < LOOKAHEAD:
+            item = await asyncio.to_thread(next, self._lesson, None)
+            if item is None:
+                self._exhausted = True
+                return
+            self._ahead.append(item)
+            self._item_ready.set()
+            if item.item_id is not None:
+                self._unrecorded.add(item.item_id)
+            if self.speak_answer:
+                # prefetch와 달리 이전 문장을 취소하지 않으므로 LOOKAHEAD개를 함께 준비할 수 있다
+                self.speech_backend.presynthesize([item.target], lang=item.lang, slow=self.slow)
+
+    async def _sleep(self, seconds: float) -> None:
+        """정답 음성을 듣는 동안 기다린다. (stop()하면 바로 끝남)"""
+        done = self._answer_done
+        if done is None or seconds <= 0:
+            return
+        done.clear()
+        if self._stopped:
+            return
+        try:
+            await asyncio.wait_for(done.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _cleanup(self) -> None:
+        if self._listening:
+            self._listening = False
+            try:
+                await self.speech_backend.stop_stt_async()
+            except Exception as e:
+                print(f"Practice STT stop error: {e}")
+        if self._stopped:
+            self.speech_backend.stop_speaking()
+        self.speech_backend.cancel_prefetch()
+        if self._unrecorded:
+            # 연습하지 않은 문장은 다시 내보낼 수 있게 돌려준다 (기다리던 레슨도 풀림)
+            ids, self._unrecorded = sorted(self._unrecorded), set()
+            try:
+                await asyncio.to_thread(self._release, ids)
+            except Exception as e:
+                print(f"Practice release error: {e}")
+        self._answer_done = None
+
+
+def default_lesson(src_lang: str = "ko", dst_lang: str = "es") -> Iterator[PracticeItem]:
+    """
+    기본 연습 문장.
+
+    - TALKLAND_CORPUS에 코퍼스 파일(app.logic.corpus)이 있으면 거기서
+      (TALKLAND_CORPUS_ORDER: scheduled(기본, SM-2 복습) | random | sequential | spaced)
+    - 없으면 DEFAULT_PROMPTS를 번역하면서 내보낸다.
+    """
+    path = os.environ.get("TALKLAND_CORPUS")
+    if path:
+        from .corpus import Corpus
+
+        try:
+            corpus = Corpus(path)
+        except (OSError, ValueError) as e:
+            print(f"Corpus open error: {e}")
+        else:
+            order = os.environ.get("TALKLAND_CORPUS_ORDER", "scheduled")
+            if order == "scheduled":
+                return scheduled_lesson(corpus)
+            return corpus.lesson(order)
+    return translated_lesson(DEFAULT_PROMPTS, src_lang, dst_lang)
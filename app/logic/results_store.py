@@ -0,0 +1,379 @@
+# app/logic/results_store.py
+"""
+학습 기록 저장소 (write-behind SQLite)
+
+이 모듈은:
+- 인식 결과(transcript), 번역, 발음 연습 채점 결과를 저장한다.
+- UI 핸들러는 큐에 넣기만 하고 바로 돌아간다. (디스크 I/O 없음)
+- 백그라운드 스레드가 큐를 모아 트랜잭션 하나로 쓴다.
+  flush_interval마다, 큐가 max_batch만큼 차면, 종료할 때(close / atexit) 쓴다.
+- WAL 모드라 쓰는 동안에도 조회가 막히지 않는다.
+- 요약 테이블(날짜별 정확도, 단어별 틀린 횟수)을 쓰기와 함께 갱신하므로
+  집계 조회가 기록 전체를 훑지 않는다.
+
+sqlite3를 쓸 수 없는 환경(일부 Web 빌드 등)에서는 아무것도 저장하지 않는다.
+UI / Flet에 의존하지 않는다.
+"""
+
+from __future__ import annotations
+import atexit
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import sqlite3
+except ImportError:  # pragma: no cover - Pyodide 등
+    sqlite3 = None  # type: ignore[assignment]
+
+from app.utils.paths import DEFAULT_DATA_DIR
+
+DEFAULT_DB_PATH = os.path.join(DEFAULT_DATA_DIR, "results.sqlite3")
+
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_MAX_BATCH = 500
+DEFAULT_MAX_QUEUE = 10_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    mode TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS translations (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    src_lang TEXT NOT NULL,
+    dst_lang TEXT NOT NULL,
+    source TEXT NOT NULL,
+    translated TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    item INTEGER,
+    lang TEXT NOT NULL,
+    target TEXT NOT NULL,
+    spoken TEXT,
+    accuracy REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS daily_accuracy (
+    day TEXT PRIMARY KEY,
+    attempts INTEGER NOT NULL,
+    accuracy_sum REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS word_stats (
+    lang TEXT NOT NULL,
+    word TEXT NOT NULL,
+    seen INTEGER NOT NULL,
+    missed INTEGER NOT NULL,
+    PRIMARY KEY (lang, word)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS word_stats_missed ON word_stats (lang, missed);
+"""
+
+# 큐 항목 종류
+_TRANSCRIPT = "transcript"
+_TRANSLATION = "translation"
+_ATTEMPT = "attempt"
+_FLUSH = "flush"
+
+
+def day_of(ts: float) -> str:
+    """기록 시각의 (로컬) 날짜 'YYYY-MM-DD'"""
+    return time.strftime("%Y-%m-%d", time.localtime(ts))
+
+
+class ResultsStore:
+    """
+    write-behind 학습 기록 저장소.
+
+    - add_*(): 큐에 넣고 바로 반환 (큐가 가득 차면 버리고 dropped를 센다)
+    - flush(): 큐에 있는 것을 모두 쓸 때까지 기다린다
+    - accuracy_over_time() / most_missed(): 요약 테이블 조회
+    - path=None 이면 메모리 DB를 쓴다. (테스트 / 벤치마크용)
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = DEFAULT_DB_PATH,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+    ) -> None:
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        self._queue: "queue.Queue[Tuple[str, tuple]]" = queue.Queue(maxsize=max_queue)
+        self._read_lock = threading.Lock()
+        self._closed = False
+
+        self.dropped = 0
+        self.written = 0
+        self.batches = 0
+
+        self._writer, self._reader = self._open(path)
+        self._thread: Optional[threading.Thread] = None
+        if self._writer is not None:
+            self._thread = threading.Thread(target=self._run, name="results-store", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    @property
+    def enabled(self) -> bool:
+        return self._writer is not None
+
+    # -------------------------
+    # 기록 (UI 스레드에서 호출, 블로킹 없음)
+    # -------------------------
+
+    def add_transcript(self, text: str, lang: str, mode: str = "mode1") -> None:
+        if text:
+            self._put(_TRANSCRIPT, (time.time(), mode, lang, text))
+
+    def add_translation(self, source: str, translated: str, src_lang: str, dst_lang: str) -> None:
+        if source and translated:
+            self._put(_TRANSLATION, (time.time(), src_lang, dst_lang, source, translated))
+
+    def add_attempt(
+        self,
+        target: str,
+        spoken: Optional[str],
+        accuracy: float,
+        words: Sequence[Tuple[str, bool]],
+        lang: str,
+        item: Optional[int] = None,
+    ) -> None:
+        """
+        발음 연습 결과 하나.
+
+        words: compare_sentence 결과 [(목표 단어, 맞음 여부)]
+        """
+        self._put(_ATTEMPT, (time.time(), item, lang, target, spoken, accuracy, tuple(words)))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """지금까지 넣은 기록이 모두 쓰일 때까지 기다린다. 다 썼으면 True."""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put((_FLUSH, (done,)), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """남은 기록을 쓰고 저장소를 닫는다. (여러 번 불러도 된다)"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self.flush(timeout)
+            self._queue.put((_FLUSH, (None,)))  # None: 쓰기 스레드 종료
+            self._thread.join(timeout)
+        with self._read_lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+    # -------------------------
+    # 조회 (요약 테이블)
+    # -------------------------
+
+    def accuracy_over_time(self, days: int = 30) -> List[Tuple[str, int, float]]:
+        """최근 days일의 [(날짜, 시도 수, 평균 정확도)] (오래된 날짜부터)"""
+        since = day_of(time.time() - (days - 1) * 86400)
+        rows = self._query(
+            "SELECT day, attempts, accuracy_sum / attempts FROM daily_accuracy "
+            "WHERE day >= ? ORDER BY day",
+            (since,),
+        )
+        return [(day, count, avg) for day, count, avg in rows]
+
+    def most_missed(self, lang: str, limit: int = 10) -> List[Tuple[str, int, int]]:
+        """가장 많이 틀린 단어 [(단어, 틀린 횟수, 나온 횟수)]"""
+        return [
+            (word, missed, seen)
+            for word, missed, seen in self._query(
+                "SELECT word, missed, seen FROM word_stats "
+                "WHERE lang = ? AND missed > 0 ORDER BY missed DESC LIMIT ?",
+                (lang, limit),
+            )
+        ]
+
+    def recent_attempts(self, limit: int = 20) -> List[Dict[str, Any]]:
+        rows = self._query(
+            "SELECT ts, item, lang, target, spoken, accuracy FROM attempts "
+            "ORDER BY id DESC LIMIT ?",
+            (limit,),
+        )
+        keys = ("ts", "item", "lang", "target", "spoken", "accuracy")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": self.dropped,
+        }
+
+    # -------------------------
+    # 내부
+    # -------------------------
+
+    def _open(self, path: Optional[str]):
+        if sqlite3 is None:
+            return None, None
+        # 메모리 DB는 쓰기 / 읽기 연결이 같은 DB를 보도록 공유 캐시 URI로 연다
+        target = path or f"file:results-{id(self)}?mode=memory&cache=shared"
+        try:
+            if path:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            writer = sqlite3.connect(target, uri=not path, check_same_thread=False)
+            if path:
+                writer.execute("PRAGMA journal_mode=WAL")
+                # WAL에서는 NORMAL이어도 커밋 순서와 일관성은 유지된다 (전원 장애 시 마지막 몇 건만 잃을 수 있음)
+                writer.execute("PRAGMA synchronous=NORMAL")
+            writer.executescript(_SCHEMA)
+            reader = sqlite3.connect(target, uri=not path, check_same_thread=False)
+            return writer, reader
+        except Exception as e:
+            print(f"Results store disabled ({path}): {e}")
+            return None, None
+
+    def _put(self, kind: str, payload: tuple) -> None:
+        if self._writer is None or self._closed:
+            return
+        try:
+            self._queue.put_nowait((kind, payload))
+        except queue.Full:
+            self.dropped += 1
+
+    def _query(self, sql: str, params: tuple) -> List[tuple]:
+        with self._read_lock:
+            if self._reader is None:
+                return []
+            return self._reader.execute(sql, params).fetchall()
+
+    def _run(self) -> None:
+        """쓰기 스레드: flush_interval 동안 모은 기록을 트랜잭션 하나로 쓴다."""
+        stop = False
+        while not stop:
+            batch: List[Tuple[str, tuple]] = []
+            waiters: List[threading.Event] = []
+            try:
+                item = self._queue.get()  # 첫 항목은 무한정 기다린다
+                deadline = time.monotonic() + self._flush_interval
+                while True:
+                    kind, payload = item
+                    if kind == _FLUSH:
+                        if payload[0] is None:
+                            stop = True
+                        else:
+                            waiters.append(payload[0])
+                        break
+                    batch.append(item)
+                    if len(batch) >= self._max_batch:
+                        break
+                    left = deadline - time.monotonic()
+                    if left <= 0:
+                        break
+                    item = self._queue.get(timeout=left)
+            except queue.Empty:
+                pass
+
+            if batch:
+                try:
+                    self._write(batch)
+                except Exception as e:
+                    print(f"Results store write error: {e}")
+            for done in waiters:
+                done.set()
+
+        assert self._writer is not None
+        self._writer.close()
+        self._writer = None
+
+    def _write(self, batch: Iterable[Tuple[str, tuple]]) -> None:
+        transcripts, translations, attempts = [], [], []
+        daily: Dict[str, List[float]] = {}
+        seen: Counter = Counter()
+        missed: Counter = Counter()
+
+        for kind, payload in batch:
+            if kind == _TRANSCRIPT:
+                transcripts.append(payload)
+            elif kind == _TRANSLATION:
+                translations.append(payload)
+            elif kind == _ATTEMPT:
+                ts, item, lang, target, spoken, acc, words = payload
+                attempts.append((ts, item, lang, target, spoken, acc))
+                entry = daily.setdefault(day_of(ts), [0, 0.0])
+                entry[0] += 1
+                entry[1] += acc
+                for word, ok in words:
+                    seen[(lang, word)] += 1
+                    if not ok:
+                        missed[(lang, word)] += 1
+
+        db = self._writer
+        assert db is not None
+        with db:
+            if transcripts:
+                db.executemany(
+                    "INSERT INTO transcripts (ts, mode, lang, text) VALUES (?, ?, ?, ?)",
+                    transcripts,
+                )
+            if translations:
+                db.executemany(
+                    "INSERT INTO translations (ts, src_lang, dst_lang, source, translated) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    translations,
+                )
+            if attempts:
+                db.executemany(
+                    "INSERT INTO attempts (ts, item, lang, target, spoken, accuracy) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    attempts,
+                )
+                # 요약 테이블은 배치 안에서 먼저 합친 뒤 한 번씩만 갱신한다
+                db.executemany(
+                    "INSERT INTO daily_accuracy (day, attempts, accuracy_sum) VALUES (?, ?, ?) "
+                    "ON CONFLICT (day) DO UPDATE SET "
+                    "attempts = attempts + excluded.attempts, "
+                    "accuracy_sum = accuracy_sum + excluded.accuracy_sum",
+                    [(day, count, total) for day, (count, total) in daily.items()],
+                )
+                db.executemany(
+                    "INSERT INTO word_stats (lang, word, seen, missed) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (lang, word) DO UPDATE SET "
+                    "seen = seen + excluded.seen, missed = missed + excluded.missed",
+                    [(lang, word, count, missed[(lang, word)]) for (lang, word), count in seen.items()],
+                )
+
+        self.written += len(transcripts) + len(translations) + len(attempts)
+        self.batches += 1
+
+
+_store: Optional[ResultsStore] = None
+_store_lock = threading.Lock()
+
+
+def get_results_store() -> ResultsStore:
+    """앱 전역 기록 저장소 (처음 호출할 때 연다, 워밍업 스레드와 UI가 동시에 불러도 하나만)"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ResultsStore()
+        return _store
+
+
+def set_results_store(store: Optional[ResultsStore]) -> None:
+    """전역 기록 저장소를 교체한다. (테스트 / 설정용)"""
+    global _store
+    _store = store
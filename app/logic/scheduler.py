@@ -0,0 +1,402 @@
+# app/logic/scheduler.py
+"""
+간격 반복 스케줄러 (SM-2)
+
+이 모듈은:
+- 학습자 × 문장마다 채점 결과(accuracy())로 SM-2 복습 간격을 갱신한다.
+- 상태는 SQLite 한 테이블에 정수 열로만 저장한다. (학습자, 문장) 클러스터 키 WITHOUT ROWID
+- (학습자, 복습 시각) 인덱스가 우선순위 큐 역할을 한다.
+  "다음 N개"는 B-tree 탐색 한 번 + N칸 읽기 (O(log n + N)), 기록 전체를 훑지 않는다.
+- 아직 본 적 없는 문장은 호출하는 쪽의 순서(코퍼스 등)에서 채운다.
+
+UI / Flet에 의존하지 않는다.
+"""
+
+from __future__ import annotations
+import atexit
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import sqlite3
+except ImportError:  # pragma: no cover - Pyodide 등
+    sqlite3 = None  # type: ignore[assignment]
+
+from app.utils.paths import DEFAULT_DATA_DIR
+
+DEFAULT_DB_PATH = os.path.join(DEFAULT_DATA_DIR, "reviews.sqlite3")
+
+DEFAULT_LEARNER = 0
+
+DAY = 86400
+
+# SM-2 기본값
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+PASS_QUALITY = 3
+
+# 틀린 문장은 하루가 아니라 이 시간 뒤에 다시 나온다 (같은 연습 안에서 복습)
+RELEARN_SECONDS = 600
+# lesson()이 미리 내보낸 문장의 채점을 기다리는 최대 시간(초)
+PENDING_WAIT = 30.0
+
+# ease는 천분율 정수, 점수는 백분율 정수로 저장한다
+_EASE_SCALE = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews (
+    learner INTEGER NOT NULL,
+    item INTEGER NOT NULL,
+    due INTEGER NOT NULL,
+    interval INTEGER NOT NULL,
+    ease INTEGER NOT NULL,
+    reps INTEGER NOT NULL,
+    lapses INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    PRIMARY KEY (learner, item)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS reviews_due ON reviews (learner, due);
+"""
+
+
+@dataclass(frozen=True)
+class ReviewState:
+    """
+    문장 하나의 복습 상태.
+
+    - due: 다음 복습 시각 (epoch 초)
+    - interval: 복습 간격 (일, 틀렸으면 0)
+    - reps: 연속으로 맞힌 횟수
+    - score: 마지막 정확도 (0.0 ~ 1.0)
+    """
+
+    learner: int
+    item: int
+    due: int
+    interval: int = 0
+    ease: float = INITIAL_EASE
+    reps: int = 0
+    lapses: int = 0
+    score: float = 0.0
+
+    def to_row(self) -> Tuple[int, ...]:
+        return (
+            self.learner, self.item, self.due, self.interval,
+            round(self.ease * _EASE_SCALE), self.reps, self.lapses, round(self.score * 100),
+        )
+
+    @classmethod
+    def from_row(cls, row: Tuple[int, ...]) -> "ReviewState":
+        learner, item, due, interval, ease, reps, lapses, score = row
+        return cls(learner, item, due, interval, ease / _EASE_SCALE, reps, lapses, score / 100)
+
+
+def quality_from_accuracy(acc: float) -> int:
+    """정확도(0.0 ~ 1.0)를 SM-2 품질 점수(0 ~ 5)로 바꾼다."""
+    return max(0, min(5, int(acc * 5 + 0.5)))
+
+
+def sm2_update(
+    state: Optional[ReviewState],
+    learner: int,
+    item: int,
+    quality: int,
+    now: float,
+) -> ReviewState:
+    """
+    SM-2로 다음 상태를 계산한다. (순수 함수)
+
+    - 품질 3 미만: 연속 횟수 초기화, RELEARN_SECONDS 뒤에 다시
+    - 그 외: 간격 1일 → 6일 → 이전 간격 × ease
+    - ease는 품질에 따라 조정하고 MIN_EASE 밑으로 내려가지 않는다.
+    """
+    if state is None:
+        state = ReviewState(learner, item, due=0)
+
+    ease = max(MIN_EASE, state.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    ease = round(ease * _EASE_SCALE) / _EASE_SCALE  # 저장되는 정밀도에 맞춘다
+    if quality < PASS_QUALITY:
+        return ReviewState(
+            learner, item, int(now) + RELEARN_SECONDS, 0, ease,
+            0, state.lapses + 1, quality / 5,
+        )
+
+    reps = state.reps + 1
+    if reps == 1:
+        interval = 1
+    elif reps == 2:
+        interval = 6
+    else:
+        interval = max(1, round(state.interval * state.ease))
+    return ReviewState(
+        learner, item, int(now) + interval * DAY, interval, ease,
+        reps, state.lapses, quality / 5,
+    )
+
+
+class Scheduler:
+    """
+    SQLite 기반 SM-2 스케줄러.
+
+    - record(): 채점 결과 기록 (accuracy 0.0 ~ 1.0)
+    - next_due(): 복습할 때가 된 문장 N개 (복습 시각 순)
+    - next_items(): 복습 문장 + 새 문장으로 N개 채우기
+    - 여러 스레드에서 호출해도 안전하다.
+    - path=None 이면 메모리 DB를 쓴다. (테스트 / 벤치마크용)
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_DB_PATH) -> None:
+        if sqlite3 is None:
+            raise RuntimeError("sqlite3 is not available")
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        # record()가 _handed_out에서 빼면 알린다 (lesson()이 기다림)
+        self._recorded = threading.Condition(self._lock)
+        self._db = sqlite3.connect(path or ":memory:", check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        # lesson()이 내보냈지만 아직 기록되지 않은 (학습자, 문장)
+        self._handed_out: Set[Tuple[int, int]] = set()
+        # release()로 돌려받은 (학습자, 문장) → 그 문장을 기다리던 lesson()은 끝난다
+        self._released: Set[Tuple[int, int]] = set()
+
+    # -------------------------
+    # 기록
+    # -------------------------
+
+    def record(
+        self,
+        learner: int,
+        item: int,
+        acc: float,
+        now: Optional[float] = None,
+    ) -> ReviewState:
+        """채점 결과를 기록하고 새 상태를 반환한다."""
+        now = time.time() if now is None else now
+        with self._lock:
+            state = sm2_update(self._get(learner, item), learner, item, quality_from_accuracy(acc), now)
+            self._conn().execute(
+                "INSERT OR REPLACE INTO reviews VALUES (?, ?, ?, ?, ?, ?, ?, ?)", state.to_row()
+            )
+            self._conn().commit()
+            self._handed_out.discard((learner, item))
+            self._recorded.notify_all()
+        return state
+
+    def record_many(
+        self,
+        results: Iterable[Tuple[int, int, float]],
+        now: Optional[float] = None,
+    ) -> int:
+        """(학습자, 문장, 정확도)들을 트랜잭션 하나로 기록한다. 기록한 수를 반환한다."""
+        now = time.time() if now is None else now
+        count = 0
+        with self._lock:
+            db = self._conn()
+            with db:
+                for learner, item, acc in results:
+                    state = sm2_update(
+                        self._get(learner, item), learner, item, quality_from_accuracy(acc), now
+                    )
+                    db.execute(
+                        "INSERT OR REPLACE INTO reviews VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        state.to_row(),
+                    )
+                    self._handed_out.discard((learner, item))
+                    count += 1
+            self._recorded.notify_all()
+        return count
+
+    # -------------------------
+    # 조회
+    # -------------------------
+
+    def get(self, learner: int, item: int) -> Optional[ReviewState]:
+        with self._lock:
+            return self._get(learner, item)
+
+    def next_due(
+        self,
+        learner: int,
+        n: int = 10,
+        now: Optional[float] = None,
+    ) -> List[int]:
+        """복습할 때가 된 문장 번호를 복습 시각 순으로 최대 n개 반환한다."""
+        now = time.time() if now is None else now
+        with self._lock:
+            rows = self._conn().execute(
+                "SELECT item FROM reviews WHERE learner = ? AND due <= ? ORDER BY due LIMIT ?",
+                (learner, int(now), n),
+            ).fetchall()
+        return [item for (item,) in rows]
+
+    def next_items(
+        self,
+        learner: int,
+        n: int,
+        new_items: Iterable[int] = (),
+        now: Optional[float] = None,
+        exclude: Iterable[Tuple[int, int]] = (),
+    ) -> List[int]:
+        """
+        복습할 문장을 먼저, 모자라면 new_items에서 처음 보는 문장으로 n개를 채운다.
+
+        new_items는 필요한 만큼만 꺼낸다. (코퍼스 전체를 넘겨도 된다)
+        """
+        skip = set(exclude)
+        items = [i for i in self.next_due(learner, n + len(skip), now) if (learner, i) not in skip][:n]
+        if len(items) >= n:
+            return items
+        chosen = set(items)
+        with self._lock:
+            for item in new_items:
+                if item in chosen or (learner, item) in skip:
+                    continue
+                if self._get(learner, item) is None:
+                    items.append(item)
+                    chosen.add(item)
+                    if len(items) >= n:
+                        break
+        return items
+
+    def due_count(self, learner: int, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        with self._lock:
+            (count,) = self._conn().execute(
+                "SELECT COUNT(*) FROM reviews WHERE learner = ? AND due <= ?", (learner, int(now))
+            ).fetchone()
+        return count
+
+    def lesson(
+        self,
+        new_items: Iterable[int],
+        learner: int = DEFAULT_LEARNER,
+        batch: int = 10,
+        wait: float = PENDING_WAIT,
+    ) -> Iterator[int]:
+        """
+        복습 / 새 문장 순으로 연습할 문장 번호를 내보낸다.
+
+        new_items: 처음 보는 문장을 고를 순서 (예: range(len(corpus)), 필요한 만큼만 꺼낸다)
+        문장 번호를 PracticeItem으로 바꾸는 것은 호출하는 쪽(practice.scheduled_lesson) 몫이다.
+
+        - 내보냈지만 아직 record()되지 않은 문장은 다시 내보내지 않는다.
+        - 복습할 문장도 새 문장도 없으면:
+          - 틀려서 RELEARN_SECONDS 뒤로 미뤄진 문장을 앞당겨 다시 내보낸다.
+            (틀린 문장은 같은 연습 안에서 맞힐 때까지 다시 나온다)
+          - 이 레슨이 내보낸 문장이 아직 채점 중이면 기록될 때까지 기다린다. (최대 wait초)
+            PracticeSession은 문장을 미리 꺼내 두므로 마지막 문장은 아직 기록 전일 수 있다.
+          - 그것도 없으면 끝난다.
+        """
+        fresh = iter(new_items)
+        mine: Set[Tuple[int, int]] = set()
+        while True:
+            with self._lock:
+                pending = {key for key in self._handed_out if key[0] == learner}
+                mine &= pending
+            ids = self.next_items(learner, batch, fresh, exclude=pending)
+            if not ids:
+                ids = self.relearn_items(learner, batch, exclude=pending)
+            if not ids:
+                if mine and self._wait_recorded(mine, wait):
+                    continue
+                return
+            for item in ids:
+                with self._lock:
+                    self._handed_out.add((learner, item))
+                    self._released.discard((learner, item))
+                mine.add((learner, item))
+                yield item
+
+    def relearn_items(
+        self,
+        learner: int,
+        n: int,
+        now: Optional[float] = None,
+        exclude: Iterable[Tuple[int, int]] = (),
+    ) -> List[int]:
+        """틀려서 RELEARN_SECONDS 안쪽으로 미뤄진 문장을 복습 시각 순으로 최대 n개 반환한다."""
+        now = time.time() if now is None else now
+        skip = set(exclude)
+        with self._lock:
+            rows = self._conn().execute(
+                "SELECT item FROM reviews WHERE learner = ? AND due > ? AND due <= ? "
+                "ORDER BY due LIMIT ?",
+                (learner, int(now), int(now) + RELEARN_SECONDS, n + len(skip)),
+            ).fetchall()
+        return [item for (item,) in rows if (learner, item) not in skip][:n]
+
+    def release(self, learner: int, items: Iterable[int]) -> None:
+        """
+        lesson()이 내보냈지만 연습하지 않은 문장을 돌려놓는다. (연습을 중간에 멈췄을 때)
+
+        그 문장의 채점을 기다리던 lesson()은 더 내보내지 않고 끝난다.
+        """
+        with self._lock:
+            for item in items:
+                if (learner, item) in self._handed_out:
+                    self._handed_out.discard((learner, item))
+                    self._released.add((learner, item))
+            self._recorded.notify_all()
+
+    def close(self) -> None:
+        """DB를 닫는다. 이후 기록 / 조회 / lesson()은 RuntimeError("Scheduler is closed")"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+            self._recorded.notify_all()
+
+    # -------------------------
+    # 내부
+    # -------------------------
+
+    def _wait_recorded(self, keys: Set[Tuple[int, int]], timeout: float) -> bool:
+        """
+        keys 중 하나라도 기록될 때까지 기다린다.
+
+        시간이 지나거나 keys 중 하나가 release()되면 False. (돌려받은 표시는 여기서 지운다)
+        """
+        with self._recorded:
+            done = self._recorded.wait_for(
+                lambda: self._db is None or any(key not in self._handed_out for key in keys),
+                timeout,
+            )
+            released = keys & self._released
+            self._released -= released
+        return done and not released
+
+    def _conn(self) -> "sqlite3.Connection":
+        """열린 DB 연결 (lock 안에서 호출). close() 뒤에는 RuntimeError"""
+        if self._db is None:
+            raise RuntimeError("Scheduler is closed")
+        return self._db
+
+    def _get(self, learner: int, item: int) -> Optional[ReviewState]:
+        row = self._conn().execute(
+            "SELECT * FROM reviews WHERE learner = ? AND item = ?", (learner, item)
+        ).fetchone()
+        return ReviewState.from_row(row) if row is not None else None
+
+
+_scheduler: Optional[Scheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> Scheduler:
+    """앱 전역 스케줄러 (처음 호출할 때 연다, 종료할 때 닫는다)"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = Scheduler()
+            atexit.register(_scheduler.close)
+        return _scheduler
+
+
+def set_scheduler(scheduler: Optional[Scheduler]) -> None:
+    """전역 스케줄러를 교체한다. (테스트 / 설정용)"""
+    global _scheduler
+    _scheduler = scheduler
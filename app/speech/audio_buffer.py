@@ -0,0 +1,95 @@
+# app/speech/audio_buffer.py
+"""
+PcmRingBuffer
+
+- 마이크 입력(float32 블록)을 미리 할당한 int16 링 버퍼에 바로 써 넣는다.
+- 오디오 콜백에서 블록마다 새 배열을 만들지 않는다.
+- 같은 데이터를 버퍼 뒤쪽 절반에도 한 번 더 써 두므로(mirror)
+  capacity 이하의 어떤 구간이든 복사 없이 연속된 view로 꺼낼 수 있다.
+
+위치는 reset 이후 누적 샘플 수(절대 위치)로 다룬다.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+class PcmRingBuffer:
+    """고정 용량 int16 PCM 링 버퍼 (모노)"""
+
+    def __init__(self, capacity: int, block_hint: int = 4096) -> None:
+        """
+        capacity: 보관할 최대 샘플 수 (초과하면 오래된 샘플부터 덮어쓴다)
+        block_hint: 예상 최대 블록 크기 (변환용 작업 버퍼 크기)
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._buf = np.zeros(2 * capacity, dtype=np.int16)
+        self._scratch_f = np.empty(block_hint, dtype=np.float32)
+        self._scratch_i = np.empty(block_hint, dtype=np.int16)
+        self.total = 0
+
+    def reset(self) -> None:
+        """새 녹음을 시작한다. (메모리는 재사용)"""
+        self.total = 0
+
+    @property
+    def start(self) -> int:
+        """아직 덮어쓰이지 않은 가장 오래된 샘플의 절대 위치"""
+        return max(0, self.total - self.capacity)
+
+    def write(self, block: np.ndarray) -> None:
+        """
+        float32 블록([-1, 1], (frames,) 또는 (frames, 1))을 int16으로 변환해 기록한다.
+
+        변환은 블록당 한 번, 작업 버퍼 안에서만 일어난다.
+        """
+        x = block.reshape(-1)
+        n = len(x)
+        if n == 0:
+            return
+        if n > self.capacity:
+            self.total += n - self.capacity
+            x = x[-self.capacity :]
+            n = self.capacity
+        if n > len(self._scratch_f):
+            self._scratch_f = np.empty(n, dtype=np.float32)
+            self._scratch_i = np.empty(n, dtype=np.int16)
+
+        f = self._scratch_f[:n]
+        pcm = self._scratch_i[:n]
+        np.multiply(x, 32767.0, out=f)
+        np.clip(f, -32768.0, 32767.0, out=f)
+        np.copyto(pcm, f, casting="unsafe")
+
+        cap = self.capacity
+        pos = self.total % cap
+        first = min(n, cap - pos)
+        buf = self._buf
+        buf[pos : pos + first] = pcm[:first]
+        buf[cap + pos : cap + pos + first] = pcm[:first]
+        if first < n:
+            rest = n - first
+            buf[:rest] = pcm[first:]
+            buf[cap : cap + rest] = pcm[first:]
+        self.total += n
+
+    def view(self, start: int, end: int) -> np.ndarray:
+        """
+        절대 위치 [start, end) 구간을 복사 없이 반환한다.
+
+        - 이미 덮어쓰인 앞부분은 잘려 나간다.
+        - 반환된 view는 이후 기록으로 capacity 만큼 더 쌓이면 덮어쓰일 수 있다.
+        """
+        start = max(start, self.start)
+        end = min(end, self.total)
+        if end <= start:
+            return self._buf[:0]
+        pos = start % self.capacity
+        return self._buf[pos : pos + (end - start)]
+
+    def latest(self) -> np.ndarray:
+        """보관 중인 전체 녹음을 복사 없이 반환한다."""
+        return self.view(self.start, self.total)
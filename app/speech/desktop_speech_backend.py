@@ -3,113 +3,276 @@
 DesktopSpeechBackend
 
 - Windows / macOS / Linux 전용
-- STT: Google Web Speech API (온라인)
-- TTS: Edge TTS (외부 프로세스)
+- STT: Google Web Speech API (온라인) 또는 Whisper (로컬, 오프라인) 중 선택
+  - 녹음 PCM을 파일 없이 바로 전달
+  - 인식은 RecognitionExecutor(우선순위 큐 + 제한된 워커)에서 실행
+  - 스트리밍 모드: 말하는 도중 쉼마다 구간을 잘라 백그라운드에서 인식
+  - 말소리 구간 / 발화 종료는 VoiceActivityDetector(vad.py)로 판단
+- TTS: Edge TTS (한 번 띄워 둔 워커 프로세스, tts_worker.py)
+  - 합성한 음성은 디스크에 캐시해서 다시 재생할 때 네트워크를 쓰지 않음
 - Android/Web 빌드에서 import 금지
+- sounddevice / speech_recognition은 처음 쓸 때 import 한다. (앱 시작을 가볍게)
 """
 
 from __future__ import annotations
-from typing import Optional, List
-import time
-import tempfile
-import subprocess
-import sys
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
-import sounddevice as sd
 import numpy as np
-import scipy.io.wavfile as wav
+
+from app.utils import tracing
 
 from .speech_backend import SpeechBackend
-import speech_recognition as sr
+from .audio_buffer import PcmRingBuffer
+from .streaming_stt import StreamingTranscriber
+from .recognition_executor import INTERACTIVE, QueueFull, RecognitionExecutor
+from .tts_worker import TtsWorkerClient
+from .whisper_engine import DEFAULT_MODEL, WhisperEngine
+from .vad import NO_SPEECH, SEGMENT, UTTERANCE_END, VadConfig, VoiceActivityDetector
+
+if TYPE_CHECKING:
+    import sounddevice as sd
 
 
+STT_ENGINES = ("google", "whisper")
+# 발화 하나의 인식을 기다리는 최대 시간(초, 큐 대기 포함)
+RECOGNITION_TIMEOUT = 30.0
 
-import os
 
 class DesktopSpeechBackend(SpeechBackend):
     """데스크탑 전용 STT / TTS 백엔드"""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        streaming: bool = True,
+        max_duration: float = 120.0,
+        vad_config: Optional[VadConfig] = None,
+        stt_engine: str = "google",
+        language: str = "ko-KR",
+        whisper_model: str = DEFAULT_MODEL,
+    ) -> None:
+        """
+        streaming: 녹음 중에 구간별로 미리 인식할지 여부
+        max_duration: 보관할 최대 녹음 길이(초). 넘으면 오래된 소리부터 덮어쓴다
+        vad_config: 말소리 감지 설정 (기본값: VadConfig())
+        stt_engine: "google" (온라인) | "whisper" (로컬 CPU)
+        language: 인식 언어 ('ko-KR', 'es-ES' 등)
+        whisper_model: Whisper 모델 크기 (tiny | base | small | medium | large)
+        """
+        if stt_engine not in STT_ENGINES:
+            raise ValueError(f"unknown STT engine: {stt_engine}")
+        self.stt_engine = stt_engine
         self._fs: int = 16000
-        self._recording: List[np.ndarray] = []
-        self._stream: Optional[sd.InputStream] = None
-        self._recognizer = sr.Recognizer()
+        # 녹음은 미리 할당한 int16 링 버퍼에 바로 기록한다
+        self._recording = PcmRingBuffer(int(self._fs * max_duration))
+        self._stream: Optional["sd.InputStream"] = None
+        self._recognizer: Any = None  # speech_recognition.Recognizer (처음 인식할 때 생성)
+        self.language = language
+        self._whisper: Optional[WhisperEngine] = None
+        if stt_engine == "whisper":
+            # 모델은 앱 시작과 함께 백그라운드에서 로드해 두고 계속 재사용한다
+            self._whisper = WhisperEngine(whisper_model, language)
+            self._whisper.load_async()
+        # Whisper 모델은 한 번에 하나만 인식하므로 워커를 늘려도 소용없다
+        self._executor = RecognitionExecutor(
+            max_workers=1 if self._whisper else 2,
+            default_timeout=RECOGNITION_TIMEOUT,
+        )
+        self._streaming = streaming
+        self._vad = VoiceActivityDetector(vad_config or VadConfig(sample_rate=self._fs))
+        self._pushed = False
+        self._transcriber: Optional[StreamingTranscriber] = None
+        # 구간 측정용 시각 (tracing이 꺼져 있으면 None)
+        self._capture_started: Optional[float] = None
+        self._speech_ended: Optional[float] = None
+        # TTS 워커는 워밍업 단계에서 미리 띄운다 (warmup_tasks 참고)
+        self._tts = TtsWorkerClient()
+
+    # -------------------------
+    # 워밍업
+    # -------------------------
+
+    def warmup_tasks(self) -> Dict[str, Callable[[], None]]:
+        """
+        첫 사용 지연을 없애기 위한 백그라운드 초기화 작업
+
+        - microphone: PortAudio 초기화 + 입력 장치 조회 / 설정 확인
+        - stt: 인식 엔진 준비 (Google 클라이언트 import 또는 Whisper 모델 로드 대기)
+        - tts: TTS 워커 프로세스 시작 + mixer 초기화
+        """
+        return {
+            "microphone": self._warm_microphone,
+            "stt": self._warm_stt,
+            "tts": self._warm_tts,
+        }
+
+    def _warm_microphone(self) -> None:
+        import sounddevice as sd
+
+        sd.query_devices(kind="input")
+        sd.check_input_settings(samplerate=self._fs, channels=1)
+
+    def _warm_stt(self) -> None:
+        if self._whisper is not None:
+            if not self._whisper.wait_ready():
+                raise RuntimeError(f"Whisper load failed: {self._whisper.error}")
+            return
+        import speech_recognition as sr
+
+        if self._recognizer is None:
+            self._recognizer = sr.Recognizer()
+
+    def _warm_tts(self) -> None:
+        if not self._tts.wait_ready(timeout=30.0):
+            raise TimeoutError("TTS worker did not become ready")
 
     # -------------------------
     # STT
     # -------------------------
 
-    def start_stt(self, on_silence: Optional[callable] = None) -> None:
+    def start_stt(
+        self,
+        on_silence: Optional[callable] = None,
+        on_partial: Optional[callable] = None,
+        lang: Optional[str] = None,
+    ) -> None:
         """
         마이크 녹음을 시작한다.
-        on_silence: 10초 이상 무음 시 호출될 콜백 함수
+        on_silence: 말이 끝나고 잠시 조용하거나, 10초 동안 말이 없을 때 호출될 콜백 함수
+        on_partial: (스트리밍 모드) 구간이 인식될 때마다 지금까지의 문장으로 호출
+        lang: 이번부터 쓸 인식 언어 (예: 'ko-KR', 'es-ES'. 없으면 그대로)
         """
-        self._recording.clear()
+        if lang:
+            self.language = lang
+        self._recording.reset()
+        self._vad.reset()
         self._on_silence = on_silence
-        self._last_speech_time = time.time()
-        self._silence_limit = 10.0  # 초
-        self._energy_threshold = 0.01  # 적당한 임계값 (조정 필요)
+        self._pushed = False
+        self._speech_ended = None
+        self._transcriber = (
+            StreamingTranscriber(self._recognize_queued, on_partial) if self._streaming else None
+        )
 
         def callback(indata, frames, time_info, status):
             if status:
                 print("Audio status:", status)
-            
-            # 오디오 데이터 복사 및 저장
-            data_copy = indata.copy()
-            self._recording.append(data_copy)
-            
-            # 에너지(RMS) 계산
-            rms = np.sqrt(np.mean(data_copy**2))
-            
-            # 말하고 있으면 시간 갱신
-            if rms > self._energy_threshold:
-                self._last_speech_time = time.time()
-            
-            # 무음 지속 시간 체크
-            silence_duration = time.time() - self._last_speech_time
-            if silence_duration > self._silence_limit:
-                if self._on_silence:
-                     # 콜백 호출 (주의: 별도 스레드에서 실행됨)
-                    self._on_silence()
-                    # 중복 호출 방지를 위해 콜백 제거
-                    self._on_silence = None
-
-        self._stream = sd.InputStream(
-            samplerate=self._fs,
-            channels=1,
-            callback=callback,
-        )
-        self._stream.start()
+
+            # int16 변환 후 링 버퍼에 기록 (블록 복사본을 만들지 않음)
+            self._recording.write(indata)
+
+            # 프레임 단위 말소리 감지 (시간은 샘플 수로 잰다)
+            for event in self._vad.process(indata):
+                if event.kind == SEGMENT:
+                    # 스트리밍: 말이 끊긴 지점에서 구간을 잘라 인식기로 넘긴다
+                    # (인식이 다음 녹음보다 늦게 끝날 수 있으므로 링 버퍼 view가 아닌 복사본)
+                    if self._transcriber:
+                        self._transcriber.push(self._recording.view(event.start, event.end).copy())
+                        self._pushed = True
+                elif event.kind in (UTTERANCE_END, NO_SPEECH):
+                    if event.kind == UTTERANCE_END and self._speech_ended is None:
+                        # 녹음 시작 → 말이 끝났다고 판단할 때까지
+                        tracing.finish("stt.vad_end", self._capture_started)
+                        self._speech_ended = tracing.start()
+                    if self._on_silence:
+                        # 콜백 호출 (주의: 별도 스레드에서 실행됨)
+                        self._on_silence()
+                        # 중복 호출 방지를 위해 콜백 제거
+                        self._on_silence = None
+
+        import sounddevice as sd
+
+        with tracing.span("stt.capture_start"):
+            self._stream = sd.InputStream(
+                samplerate=self._fs,
+                channels=1,
+                callback=callback,
+            )
+            self._stream.start()
+        self._capture_started = tracing.start()
 
     def stop_stt(self) -> Optional[str]:
         """
-        녹음을 종료하고 Google Web Speech API로 음성을 텍스트로 변환한다.
+        녹음을 종료하고 선택한 STT 엔진으로 음성을 텍스트로 변환한다.
+
+        스트리밍 모드에서는 이미 인식된 구간은 건너뛰고
+        마지막 구간만 인식한 뒤 전체 문장을 반환한다.
         """
         if not self._stream:
             return None
 
+        with tracing.span("stt.stop", engine=self.stt_engine):
+            text = self._stop_and_recognize()
+        # 말이 끝난 순간부터 문장이 나올 때까지 (사용자가 느끼는 인식 지연)
+        tracing.finish("stt.vad_end_to_text", self._speech_ended, engine=self.stt_engine)
+        self._speech_ended = None
+        return text
+
+    def _stop_and_recognize(self) -> Optional[str]:
         self._stream.stop()
         self._stream.close()
         self._stream = None
 
-        if not self._recording:
+        total = self._recording.total
+        transcriber, self._transcriber = self._transcriber, None
+        if transcriber is not None:
+            # 아직 열려 있는 말소리 구간만 보낸다 (앞뒤 무음은 보내지 않음)
+            tail = self._vad.flush(total)
+            if tail is not None:
+                transcriber.push(self._recording.view(*tail).copy())
+            elif not self._pushed:
+                # 말소리를 못 찾았으면 전체를 한 번 보내 본다
+                transcriber.push(self._recording.latest().copy())
+            return transcriber.finish()
+
+        # 첫 말소리 ~ 마지막 말소리만 인식한다.
+        # 기한이 지나도 이미 시작한 인식은 계속 돌므로, 다음 녹음이 덮어쓸 view 대신 복사본을 넘긴다.
+        bounds = self._vad.speech_bounds(total)
+        audio = (self._recording.view(*bounds) if bounds else self._recording.latest()).copy()
+        if not len(audio):
+            return None
+        try:
+            return self._recognize_queued(audio)
+        except (TimeoutError, QueueFull) as e:
+            print(f"STT Error: {e!r}")
             return None
 
-        audio = np.concatenate(self._recording, axis=0)
-        
-        # float32 -> int16 변환 (SpeechRecognition 호환성)
-        audio_int16 = np.int16(audio * 32767)
+    def recognition_stats(self) -> dict:
+        """인식 큐 깊이 / 대기 / 처리 시간 통계"""
+        return self._executor.stats()
+
+    def _recognize_queued(self, audio_int16: np.ndarray) -> Optional[str]:
+        """
+        지금 발화의 인식을 (백그라운드 작업보다 먼저) 큐에 넣고 결과를 기다린다.
+
+        audio_int16은 이후 바뀌지 않는 배열이어야 한다. (링 버퍼 view가 아닌 복사본)
+        """
+        return self._executor.run(self._recognize, audio_int16, priority=INTERACTIVE)
+
+    def _recognize(self, audio_int16: np.ndarray) -> Optional[str]:
+        """
+        int16 PCM 한 덩어리를 인식한다.
+
+        - Google: 임시 WAV 파일을 거치지 않고 PCM 바이트로 AudioData를 바로 만든다.
+        - Whisper: float32로 한 번 변환해 상주 모델에 넘긴다.
+        """
+        with tracing.span("stt.recognize", engine=self.stt_engine):
+            return self._recognize_now(audio_int16)
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            wav.write(f.name, self._fs, audio_int16)
-            wav_path = f.name
-            
+    def _recognize_now(self, audio_int16: np.ndarray) -> Optional[str]:
+        if self._whisper is not None:
+            try:
+                return self._whisper.transcribe(audio_int16, self.language)
+            except Exception as e:
+                print(f"Whisper STT Error: {e}")
+                return None
+
+        import speech_recognition as sr
+
+        if self._recognizer is None:
+            self._recognizer = sr.Recognizer()
+        audio_data = sr.AudioData(audio_int16.tobytes(), self._fs, 2)
         try:
-            with sr.AudioFile(wav_path) as source:
-                audio_data = self._recognizer.record(source)
-                # 한국어 인식 (fallback to English if needed, but fixing to ko-KR as per request)
-                text = self._recognizer.recognize_google(audio_data, language="ko-KR")
-                return text
+            text = self._recognizer.recognize_google(audio_data, language=self.language)
+            return text
         except sr.UnknownValueError:
             print("Google Speech Recognition could not understand audio")
             return None
@@ -119,12 +282,6 @@ class DesktopSpeechBackend(SpeechBackend):
         except Exception as e:
             print(f"STT Error: {e}")
             return None
-        finally:
-            if os.path.exists(wav_path):
-                try:
-                    os.remove(wav_path)
-                except:
-                    pass
 
     # -------------------------
     # TTS
@@ -132,15 +289,29 @@ class DesktopSpeechBackend(SpeechBackend):
 
     def speak(self, text: str, lang: str = "ko", slow: bool = False) -> None:
         """
-        외부 프로세스를 통해 음성을 재생한다. (Edge TTS 사용)
+        상주 TTS 워커로 음성을 재생한다. (Edge TTS 사용)
         lang: 'ko' | 'es'
+
+        재생 중에 다시 호출하면 이전 재생을 끊고 새 문장을 재생한다.
         """
-        import os
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        script_path = os.path.join(script_dir, "tts_play.py")
-        
-        # args: [python, script_path, text, lang, slow]
-        args = [sys.executable, script_path, text, lang]
-        if slow:
-            args.append("slow")
-        subprocess.Popen(args)
+        self._tts.speak(text, lang, slow)
+
+    def prefetch(self, text: str, lang: str = "ko", slow: bool = False) -> None:
+        """번역이 나오자마자 재생될 문장을 미리 합성해 둔다. (이전 prefetch는 취소)"""
+        self._tts.prefetch(text, lang, slow)
+
+    def cancel_prefetch(self) -> None:
+        self._tts.cancel_prefetch()
+
+    def presynthesize(self, texts, lang: str = "ko", slow: bool = False) -> None:
+        """수업 문장 등을 백그라운드에서 미리 합성해 TTS 캐시에 넣는다."""
+        self._tts.presynthesize(texts, lang, slow)
+
+    def stop_speaking(self) -> None:
+        """재생 중인 음성과 대기열을 취소한다."""
+        self._tts.cancel()
+
+    def close(self) -> None:
+        """TTS 워커 프로세스와 인식 워커를 종료한다."""
+        self._tts.close()
+        self._executor.shutdown(wait=False)
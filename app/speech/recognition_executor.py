@@ -0,0 +1,248 @@
+# app/speech/recognition_executor.py
+"""
+RecognitionExecutor
+
+- 음성 인식 작업을 제한된 수의 워커 스레드에서 실행한다.
+- 우선순위 큐: 지금 말한 발화(INTERACTIVE)를 백그라운드 재채점(BACKGROUND)보다 먼저 처리한다.
+  같은 우선순위끼리는 들어온 순서대로 처리한다.
+- 결과는 concurrent.futures.Future로 돌려준다.
+- 타임아웃: 기한이 지난 작업은 시작하지 않고 TimeoutError로 끝낸다.
+  (이미 시작한 작업은 멈추지 않는다. 기한은 대기 시간에만 적용된다)
+- 배압(backpressure): 큐가 가득 차면 더 낮은 우선순위 작업을 밀어내고,
+  밀어낼 것이 없으면 QueueFull을 낸다.
+- 큐 깊이 / 대기 시간 / 처리 시간 통계를 제공한다.
+
+인식 함수는 주입받으므로 이 모듈은 STT 엔진을 모른다.
+"""
+
+from __future__ import annotations
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from app.utils import tracing
+
+INTERACTIVE = 0
+BACKGROUND = 10
+
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_QUEUE = 32
+_HISTORY = 256
+
+
+class QueueFull(RuntimeError):
+    """인식 큐가 가득 차서 작업을 받을 수 없음"""
+
+
+class _Job:
+    __slots__ = ("priority", "seq", "fn", "args", "kwargs", "future", "submitted", "deadline")
+
+    def __init__(self, priority, seq, fn, args, kwargs, deadline) -> None:
+        self.priority = priority
+        self.seq = seq
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future: Future = Future()
+        self.submitted = time.perf_counter()
+        self.deadline = deadline
+
+    def __lt__(self, other: "_Job") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class RecognitionExecutor:
+    """우선순위 / 타임아웃 / 배압이 있는 인식 워커 풀"""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_WORKERS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        default_timeout: Optional[float] = None,
+    ) -> None:
+        """
+        max_workers: 동시에 실행할 인식 수
+        max_queue: 시작을 기다릴 수 있는 최대 작업 수
+        default_timeout: submit에서 timeout을 주지 않았을 때의 기한(초, None이면 없음)
+        """
+        if max_workers <= 0 or max_queue <= 0:
+            raise ValueError("max_workers and max_queue must be positive")
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.default_timeout = default_timeout
+        self._heap: List[_Job] = []
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._shutdown = False
+        self._running = 0
+        self._counts: Dict[str, int] = dict.fromkeys(
+            ("submitted", "completed", "failed", "expired", "rejected", "dropped"), 0
+        )
+        self._max_depth = 0
+        self._wait_ms: Deque[float] = deque(maxlen=_HISTORY)
+        self._run_ms: Deque[float] = deque(maxlen=_HISTORY)
+        self._workers = [
+            threading.Thread(target=self._work, name=f"recognition-{i}", daemon=True)
+            for i in range(max_workers)
+        ]
+        for t in self._workers:
+            t.start()
+
+    # -------------------------
+    # 작업 제출
+    # -------------------------
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        priority: int = INTERACTIVE,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Future:
+        """
+        인식 작업을 큐에 넣고 Future를 반환한다.
+
+        priority: 작을수록 먼저 (INTERACTIVE=0, BACKGROUND=10)
+        timeout: 이 시간(초) 안에 시작하지 못하면 TimeoutError로 끝낸다
+        """
+        timeout = self.default_timeout if timeout is None else timeout
+        deadline = time.perf_counter() + timeout if timeout is not None else None
+        job = _Job(priority, next(self._seq), fn, args, kwargs, deadline)
+
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("RecognitionExecutor is shut down")
+            if len(self._heap) >= self.max_queue and not self._drop_lower(priority):
+                self._counts["rejected"] += 1
+                raise QueueFull(f"recognition queue full ({self.max_queue})")
+            heapq.heappush(self._heap, job)
+            self._counts["submitted"] += 1
+            self._max_depth = max(self._max_depth, len(self._heap))
+            self._cond.notify()
+        return job.future
+
+    def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        priority: int = INTERACTIVE,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        submit() 후 결과를 기다린다.
+
+        timeout은 호출자가 기다리는 시간만 제한한다. 실행을 멈추지는 않는다.
+        - 기한이 지나면 아직 시작하지 않은 작업은 취소하고 TimeoutError를 낸다.
+        - 이미 실행 중인 작업은 끝까지 돌고 결과만 버려진다.
+          그러므로 인자로 넘긴 배열은 호출자가 돌아간 뒤에도 바뀌지 않아야 한다. (복사본을 넘길 것)
+        """
+        future = self.submit(fn, *args, priority=priority, timeout=timeout, **kwargs)
+        timeout = self.default_timeout if timeout is None else timeout
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        """새 작업을 받지 않고, 대기 중인 작업은 취소한다."""
+        with self._cond:
+            self._shutdown = True
+            pending, self._heap = self._heap, []
+            self._cond.notify_all()
+        for job in pending:
+            job.future.cancel()
+        if wait:
+            for t in self._workers:
+                t.join()
+
+    # -------------------------
+    # 통계
+    # -------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        - queue_depth / max_queue_depth: 지금 / 최대 대기 작업 수
+        - running: 실행 중인 작업 수
+        - wait_ms / run_ms: 최근 작업의 큐 대기 / 실행 시간 (p50, p95, max)
+        """
+        with self._cond:
+            stats: Dict[str, Any] = dict(self._counts)
+            stats.update(
+                queue_depth=len(self._heap),
+                max_queue_depth=self._max_depth,
+                running=self._running,
+                workers=self.max_workers,
+                wait_ms=_summary(self._wait_ms),
+                run_ms=_summary(self._run_ms),
+            )
+        return stats
+
+    # -------------------------
+    # 내부
+    # -------------------------
+
+    def _drop_lower(self, priority: int) -> bool:
+        """가장 낮은 우선순위(가장 늦게 들어온) 작업 하나를 밀어낸다. (lock 안에서 호출)"""
+        victim = max(self._heap)
+        if victim.priority <= priority:
+            return False
+        self._heap.remove(victim)
+        heapq.heapify(self._heap)
+        self._counts["dropped"] += 1
+        if not victim.future.cancelled():
+            victim.future.set_exception(QueueFull("dropped for a higher-priority recognition"))
+        return True
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while not self._heap and not self._shutdown:
+                    self._cond.wait()
+                if self._shutdown and not self._heap:
+                    return
+                job = heapq.heappop(self._heap)
+                if job.future.cancelled():
+                    continue  # 기다리던 쪽이 포기한 작업 (run()의 타임아웃)
+                started = time.perf_counter()
+                if job.deadline is not None and started > job.deadline:
+                    self._counts["expired"] += 1
+                    job.future.set_exception(TimeoutError("recognition timed out in queue"))
+                    continue
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                self._running += 1
+                self._wait_ms.append((started - job.submitted) * 1000)
+            tracing.record("stt.queue_wait", started - job.submitted)
+
+            try:
+                result = job.fn(*job.args, **job.kwargs)
+            except BaseException as e:
+                job.future.set_exception(e)
+                ok = False
+            else:
+                job.future.set_result(result)
+                ok = True
+
+            with self._cond:
+                self._running -= 1
+                self._counts["completed" if ok else "failed"] += 1
+                self._run_ms.append((time.perf_counter() - started) * 1000)
+
+
+def _summary(values) -> Dict[str, float]:
+    if not values:
+        return {"count": 0}
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "p50": round(ordered[len(ordered) // 2], 2),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+        "max": round(ordered[-1], 2),
+    }
@@ -9,8 +9,9 @@ SpeechBackend 인터페이스 정의
 """
 
 from __future__ import annotations
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Callable, Dict, Iterable, Optional
 
 
 class SpeechBackend(ABC):
@@ -22,12 +23,21 @@ class SpeechBackend(ABC):
     """
 
     @abstractmethod
-    def start_stt(self) -> None:
+    def start_stt(
+        self,
+        on_silence: Optional[Callable[[], None]] = None,
+        on_partial: Optional[Callable[[str], None]] = None,
+    ) -> None:
         """
         음성 인식을 시작한다.
 
         - Desktop: 마이크 녹음 시작
         - Mobile(Web): SpeechRecognition.start()
+
+        매개변수:
+        - on_silence: 무음이 이어져 자동 종료해야 할 때 호출
+        - on_partial: 중간 인식 결과가 나올 때마다 지금까지의 문장으로 호출
+                      (지원하지 않는 구현은 무시한다)
         """
         raise NotImplementedError
 
@@ -42,6 +52,19 @@ class SpeechBackend(ABC):
         """
         raise NotImplementedError
 
+    async def stop_stt_async(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        stop_stt()를 이벤트 루프를 막지 않고 기다린다.
+
+        - 기본 구현: stop_stt()를 스레드에서 실행 (Desktop: 인식이 끝날 때까지 블로킹)
+        - Web: 브라우저의 최종 결과 이벤트를 기다린다
+        - timeout이 지나면 None
+        """
+        try:
+            return await asyncio.wait_for(asyncio.to_thread(self.stop_stt), timeout)
+        except asyncio.TimeoutError:
+            return None
+
     @abstractmethod
     def speak(self, text: str, slow: bool = False) -> None:
         """
@@ -52,3 +75,53 @@ class SpeechBackend(ABC):
         - slow: 느린 발음 여부
         """
         raise NotImplementedError
+
+    def stop_speaking(self) -> None:
+        """
+        재생 중인 음성을 멈춘다.
+
+        (지원하지 않는 구현은 아무것도 하지 않는다)
+        """
+        return None
+
+    def prefetch(self, text: str, lang: str = "ko", slow: bool = False) -> None:
+        """
+        곧 speak()로 재생할 문장을 미리 준비한다. (재생은 하지 않음)
+
+        (지원하지 않는 구현은 아무것도 하지 않는다)
+        """
+        return None
+
+    def presynthesize(self, texts: Iterable[str], lang: str = "ko", slow: bool = False) -> None:
+        """
+        나중에 재생할 문장들을 백그라운드에서 미리 준비한다. (연습 문장 등)
+
+        prefetch()와 달리 이전 요청을 취소하지 않는다.
+        (지원하지 않는 구현은 아무것도 하지 않는다)
+        """
+        return None
+
+    def cancel_prefetch(self) -> None:
+        """
+        prefetch()로 준비 중인 문장을 취소한다. (문장이 바뀌었을 때)
+
+        (지원하지 않는 구현은 아무것도 하지 않는다)
+        """
+        return None
+
+    def warmup_tasks(self) -> Dict[str, Callable[[], None]]:
+        """
+        앱 시작 후 백그라운드에서 미리 해 둘 초기화 작업을 반환한다.
+
+        - {자원 이름: 초기화 함수} (app.utils.warmup.Warmup에서 실행)
+        - 기본값: 없음
+        """
+        return {}
+
+    def close(self) -> None:
+        """
+        백그라운드 자원(워커 프로세스 / 스레드 등)을 정리한다. (페이지가 닫힐 때)
+
+        (정리할 것이 없는 구현은 아무것도 하지 않는다)
+        """
+        return None
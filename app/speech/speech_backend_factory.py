@@ -5,14 +5,36 @@ SpeechBackendFactory
 
 - 실행 환경에 따라 적절한 SpeechBackend를 생성한다.
 - UI 계층은 이 모듈만 사용한다.
+- 백엔드 모듈은 선택될 때만 import 한다.
+  (Web/Android에서 sounddevice / numpy 등 데스크탑 의존성을 불러오지 않음)
 """
 
+import importlib
+import os
 import sys
-from typing import Any
+from typing import Any, Dict, Tuple, Type
 
 from .speech_backend import SpeechBackend
-from .web_speech_backend import WebSpeechBackend
-from .desktop_speech_backend import DesktopSpeechBackend
+
+# 이름 -> (모듈 경로, 클래스 이름)
+_BACKENDS: Dict[str, Tuple[str, str]] = {
+    "web": ("app.speech.web_speech_backend", "WebSpeechBackend"),
+    "desktop": ("app.speech.desktop_speech_backend", "DesktopSpeechBackend"),
+}
+
+
+def register_backend(name: str, module: str, class_name: str) -> None:
+    """백엔드를 등록한다. (모듈은 create_speech_backend에서 선택될 때 import)"""
+    _BACKENDS[name] = (module, class_name)
+
+
+def load_backend_class(name: str) -> Type[SpeechBackend]:
+    """등록된 백엔드 클래스를 import 해서 반환한다."""
+    try:
+        module_path, class_name = _BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"unknown speech backend: {name}") from None
+    return getattr(importlib.import_module(module_path), class_name)
 
 
 def is_web_runtime() -> bool:
@@ -30,6 +52,17 @@ def is_web_runtime() -> bool:
     return sys.platform == "emscripten"
 
 
+def select_backend(page: Any) -> str:
+    """실행 환경에 맞는 백엔드 이름을 반환한다. ("web" | "desktop")"""
+    # Web (Pyodide) or Mobile (Android/iOS)
+    # page.platform gives "android", "ios", "macos", "linux", "windows" or "web" (if generic)
+    # sys.platform == "emscripten" covers Pyodide web.
+    # We want WebSpeechBackend for Android/iOS as well.
+    if is_web_runtime() or page.platform in ["android", "ios"]:
+        return "web"
+    return "desktop"
+
+
 def create_speech_backend(page: Any) -> SpeechBackend:
     """
     실행 환경에 맞는 SpeechBackend 인스턴스를 반환한다.
@@ -40,13 +73,15 @@ def create_speech_backend(page: Any) -> SpeechBackend:
     반환:
     - SpeechBackend 구현체
     """
+    name = select_backend(page)
+    backend_class = load_backend_class(name)
 
-    # Web (Pyodide) or Mobile (Android/iOS)
-    # page.platform gives "android", "ios", "macos", "linux", "windows" or "web" (if generic)
-    # sys.platform == "emscripten" covers Pyodide web.
-    # We want WebSpeechBackend for Android/iOS as well.
-    if is_web_runtime() or page.platform in ["android", "ios"]:
-        return WebSpeechBackend(page)
+    if name == "web":
+        return backend_class(page)
 
     # Desktop
-    return DesktopSpeechBackend()
+    # TALKLAND_STT_ENGINE=whisper 이면 로컬 Whisper로 인식 (TALKLAND_WHISPER_MODEL로 크기 선택)
+    return backend_class(
+        stt_engine=os.environ.get("TALKLAND_STT_ENGINE", "google"),
+        whisper_model=os.environ.get("TALKLAND_WHISPER_MODEL", "base"),
+    )
@@ -0,0 +1,85 @@
+# app/speech/streaming_stt.py
+"""
+StreamingTranscriber
+
+- 녹음 중에 잘라낸 발화 구간(segment)을 백그라운드 스레드에서 차례로 인식한다.
+- 구간이 인식될 때마다 지금까지의 문장을 on_partial 콜백으로 알린다.
+- 녹음을 멈추면 마지막 구간만 인식하면 되므로
+  종료 후 대기 시간이 녹음 길이와 상관없이 거의 일정하다.
+
+인식 함수(recognize)는 주입받으므로 이 모듈은 STT 엔진을 모른다.
+"""
+
+from __future__ import annotations
+import queue
+import threading
+from typing import Callable, List, Optional
+
+import numpy as np
+
+_STOP = object()
+
+
+class StreamingTranscriber:
+    """
+    발화 구간 단위 백그라운드 인식기.
+
+    - push(): 구간 추가 (오디오 콜백에서 호출해도 되도록 즉시 반환)
+    - finish(): 남은 구간을 모두 인식하고 전체 문장을 반환
+    - cancel(): 결과를 버리고 중단
+    """
+
+    def __init__(
+        self,
+        recognize: Callable[[np.ndarray], Optional[str]],
+        on_partial: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self._recognize = recognize
+        self._on_partial = on_partial
+        self._queue: "queue.Queue[object]" = queue.Queue()
+        self._texts: List[str] = []
+        self._cancelled = False
+        self._thread = threading.Thread(
+            target=self._run, name="streaming-stt", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def text(self) -> str:
+        """지금까지 인식된 문장"""
+        return " ".join(self._texts)
+
+    def push(self, audio: np.ndarray) -> None:
+        """
+        발화 구간 하나를 인식 대기열에 넣는다.
+
+        audio: int16 PCM. 인식이 끝날 때까지 바뀌지 않아야 한다.
+               (녹음 링 버퍼의 view는 다음 녹음이 덮어쓰므로 복사본을 넘긴다)
+        """
+        if len(audio):
+            self._queue.put(audio)
+
+    def finish(self, timeout: Optional[float] = None) -> Optional[str]:
+        """대기 중인 구간을 모두 인식하고 전체 문장을 반환한다. (없으면 None)"""
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        return self.text or None
+
+    def cancel(self) -> None:
+        self._cancelled = True
+        self._queue.put(_STOP)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP or self._cancelled:
+                return
+            try:
+                text = self._recognize(item)  # type: ignore[arg-type]
+            except Exception as e:
+                print(f"Streaming STT Error: {e}")
+                text = None
+            if text and not self._cancelled:
+                self._texts.append(text)
+                if self._on_partial:
+                    self._on_partial(self.text)
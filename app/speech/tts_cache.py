@@ -0,0 +1,249 @@
+# app/speech/tts_cache.py
+"""
+TTS 음성 캐시 (디스크, 내용 주소 기반)
+
+이 모듈은:
+- (문장, 목소리, 속도)의 sha256을 파일 이름으로 합성된 mp3를 보관한다.
+- 같은 문장을 다시 재생할 때 네트워크(Edge TTS)를 거치지 않는다.
+- 전체 크기 상한을 넘으면 가장 오래 안 쓴 파일(mtime 기준)부터 지운다.
+- 파일은 임시 파일(*.part)에 다 쓴 뒤 os.replace로 옮기므로 반쯤 쓴 파일이 보이지 않는다.
+  강제 종료로 남은 임시 파일은 캐시를 열 때 지운다.
+- edge_tts / pygame에 의존하지 않는다. (합성은 호출하는 쪽 책임)
+"""
+
+from __future__ import annotations
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from app.utils.paths import DEFAULT_CACHE_DIR
+
+DEFAULT_TTS_CACHE_DIR = os.path.join(DEFAULT_CACHE_DIR, "tts")
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024  # 200MB
+
+# 상한을 넘으면 이 비율까지 줄여서 put 마다 지우지 않게 한다
+_EVICT_TO = 0.9
+_SUFFIX = ".mp3"
+_PART_SUFFIX = ".part"
+# 이보다 오래된 임시 파일은 쓰던 프로세스가 죽고 남은 것으로 본다
+# (다른 프로세스가 지금 쓰고 있는 파일은 건드리지 않도록 바로 지우지 않는다)
+_STALE_PART_SECONDS = 3600.0
+
+# Voice Selection
+VOICE_MAP = {
+    "ko": "ko-KR-SunHiNeural",
+    "es": "es-ES-AlvaroNeural",
+}
+DEFAULT_VOICE = "ko-KR-SunHiNeural"
+
+
+def voice_for(lang: str) -> str:
+    """언어 코드('ko', 'es', 'ko-KR' 등)에 맞는 Edge TTS 목소리"""
+    return VOICE_MAP.get(lang.split("-")[0].lower(), DEFAULT_VOICE)
+
+
+def rate_for(slow: bool) -> str:
+    # Pitch/Rate adjustment
+    return "-20%" if slow else "+0%"
+
+
+def make_key(text: str, voice: str, rate: str) -> str:
+    """공백을 정리한 문장 + 목소리 + 속도의 sha256 (hex)"""
+    raw = "\0".join((" ".join(text.split()), voice, rate))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class TtsAudioCache:
+    """
+    크기 상한이 있는 mp3 디스크 캐시.
+
+    - 여러 스레드에서 호출해도 안전하다.
+    - 재생 중인 파일을 지우지 못하면(Windows) 건너뛰고 다음에 다시 시도한다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_TTS_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        self._remove_stale_parts()
+        self._bytes = sum(size for _, size, _ in self._entries())
+
+    def path_for(self, text: str, voice: str, rate: str) -> str:
+        return os.path.join(self.cache_dir, make_key(text, voice, rate) + _SUFFIX)
+
+    def get(self, text: str, voice: str, rate: str) -> Optional[str]:
+        """캐시된 mp3 경로를 반환한다. (없으면 None)"""
+        path = self.path_for(text, voice, rate)
+        try:
+            # 최근 사용 시각을 mtime에 기록한다 (LRU)
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return path
+
+    def contains(self, text: str, voice: str, rate: str) -> bool:
+        """통계에 넣지 않고 캐시에 있는지만 확인한다."""
+        return os.path.exists(self.path_for(text, voice, rate))
+
+    def missing(self, texts: Iterable[str], voice: str, rate: str) -> List[str]:
+        """아직 캐시에 없는 문장만 (중복 없이, 순서 유지) 반환한다."""
+        seen = set()
+        result = []
+        for text in texts:
+            if not text.strip() or text in seen:
+                continue
+            seen.add(text)
+            if not self.contains(text, voice, rate):
+                result.append(text)
+        return result
+
+    def put(self, text: str, voice: str, rate: str, data: bytes) -> str:
+        """mp3 바이트를 저장하고 경로를 반환한다."""
+        path = self.path_for(text, voice, rate)
+        fd, tmp = tempfile.mkstemp(suffix=_PART_SUFFIX, dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            self._commit(tmp, path)
+        except BaseException:
+            _remove(tmp)
+            raise
+        return path
+
+    def open_writer(self, text: str, voice: str, rate: str) -> "CacheWriter":
+        """
+        조각 단위로 저장하는 writer를 연다. (스트리밍 합성과 동시에 캐시에 쓸 때)
+
+        commit() 전에는 캐시에 보이지 않고, abort()하면 아무것도 남지 않는다.
+        """
+        return CacheWriter(self, self.path_for(text, voice, rate))
+
+    def clear(self) -> None:
+        with self._lock:
+            for path, _, _ in self._entries():
+                _remove(path)
+            self._bytes = sum(size for _, size, _ in self._entries())
+
+    # -------------------------
+    # 통계
+    # -------------------------
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "bytes": self._bytes,
+            }
+
+    # -------------------------
+    # 내부
+    # -------------------------
+
+    def _commit(self, tmp: str, path: str) -> None:
+        """다 쓴 임시 파일을 캐시 파일로 옮기고 크기 상한을 확인한다."""
+        size = os.path.getsize(tmp)
+        with self._lock:
+            try:
+                old = os.path.getsize(path)
+            except OSError:
+                old = 0
+            os.replace(tmp, path)
+            self._bytes += size - old
+            if self._bytes > self._max_bytes:
+                self._evict(keep=path)
+
+    def _entries(self):
+        """(경로, 크기, mtime) 목록"""
+        result = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(_SUFFIX):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                result.append((entry.path, st.st_size, st.st_mtime))
+        return result
+
+    def _remove_stale_parts(self) -> None:
+        """강제 종료 등으로 남은 오래된 임시 파일을 지운다. (크기 상한에 잡히지 않으므로)"""
+        cutoff = time.time() - _STALE_PART_SECONDS
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(_PART_SUFFIX):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except OSError:
+                    continue  # 이미 지워졌거나 쓰는 중 (Windows)
+
+    def _evict(self, keep: str) -> None:
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        target = self._max_bytes * _EVICT_TO
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue  # 재생 중 등
+            total -= size
+        self._bytes = total
+
+
+class CacheWriter:
+    """TtsAudioCache.open_writer()가 반환하는 임시 파일 writer"""
+
+    def __init__(self, cache: TtsAudioCache, path: str) -> None:
+        self._cache = cache
+        self.path = path
+        fd, self._tmp = tempfile.mkstemp(suffix=_PART_SUFFIX, dir=cache.cache_dir)
+        self._file = os.fdopen(fd, "wb")
+
+    def write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+
+    def commit(self) -> str:
+        """다 쓴 파일을 캐시에 넣고 경로를 반환한다."""
+        self._file.close()
+        try:
+            self._cache._commit(self._tmp, self.path)
+        except BaseException:
+            _remove(self._tmp)
+            raise
+        return self.path
+
+    def abort(self) -> None:
+        """쓰던 파일을 버린다. (합성 실패 / 취소)"""
+        if not self._file.closed:
+            self._file.close()
+        _remove(self._tmp)
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -1,55 +1,464 @@
 # app/speech/tts_play.py
+"""
+Edge TTS 재생 스크립트
+
+- 한 번 재생: python -m app.speech.tts_play <text> [lang] [slow]
+- 상주 워커: python -m app.speech.tts_play --worker
+
+워커 모드는 stdin으로 JSON 한 줄씩 명령을 받고
+pygame mixer를 계속 초기화된 상태로 유지한다.
+(명령/이벤트 형식은 tts_worker.py 참고)
+
+합성된 mp3는 TtsAudioCache(tts_cache.py)에 남겨 두고 다시 재생할 때 쓴다.
+캐시에 없는 문장은 (워커 모드에서) 받는 대로 프레임 단위 구간으로 잘라(tts_stream.py)
+PCM으로 디코딩해 Channel 대기열로 이어 재생하고, 캐시 파일에도 함께 쓴다.
+(--no-stream 이면 다 받은 뒤 재생)
+디코딩 / 대기열 / 재생 끝 확인은 재생 스레드에서 하므로 조각을 받는 이벤트 루프도,
+SDL 오디오 스레드도 막히지 않는다.
+
+stdout은 이벤트 전용이므로 로그는 stderr로만 쓴다.
+"""
+
 import sys
-import asyncio
-import tempfile
 import os
+import io
+import json
+import time
+import queue
+import asyncio
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
 import pygame
 import edge_tts
 
-# Args: [text, lang, slow(optional)]
-text = sys.argv[1]
-lang = sys.argv[2] if len(sys.argv) > 2 else "ko"
-slow = "slow" in sys.argv
+from app.speech.tts_cache import TtsAudioCache, rate_for, voice_for
+from app.speech.tts_stream import Mp3Segment, Mp3Segmenter
+
+# 아직 시작하지 않은 prefetch는 이만큼만 보관한다 (넘치면 오래된 것부터 버림)
+PREFETCH_LIMIT = 4
+
+# 믹서는 Edge TTS 출력 형식(24 kHz 모노)으로 연다. (allowedchanges=0: 장치 형식 변환은 SDL이 한 번에)
+# 구간을 따로 디코딩해도 리샘플링이 끼지 않아 경계가 샘플 단위로 정확히 이어진다.
+MIXER_FREQUENCY = 24000
+MIXER_CHANNELS = 1
+
+# 스트리밍 재생 전용 채널 (set_reserved로 다른 Sound가 쓰지 않게 한다)
+STREAM_CHANNEL = 0
 
-# Voice Selection
-VOICE_MAP = {
-    "ko": "ko-KR-SunHiNeural",
-    "es": "es-ES-AlvaroNeural",
-}
-voice = VOICE_MAP.get(lang, "ko-KR-SunHiNeural")
+# 재생 스레드가 채널 상태를 확인하는 간격(초)
+POLL_SECONDS = 0.01
 
-# Pitch/Rate adjustment
-rate = "-20%" if slow else "+0%"
 
-async def main():
+async def synthesize(text: str, voice: str, rate: str) -> bytes:
+    """Edge TTS로 문장을 합성해 mp3 바이트를 반환한다."""
     communicate = edge_tts.Communicate(text, voice, rate=rate)
-    
-    # Create temp file
-    with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
-        temp_path = f.name
-    
+    chunks = []
+    async for chunk in communicate.stream():
+        if chunk["type"] == "audio":
+            chunks.append(chunk["data"])
+    return b"".join(chunks)
+
+
+async def cached_audio(cache: TtsAudioCache, text: str, lang: str, slow: bool):
+    """
+    캐시된 mp3 경로를 반환한다. 없으면 합성해서 캐시에 넣는다.
+
+    반환값: (경로, 캐시 적중 여부)
+    """
+    voice, rate = voice_for(lang), rate_for(slow)
+    path = cache.get(text, voice, rate)
+    if path is not None:
+        return path, True
+    data = await synthesize(text, voice, rate)
+    return cache.put(text, voice, rate, data), False
+
+
+# -------------------------
+# 한 번 재생 (기존 방식)
+# -------------------------
+
+async def play_once(text: str, lang: str = "ko", slow: bool = False) -> None:
     try:
-        await communicate.save(temp_path)
-        
+        path, _ = await cached_audio(TtsAudioCache(), text, lang, slow)
+
         # Play with pygame
         pygame.mixer.init()
-        pygame.mixer.music.load(temp_path)
+        pygame.mixer.music.load(path)
         pygame.mixer.music.play()
-        
+
         while pygame.mixer.music.get_busy():
             pygame.time.Clock().tick(10)
-            
+
         pygame.mixer.quit()
-        
+
     except Exception as e:
-        print(f"TTS Error: {e}")
-    finally:
-        # Cleanup
-        if os.path.exists(temp_path):
+        print(f"TTS Error: {e}", file=sys.stderr)
+
+
+# -------------------------
+# 상주 워커
+# -------------------------
+
+class TtsWorker:
+    """
+    stdin 명령을 받아 순서대로 재생하는 워커.
+
+    - speak: mode="queue"면 대기열 뒤에 추가, "interrupt"면 지금 것을 끊고 바로 재생
+    - cancel: 재생 중인 것과 대기열을 모두 취소
+    - prefetch: 곧 재생할 것 같은 문장을 먼저 합성해 둠 (replace면 이전 prefetch 취소)
+    - cancel_prefetch: 대기 중 / 진행 중인 prefetch 취소
+    - presynthesize: 문장 목록을 백그라운드에서 미리 합성해 캐시에 넣음 (재생 안 함)
+
+    백그라운드 합성은 한 번에 하나씩, prefetch를 presynthesize보다 먼저 처리한다.
+    재생하려는 문장이 합성 중이면 새로 합성하지 않고 그 결과를 기다린다.
+    - quit: 종료 (stdin이 닫혀도 종료)
+    """
+
+    def __init__(self, streaming: bool = True) -> None:
+        self._streaming = streaming
+        self._queue: "asyncio.Queue[dict]" = asyncio.Queue()
+        self._current: "asyncio.Task | None" = None
+        self._cache = TtsAudioCache()
+        self._prefetch: deque = deque(maxlen=PREFETCH_LIMIT)
+        self._presynth: deque = deque()
+        self._background: "asyncio.Task | None" = None
+        # 합성 중인 캐시 경로 -> (작업, prefetch 여부)
+        self._inflight: dict = {}
+        # 재생이 기다리고 있어서 취소하면 안 되는 합성
+        self._claimed: set = set()
+
+    def emit(self, event: str, **fields) -> None:
+        fields["event"] = event
+        sys.stdout.write(json.dumps(fields) + "\n")
+        sys.stdout.flush()
+
+    async def run(self) -> None:
+        pygame.mixer.init(frequency=MIXER_FREQUENCY, channels=MIXER_CHANNELS, allowedchanges=0)
+        pygame.mixer.set_reserved(STREAM_CHANNEL + 1)
+        loop = asyncio.get_running_loop()
+        commands: "asyncio.Queue[dict | None]" = asyncio.Queue()
+
+        # stdin은 스레드에서 읽는다 (Windows 파이프는 asyncio로 읽을 수 없음)
+        def read_stdin() -> None:
+            for line in sys.stdin:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    cmd = json.loads(line)
+                except ValueError:
+                    print(f"TTS worker: bad command {line!r}", file=sys.stderr)
+                    continue
+                cmd["_received"] = time.perf_counter()
+                loop.call_soon_threadsafe(commands.put_nowait, cmd)
+            loop.call_soon_threadsafe(commands.put_nowait, None)
+
+        threading.Thread(target=read_stdin, name="tts-stdin", daemon=True).start()
+        player = asyncio.create_task(self._player())
+        self.emit("ready")
+
+        try:
+            while True:
+                cmd = await commands.get()
+                if cmd is None or cmd.get("cmd") == "quit":
+                    break
+                self.handle(cmd)
+        finally:
+            self.cancel_all()
+            player.cancel()
+            if self._background is not None:
+                self._background.cancel()
+            pygame.mixer.quit()
+
+    def handle(self, cmd: dict) -> None:
+        kind = cmd.get("cmd")
+        if kind == "speak":
+            if cmd.get("mode") == "interrupt":
+                self.cancel_all()
+            self._queue.put_nowait(cmd)
+        elif kind == "cancel":
+            self.cancel_all()
+        elif kind == "prefetch":
+            if cmd.get("replace", True):
+                self.cancel_prefetch()
+            self._prefetch.append(
+                (cmd.get("text", ""), cmd.get("lang", "ko"), bool(cmd.get("slow")))
+            )
+            self._wake_background()
+        elif kind == "cancel_prefetch":
+            self.cancel_prefetch()
+        elif kind == "presynthesize":
+            lang, slow = cmd.get("lang", "ko"), bool(cmd.get("slow"))
+            self._presynth.extend((text, lang, slow) for text in cmd.get("texts", ()))
+            self._wake_background()
+        else:
+            print(f"TTS worker: unknown command {kind!r}", file=sys.stderr)
+
+    def cancel_all(self) -> None:
+        while not self._queue.empty():
+            cmd = self._queue.get_nowait()
+            self.emit("cancelled", id=cmd.get("id"))
+        if self._current is not None and not self._current.done():
+            self._current.cancel()
+        pygame.mixer.music.stop()
+
+    def cancel_prefetch(self) -> None:
+        """prefetch 대기열을 비우고, 재생이 기다리지 않는 진행 중 prefetch를 취소한다."""
+        self._prefetch.clear()
+        for path, (task, prefetch) in list(self._inflight.items()):
+            if prefetch and path not in self._claimed and not task.done():
+                task.cancel()
+
+    async def _player(self) -> None:
+        while True:
+            cmd = await self._queue.get()
+            self._current = asyncio.create_task(self._speak(cmd))
+            try:
+                await self._current
+            except asyncio.CancelledError:
+                if not self._current.cancelled():
+                    raise  # 워커 종료
+                self.emit("cancelled", id=cmd.get("id"))
+            except Exception as e:
+                self.emit("error", id=cmd.get("id"), message=str(e))
+            else:
+                self.emit("done", id=cmd.get("id"))
+            finally:
+                self._current = None
+
+    async def _speak(self, cmd: dict) -> None:
+        received = cmd["_received"]
+        started = time.perf_counter()
+        text, lang, slow = cmd.get("text", ""), cmd.get("lang", "ko"), bool(cmd.get("slow"))
+        voice, rate = voice_for(lang), rate_for(slow)
+        feed = player = playing = None
+        stopped = threading.Event()
+        try:
+            await self._join_inflight(self._cache.path_for(text, voice, rate))
+            path = self._cache.get(text, voice, rate)
+            cached = path is not None
+            if cached or not self._streaming:
+                if not cached:
+                    path = self._cache.put(text, voice, rate, await synthesize(text, voice, rate))
+                synth_done = time.perf_counter()
+                pygame.mixer.music.load(path)
+                pygame.mixer.music.play()
+            else:
+                loop = asyncio.get_running_loop()
+                audible = asyncio.Event()
+                player = StreamPlayer(on_start=lambda: loop.call_soon_threadsafe(audible.set))
+                playing = asyncio.ensure_future(asyncio.to_thread(player.join))
+                feed = asyncio.create_task(self._feed(text, voice, rate, player))
+                # 첫 구간이 소리 나기 시작하거나, 합성이 (실패 / 짧은 문장으로) 먼저 끝날 때까지
+                waiter = asyncio.ensure_future(audible.wait())
+                try:
+                    await asyncio.wait({feed, waiter}, return_when=asyncio.FIRST_COMPLETED)
+                    if not audible.is_set():
+                        await feed  # 예외를 그대로 올린다
+                        await asyncio.wait({waiter, playing}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    waiter.cancel()
+                if not audible.is_set():
+                    raise player.error or RuntimeError("no audio received")
+                synth_done = player.first_chunk_at or time.perf_counter()
+
+            now = time.perf_counter()
+            self.emit(
+                "first_audio",
+                id=cmd.get("id"),
+                cached=cached,
+                streamed=player is not None,
+                first_audio_ms=round((now - received) * 1000, 1),
+                queued_ms=round((started - received) * 1000, 1),
+                synth_ms=round((synth_done - started) * 1000, 1),
+            )
+            # 재생이 끝나기를 기다리는 것도 스레드에서 (이벤트 루프에서 믹서를 폴링하지 않는다)
+            if player is None:
+                await asyncio.to_thread(_wait_music, stopped)
+            else:
+                await feed
+                await asyncio.shield(playing)
+        finally:
+            stopped.set()
+            if feed is not None and not feed.done():
+                feed.cancel()
+            if player is not None:
+                player.stop()
+                # 채널을 멈추고 재생 스레드가 끝난 뒤에 다음 문장으로 넘어간다
+                await asyncio.wait({playing})
+            pygame.mixer.music.stop()
+            # 캐시 파일을 잡고 있지 않도록 놓아 준다
+            pygame.mixer.music.unload()
+
+    async def _feed(self, text: str, voice: str, rate: str, player: "StreamPlayer") -> None:
+        """Edge TTS 조각을 재생 스레드와 캐시 파일에 동시에 넘긴다."""
+        writer = self._cache.open_writer(text, voice, rate)
+        try:
+            communicate = edge_tts.Communicate(text, voice, rate=rate)
+            async for chunk in communicate.stream():
+                if chunk["type"] != "audio":
+                    continue
+                player.feed(chunk["data"])
+                writer.write(chunk["data"])
+            player.finish()
+            if player.first_chunk_at is not None:
+                writer.commit()
+            else:
+                writer.abort()
+        except BaseException:
+            # 중간에 끊긴 음성은 캐시에 남기지 않는다 (받은 데까지는 재생)
+            player.finish()
+            writer.abort()
+            raise
+
+    async def _join_inflight(self, path: str) -> None:
+        """이 문장을 백그라운드에서 합성 중이면 끝날 때까지 기다린다."""
+        entry = self._inflight.get(path)
+        if entry is None:
+            return
+        task = entry[0]
+        self._claimed.add(path)
+        try:
+            # 재생이 취소돼도 합성은 끝까지 해서 캐시에 남긴다
+            await asyncio.wait({task})
+        finally:
+            self._claimed.discard(path)
+
+    def _wake_background(self) -> None:
+        if self._background is None or self._background.done():
+            self._background = asyncio.create_task(self._synthesize_background())
+
+    async def _synthesize_background(self) -> None:
+        done = 0
+        while self._prefetch or self._presynth:
+            prefetch = bool(self._prefetch)
+            text, lang, slow = (self._prefetch if prefetch else self._presynth).popleft()
+            voice, rate = voice_for(lang), rate_for(slow)
+            if not text.strip() or self._cache.contains(text, voice, rate):
+                continue
+            path = self._cache.path_for(text, voice, rate)
+            task = asyncio.create_task(self._synthesize_to_cache(text, voice, rate))
+            self._inflight[path] = (task, prefetch)
             try:
-                os.remove(temp_path)
-            except:
+                await asyncio.wait({task})
+            finally:
+                del self._inflight[path]
+            if task.cancelled():
+                continue
+            if task.exception() is not None:
+                print(f"TTS background synthesis failed: {task.exception()}", file=sys.stderr)
+                continue
+            if prefetch:
+                self.emit("prefetched", text=text)
+            else:
+                done += 1
+        if done:
+            self.emit("presynthesized", count=done, cache=self._cache.stats())
+
+    async def _synthesize_to_cache(self, text: str, voice: str, rate: str) -> None:
+        self._cache.put(text, voice, rate, await synthesize(text, voice, rate))
+
+
+class StreamPlayer:
+    """
+    합성 중인 mp3를 받는 대로 재생한다. (워커의 스트리밍 재생)
+
+    - feed() / finish(): 이벤트 루프에서 호출. 프레임 단위로 잘라 구간을 넘기기만 한다.
+    - 재생 스레드: 구간을 PCM Sound로 디코딩해 STREAM_CHANNEL 대기열(한 칸)에 이어 넣고,
+      마지막 구간이 끝날 때까지 채널을 확인한다.
+      디코더가 데이터를 기다리는 일이 없으므로 SDL 오디오 스레드가 막히지 않는다.
+    - on_start: 첫 구간이 재생되기 시작하면 재생 스레드에서 호출된다.
+    - stop(): 채널을 멈추고 스레드를 끝낸다.
+    """
+
+    def __init__(self, on_start: Optional[Callable[[], None]] = None) -> None:
+        self._segmenter = Mp3Segmenter()
+        self._segments: "queue.Queue[Optional[Mp3Segment]]" = queue.Queue()
+        self._stopped = threading.Event()
+        self._on_start = on_start
+        self.first_chunk_at: Optional[float] = None
+        self.error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="tts-stream", daemon=True)
+        self._thread.start()
+
+    def feed(self, chunk: bytes) -> None:
+        if self.first_chunk_at is None:
+            self.first_chunk_at = time.perf_counter()
+        for segment in self._segmenter.feed(chunk):
+            self._segments.put(segment)
+
+    def finish(self) -> None:
+        for segment in self._segmenter.finish():
+            self._segments.put(segment)
+        self._segments.put(None)
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._segments.put(None)
+
+    def join(self) -> None:
+        self._thread.join()
+
+    def _run(self) -> None:
+        channel = pygame.mixer.Channel(STREAM_CHANNEL)
+        started = False
+        try:
+            while not self._stopped.is_set():
+                segment = self._segments.get()
+                if segment is None:
+                    break
+                sound = _decode_segment(segment)
+                # 대기열은 한 칸뿐이므로 비면 넣는다 (채널이 놀고 있으면 queue가 바로 재생)
+                while channel.get_queue() is not None and not self._stopped.wait(POLL_SECONDS):
+                    pass
+                if self._stopped.is_set():
+                    break
+                channel.queue(sound)
+                if not started:
+                    started = True
+                    if self._on_start:
+                        self._on_start()
+            while channel.get_busy() and not self._stopped.wait(POLL_SECONDS):
                 pass
+        except Exception as e:
+            self.error = e
+            print(f"TTS stream playback error: {e}", file=sys.stderr)
+        finally:
+            channel.stop()
+
+
+def _decode_segment(segment: Mp3Segment) -> "pygame.mixer.Sound":
+    """mp3 구간을 믹서 형식의 PCM Sound로 디코딩하고 겹침 프레임 몫을 잘라 낸다."""
+    sound = pygame.mixer.Sound(file=io.BytesIO(segment.data))
+    if not segment.skip_samples:
+        return sound
+    frequency, fmt, channels = pygame.mixer.get_init()
+    frame_bytes = abs(fmt) // 8 * channels
+    skip = round(segment.skip_samples * frequency / segment.sample_rate) * frame_bytes
+    return pygame.mixer.Sound(buffer=sound.get_raw()[skip:])
+
+
+def _wait_music(stopped: threading.Event) -> None:
+    """music 재생이 끝나거나 stopped가 set될 때까지 기다린다. (스레드에서 실행)"""
+    while pygame.mixer.music.get_busy() and not stopped.wait(POLL_SECONDS * 2):
+        pass
+
+
+def main(argv) -> None:
+    if argv and argv[0] == "--worker":
+        asyncio.run(TtsWorker(streaming="--no-stream" not in argv).run())
+        return
+
+    # Args: [text, lang, slow(optional)]
+    text = argv[0]
+    lang = argv[1] if len(argv) > 1 else "ko"
+    slow = "slow" in argv
+    asyncio.run(play_once(text, lang, slow))
+
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main(sys.argv[1:])
@@ -0,0 +1,159 @@
+# app/speech/tts_stream.py
+"""
+Mp3Segmenter
+
+- 합성 중인 mp3 조각을 받는 대로 MPEG 프레임 단위로 잘라,
+  그 자체로 디코딩할 수 있는 완전한 구간(Mp3Segment)으로 만든다.
+- 재생하는 쪽(tts_play.StreamPlayer)은 구간을 하나씩 PCM으로 디코딩해
+  pygame Channel 대기열에 넣는다. 디코더가 아직 오지 않은 데이터를 기다리는 일이 없으므로
+  오디오 스레드가 막히지 않는다.
+- 첫 구간은 FIRST_FRAMES 프레임만 모이면 바로 내보낸다. (첫 소리까지의 지연)
+  이후 구간은 두 배씩 키워 MAX_FRAMES까지. (디코딩 / 대기열 호출 횟수를 줄임)
+- mp3(Layer III)는 앞 프레임의 비트(bit reservoir)와 MDCT 겹침을 쓰므로,
+  두 번째 구간부터는 앞 구간의 마지막 OVERLAP_FRAMES 프레임을 앞에 붙여 디코딩하고
+  그만큼의 샘플(skip_samples)을 버린다. 그래서 구간 경계에서 소리가 끊기지 않는다.
+
+pygame / edge_tts에 의존하지 않는다.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+FIRST_FRAMES = 8      # Edge TTS (24 kHz, 576 샘플/프레임) 기준 약 0.2초
+MAX_FRAMES = 64       # 약 1.5초
+OVERLAP_FRAMES = 4    # 48 kbps 프레임(144 바이트) 4개 > bit reservoir 최대 511 바이트
+
+# Layer III 비트레이트 (kbps): MPEG-1 / MPEG-2·2.5
+_BITRATES = {
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_BITRATES[0] = _BITRATES[2]
+# 버전 비트 -> 샘플레이트 (3: MPEG-1, 2: MPEG-2, 0: MPEG-2.5)
+_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def parse_frame_header(header: bytes) -> Optional[Tuple[int, int, int]]:
+    """
+    MPEG 오디오 프레임 헤더(4바이트)를 읽는다. (Layer III만)
+
+    반환값: (프레임 길이(바이트), 샘플레이트, 프레임당 샘플 수), 헤더가 아니면 None
+    """
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = (header[1] >> 3) & 3
+    layer = (header[1] >> 1) & 3
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 3
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    padding = (header[2] >> 1) & 1
+    bitrate = _BITRATES[version][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    if version == 3:
+        return 144 * bitrate // sample_rate + padding, sample_rate, 1152
+    return 72 * bitrate // sample_rate + padding, sample_rate, 576
+
+
+def _is_info_frame(frame: bytes) -> bool:
+    """Xing / Info (VBR 정보) 프레임인지. 태그는 side info 바로 뒤(9 / 17 / 32바이트)에 있다."""
+    return any(frame[4 + side : 8 + side] in (b"Xing", b"Info") for side in (9, 17, 32))
+
+
+@dataclass(frozen=True)
+class Mp3Segment:
+    """혼자 디코딩할 수 있는 mp3 구간"""
+
+    data: bytes           # 완전한 프레임들 (앞에 겹침 프레임 포함)
+    sample_rate: int
+    skip_samples: int     # 디코딩한 PCM 앞에서 버릴 샘플 수 (겹침 프레임 몫)
+    samples: int          # 이 구간이 새로 내는 샘플 수
+
+
+class Mp3Segmenter:
+    """
+    mp3 바이트 조각 → Mp3Segment 목록.
+
+    - feed(): 받은 조각을 넣고, 내보낼 수 있게 된 구간을 반환한다.
+    - finish(): 남은 프레임을 마지막 구간으로 반환한다.
+    - 맨 앞의 ID3v2 태그와 Xing/Info(VBR 정보) 프레임은 건너뛴다.
+    """
+
+    def __init__(
+        self,
+        first_frames: int = FIRST_FRAMES,
+        max_frames: int = MAX_FRAMES,
+        overlap_frames: int = OVERLAP_FRAMES,
+    ) -> None:
+        self._buffer = bytearray()
+        self._frames: List[bytes] = []       # 아직 내보내지 않은 프레임
+        self._tail: List[bytes] = []         # 앞 구간의 마지막 프레임들 (겹침용)
+        self._target = first_frames
+        self._max_frames = max_frames
+        self._overlap = overlap_frames
+        self._sample_rate = 0
+        self._frame_samples = 0
+        self._started = False                # ID3 / 첫 프레임 검사를 마쳤는지
+        self.frames = 0                      # 지금까지 자른 프레임 수
+
+    def feed(self, chunk: bytes) -> List[Mp3Segment]:
+        self._buffer += chunk
+        self._split()
+        segments = []
+        while len(self._frames) >= self._target:
+            segments.append(self._emit(self._target))
+            self._target = min(self._target * 2, self._max_frames)
+        return segments
+
+    def finish(self) -> List[Mp3Segment]:
+        """스트림 끝. (끝에 남은 불완전한 프레임은 버린다)"""
+        self._split()
+        self._buffer.clear()
+        return [self._emit(len(self._frames))] if self._frames else []
+
+    # -------------------------
+    # 내부
+    # -------------------------
+
+    def _split(self) -> None:
+        buf = self._buffer
+        pos = 0
+        if not self._started:
+            if len(buf) < 10:
+                return
+            if buf[:3] == b"ID3":
+                size = (buf[6] << 21) | (buf[7] << 14) | (buf[8] << 7) | buf[9]
+                pos = 10 + size + (10 if buf[5] & 0x10 else 0)
+                if len(buf) < pos:
+                    return
+        while len(buf) - pos >= 4:
+            info = parse_frame_header(bytes(buf[pos : pos + 4]))
+            if info is None:
+                pos += 1  # 동기를 잃었으면 다음 헤더를 찾는다
+                continue
+            length, sample_rate, frame_samples = info
+            if len(buf) - pos < length:
+                break
+            frame = bytes(buf[pos : pos + length])
+            pos += length
+            if not self._started:
+                self._started = True
+                if _is_info_frame(frame):
+                    continue  # 소리 없는 정보 프레임
+            self._sample_rate = sample_rate
+            self._frame_samples = frame_samples
+            self._frames.append(frame)
+            self.frames += 1
+        del buf[:pos]
+
+    def _emit(self, count: int) -> Mp3Segment:
+        frames, self._frames = self._frames[:count], self._frames[count:]
+        overlap = self._tail
+        self._tail = (overlap + frames)[-self._overlap :] if self._overlap else []
+        return Mp3Segment(
+            data=b"".join(overlap + frames),
+            sample_rate=self._sample_rate,
+            skip_samples=len(overlap) * self._frame_samples,
+            samples=len(frames) * self._frame_samples,
+        )
@@ -0,0 +1,266 @@
+# app/speech/tts_worker.py
+"""
+TtsWorkerClient
+
+- tts_play.py를 워커 모드(--worker)로 한 번만 띄워 두고 파이프로 명령을 보낸다.
+- 재생할 때마다 파이썬 인터프리터 / pygame / edge_tts를 새로 띄우지 않는다.
+- 워커가 죽어 있으면 다음 명령 때 다시 띄운다.
+
+명령 (stdin, JSON 한 줄):
+- {"cmd": "speak", "id": n, "text": ..., "lang": ..., "slow": bool,
+   "mode": "queue" | "interrupt"}
+- {"cmd": "cancel"}
+- {"cmd": "prefetch", "text": ..., "lang": ..., "slow": bool, "replace": bool}
+- {"cmd": "cancel_prefetch"}
+- {"cmd": "presynthesize", "texts": [...], "lang": ..., "slow": bool}
+- {"cmd": "quit"}
+
+이벤트 (stdout, JSON 한 줄):
+- ready / first_audio(cached / streamed 포함) / done / cancelled / error / prefetched / presynthesized
+"""
+
+from __future__ import annotations
+import itertools
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, Optional
+
+from app.utils import tracing
+
+# app/speech/tts_worker.py -> 프로젝트 루트
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+QUEUE = "queue"
+INTERRUPT = "interrupt"
+
+
+class TtsWorkerClient:
+    """상주 TTS 워커 프로세스 클라이언트 (스레드 안전)"""
+
+    def __init__(
+        self,
+        python: str = sys.executable,
+        on_event: Optional[Callable[[dict], None]] = None,
+        history: int = 100,
+    ) -> None:
+        """
+        python: 워커를 실행할 인터프리터
+        on_event: 워커 이벤트를 받을 콜백 (읽기 스레드에서 호출)
+        history: 보관할 time-to-first-audio 측정값 수
+        """
+        self._python = python
+        self._on_event = on_event
+        self._proc: Optional[subprocess.Popen] = None
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._sent: Dict[int, float] = {}
+        self._first_audio: Deque[float] = deque(maxlen=history)
+        self._worker_first_audio: Deque[float] = deque(maxlen=history)
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    # -------------------------
+    # 명령
+    # -------------------------
+
+    def speak(
+        self, text: str, lang: str = "ko", slow: bool = False, mode: str = INTERRUPT
+    ) -> int:
+        """
+        문장을 재생한다. 요청 id를 반환한다.
+
+        mode: "interrupt"(기본) = 지금 재생 중인 것을 끊고 바로 재생
+              "queue" = 대기열 뒤에 추가
+        """
+        req_id = next(self._ids)
+        with self._lock:
+            self._sent[req_id] = time.perf_counter()
+        self._send(
+            {"cmd": "speak", "id": req_id, "text": text, "lang": lang,
+             "slow": slow, "mode": mode}
+        )
+        return req_id
+
+    def cancel(self) -> None:
+        """재생 중인 것과 대기열을 모두 취소한다."""
+        if self.running:
+            self._send({"cmd": "cancel"})
+
+    def prefetch(
+        self, text: str, lang: str = "ko", slow: bool = False, replace: bool = True
+    ) -> None:
+        """
+        곧 재생할 것 같은 문장을 미리 합성해 둔다. (재생은 하지 않음)
+
+        replace: 이전 prefetch를 취소하고 이 문장으로 바꾼다
+        """
+        if text and text.strip():
+            self._send(
+                {"cmd": "prefetch", "text": text, "lang": lang, "slow": slow,
+                 "replace": replace}
+            )
+
+    def cancel_prefetch(self) -> None:
+        """대기 중 / 진행 중인 prefetch를 취소한다. (재생 요청이 기다리는 것은 제외)"""
+        if self.running:
+            self._send({"cmd": "cancel_prefetch"})
+
+    def presynthesize(self, texts: Iterable[str], lang: str = "ko", slow: bool = False) -> None:
+        """문장 목록(수업 문장 등)을 워커가 백그라운드에서 미리 합성해 캐시에 넣게 한다."""
+        texts = [t for t in texts if t and t.strip()]
+        if texts:
+            self._send({"cmd": "presynthesize", "texts": texts, "lang": lang, "slow": slow})
+
+    def close(self, timeout: float = 2.0) -> None:
+        """워커를 종료한다."""
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.write(json.dumps({"cmd": "quit"}) + "\n")
+            proc.stdin.flush()
+            proc.stdin.close()
+            proc.wait(timeout)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            proc.kill()
+
+    @property
+    def running(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def start(self) -> None:
+        """워커를 미리 띄운다. (이미 떠 있으면 아무것도 하지 않음)"""
+        with self._lock:
+            self._ensure_started()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """워커를 띄우고 mixer 초기화까지 끝날(ready 이벤트) 때까지 기다린다."""
+        self.start()
+        return self._ready.wait(timeout)
+
+    # -------------------------
+    # 측정값
+    # -------------------------
+
+    def stats(self) -> dict:
+        """
+        time-to-first-audio 통계 (ms)
+
+        - first_audio_*: speak() 호출 ~ 재생 시작 (파이프 왕복 포함)
+        - worker_*: 워커가 명령을 받은 뒤 ~ 재생 시작
+        - cache_hit_rate: 재생 요청 중 음성 캐시에서 바로 재생한 비율
+        """
+        def summary(values) -> dict:
+            if not values:
+                return {"count": 0}
+            ordered = sorted(values)
+            return {
+                "count": len(ordered),
+                "last": values[-1],
+                "avg": round(sum(ordered) / len(ordered), 1),
+                "p50": ordered[len(ordered) // 2],
+                "max": ordered[-1],
+            }
+
+        played = self.cache_hits + self.cache_misses
+        return {
+            "first_audio_ms": summary(list(self._first_audio)),
+            "worker_ms": summary(list(self._worker_first_audio)),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_rate": self.cache_hits / played if played else 0.0,
+        }
+
+    # -------------------------
+    # 내부
+    # -------------------------
+
+    def _send(self, cmd: dict) -> None:
+        line = json.dumps(cmd) + "\n"
+        with self._lock:
+            for attempt in range(2):
+                proc = self._ensure_started()
+                try:
+                    proc.stdin.write(line)
+                    proc.stdin.flush()
+                    return
+                except (OSError, ValueError):
+                    # 워커가 죽었으면 한 번만 다시 띄운다
+                    self._proc = None
+                    if attempt:
+                        raise
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+
+        self._ready.clear()
+        env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+        proc = subprocess.Popen(
+            [self._python, "-m", "app.speech.tts_play", "--worker"],
+            cwd=_PROJECT_ROOT,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        self._proc = proc
+        threading.Thread(
+            target=self._read_events, args=(proc,), name="tts-worker-events", daemon=True
+        ).start()
+        return proc
+
+    def _read_events(self, proc: subprocess.Popen) -> None:
+        for line in proc.stdout:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue  # 이벤트가 아닌 출력은 무시
+            self._record(event)
+            if self._on_event:
+                try:
+                    self._on_event(event)
+                except Exception as e:
+                    print(f"TTS event callback error: {e}")
+
+    def _record(self, event: dict) -> None:
+        kind = event.get("event")
+        req_id = event.get("id")
+        if kind == "ready":
+            self._ready.set()
+        elif kind == "first_audio":
+            with self._lock:
+                sent = self._sent.pop(req_id, None)
+            cached = bool(event.get("cached"))
+            if sent is not None:
+                seconds = time.perf_counter() - sent
+                self._first_audio.append(round(seconds * 1000, 1))
+                tracing.record("tts.first_audio", seconds, cached=cached)
+            if "first_audio_ms" in event:
+                self._worker_first_audio.append(event["first_audio_ms"])
+                # 워커 프로세스 안의 시간은 이벤트로 받아 여기서 기록한다
+                tracing.record("tts.worker_first_audio", event["first_audio_ms"] / 1000, cached=cached)
+            if "synth_ms" in event:
+                # 스트리밍 재생이면 합성 전체가 아니라 첫 조각까지의 시간이다
+                name = "tts.first_chunk" if event.get("streamed") else "tts.synth"
+                tracing.record(name, event["synth_ms"] / 1000, cached=cached)
+            if "queued_ms" in event:
+                tracing.record("tts.worker_queue", event["queued_ms"] / 1000)
+            if cached:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+        elif kind in ("done", "cancelled", "error"):
+            with self._lock:
+                self._sent.pop(req_id, None)
+            if kind == "error":
+                print(f"TTS Error: {event.get('message')}")
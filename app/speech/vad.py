@@ -0,0 +1,220 @@
+# app/speech/vad.py
+"""
+VoiceActivityDetector (에너지 기반 VAD)
+
+- 오디오 블록을 20ms 프레임으로 나눠 프레임 에너지(RMS)를 한 번에(벡터로) 계산한다.
+- 잡음 바닥(noise floor)을 최근 noise_window 초 동안의 최소 프레임 에너지로
+  계속 추정해서 마이크/교실마다 임계값을 따로 맞출 필요가 없다.
+- 시작 임계값과 유지 임계값을 다르게 두어(hysteresis) 말 중간에 끊기지 않는다.
+- 시간은 time.time()이 아니라 누적 샘플 수로 잰다.
+
+이벤트(process 반환값):
+- VadEvent("segment", start, end): 말소리 구간 하나가 끝남 (앞뒤 여유 포함)
+- VadEvent("utterance_end", pos, pos): 말이 끝나고 end_timeout 동안 조용함
+- VadEvent("no_speech", pos, pos): no_speech_timeout 동안 말이 전혀 없음
+
+위치는 모두 reset 이후 누적 샘플 수(절대 위치)이다.
+"""
+
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+SEGMENT = "segment"
+UTTERANCE_END = "utterance_end"
+NO_SPEECH = "no_speech"
+
+_NOISE_MIN = 1e-4
+# 잡음 창을 이만큼의 조각으로 나눠 조각별 최소값만 보관한다
+_NOISE_SLOTS = 8
+
+
+class VadEvent(NamedTuple):
+    kind: str
+    start: int
+    end: int
+
+
+@dataclass
+class VadConfig:
+    """VAD 설정 (시간 단위: 초)"""
+
+    sample_rate: int = 16000
+    frame_ms: int = 20
+    start_ratio: float = 3.0  # 잡음 바닥 대비 말 시작 임계값 배수
+    stop_ratio: float = 1.8  # 잡음 바닥 대비 말 유지 임계값 배수
+    min_threshold: float = 0.005  # 아주 조용한 방에서도 이 RMS 아래는 무음
+    onset_frames: int = 3  # 이만큼 연속으로 넘어야 말 시작으로 본다
+    hangover: float = 0.3  # 이 시간 이상 쉬면 구간을 자른다
+    end_timeout: float = 1.0  # 말이 끝나고 이 시간 동안 조용하면 발화 종료
+    no_speech_timeout: float = 10.0  # 이 시간 동안 말이 없으면 종료
+    pad: float = 0.15  # 구간 앞뒤에 남길 여유
+    noise_window: float = 2.0  # 잡음 바닥 = 이 시간 동안의 최소 프레임 RMS
+    use_zcr: bool = False  # 영교차율로 치찰음성 잡음 걸러내기
+    zcr_max: float = 0.35
+
+
+class VoiceActivityDetector:
+    """프레임 단위 에너지 VAD (단일 스트림, 스레드 하나에서 사용)"""
+
+    def __init__(self, config: Optional[VadConfig] = None) -> None:
+        self.config = config or VadConfig()
+        c = self.config
+        self._frame = max(1, c.sample_rate * c.frame_ms // 1000)
+        self._hangover = int(c.hangover * c.sample_rate)
+        self._end_timeout = int(c.end_timeout * c.sample_rate)
+        self._no_speech = int(c.no_speech_timeout * c.sample_rate)
+        self._pad = int(c.pad * c.sample_rate)
+        window_frames = max(1, int(c.noise_window * 1000 / c.frame_ms))
+        self._slot_frames = max(1, window_frames // _NOISE_SLOTS)
+        self._carry = np.zeros(self._frame, dtype=np.float32)
+        self.reset()
+
+    def reset(self) -> None:
+        self.pos = 0  # 처리한 샘플 수
+        self.noise = _NOISE_MIN
+        self._slots: deque = deque(maxlen=_NOISE_SLOTS)
+        self._slot_min = float("inf")
+        self._slot_count = 0
+        self.in_speech = False
+        self.had_speech = False
+        self.first_start: Optional[int] = None
+        self.last_end: Optional[int] = None
+        self._carry_n = 0
+        self._onset = 0
+        self._seg_start = 0
+        self._voice_end = 0
+        self._ended = False
+
+    # -------------------------
+    # 처리
+    # -------------------------
+
+    def process(self, block: np.ndarray) -> List[VadEvent]:
+        """float32 블록 하나를 처리하고 발생한 이벤트를 반환한다."""
+        x = block.reshape(-1)
+        F = self._frame
+        events: List[VadEvent] = []
+
+        i = 0
+        if self._carry_n:
+            # 이전 블록에서 남은 반쪽 프레임을 채운다
+            need = min(F - self._carry_n, len(x))
+            self._carry[self._carry_n : self._carry_n + need] = x[:need]
+            self._carry_n += need
+            i = need
+            if self._carry_n == F:
+                rms, zcr = self._features(self._carry[None, :])
+                self._carry_n = 0
+                self._step(float(rms[0]), float(zcr[0]) if zcr is not None else 0.0, events)
+
+        full = (len(x) - i) // F
+        if full:
+            frames = x[i : i + full * F].reshape(full, F)
+            rms, zcr = self._features(frames)
+            for k in range(full):
+                self._step(float(rms[k]), float(zcr[k]) if zcr is not None else 0.0, events)
+            i += full * F
+
+        rest = len(x) - i
+        if rest:
+            self._carry[:rest] = x[i:]
+            self._carry_n = rest
+        return events
+
+    def flush(self, end: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        """
+        녹음을 멈출 때 호출한다. 아직 열려 있는 말소리 구간이 있으면 (start, end)를 반환한다.
+
+        end: 녹음된 전체 샘플 수 (기본: 처리한 샘플 수)
+        """
+        end = self.pos if end is None else end
+        if not self.in_speech:
+            return None
+        self.in_speech = False
+        self.last_end = end
+        return (max(0, self._seg_start - self._pad), end)
+
+    def speech_bounds(self, total: int) -> Optional[Tuple[int, int]]:
+        """첫 말소리 시작 ~ 마지막 말소리 끝 (앞뒤 여유 포함, 없으면 None)"""
+        if self.first_start is None:
+            return None
+        end = total if self.in_speech or self.last_end is None else self.last_end
+        return (max(0, self.first_start - self._pad), min(total, end + self._pad))
+
+    # -------------------------
+    # 내부
+    # -------------------------
+
+    def _features(self, frames: np.ndarray):
+        energy = np.einsum("ij,ij->i", frames, frames) / frames.shape[1]
+        rms = np.sqrt(energy)
+        zcr = None
+        if self.config.use_zcr:
+            signs = np.signbit(frames)
+            zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / frames.shape[1]
+        return rms, zcr
+
+    def _step(self, rms: float, zcr: float, events: List[VadEvent]) -> None:
+        c = self.config
+        F = self._frame
+        start = self.pos
+        self.pos += F
+
+        self._track_noise(rms)
+        on_thr = max(c.min_threshold, self.noise * c.start_ratio)
+        off_thr = max(c.min_threshold, self.noise * c.stop_ratio)
+
+        voiced = rms >= (off_thr if self.in_speech else on_thr)
+        if voiced and c.use_zcr and zcr > c.zcr_max and rms < on_thr * 2:
+            # 에너지는 애매한데 영교차가 많으면 바람/치찰 잡음으로 본다
+            voiced = False
+
+        if not self.in_speech:
+            if voiced:
+                self._onset += 1
+                if self._onset >= c.onset_frames:
+                    self.in_speech = True
+                    self._ended = False
+                    self._seg_start = start - (c.onset_frames - 1) * F
+                    if self.first_start is None:
+                        self.first_start = self._seg_start
+                    self._voice_end = self.pos
+            else:
+                self._onset = 0
+                if self.had_speech:
+                    if not self._ended and self.pos - self._voice_end >= self._end_timeout:
+                        self._ended = True
+                        events.append(VadEvent(UTTERANCE_END, self.pos, self.pos))
+                elif not self._ended and self.pos >= self._no_speech:
+                    self._ended = True
+                    events.append(VadEvent(NO_SPEECH, self.pos, self.pos))
+        elif voiced:
+            self._voice_end = self.pos
+        elif self.pos - self._voice_end >= self._hangover:
+            self.in_speech = False
+            self.had_speech = True
+            self._onset = 0
+            self.last_end = self._voice_end
+            events.append(
+                VadEvent(
+                    SEGMENT,
+                    max(0, self._seg_start - self._pad),
+                    min(self.pos, self._voice_end + self._pad),
+                )
+            )
+
+    def _track_noise(self, rms: float) -> None:
+        """최근 noise_window 동안의 최소 RMS를 잡음 바닥으로 삼는다 (조각별 최소값 링)"""
+        if rms < self._slot_min:
+            self._slot_min = rms
+        self._slot_count += 1
+        if self._slot_count >= self._slot_frames:
+            self._slots.append(self._slot_min)
+            self._slot_min = float("inf")
+            self._slot_count = 0
+        floor = min(self._slots) if self._slots else self._slot_min
+        self.noise = max(min(floor, self._slot_min), _NOISE_MIN)
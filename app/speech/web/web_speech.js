@@ -1,40 +1,74 @@
 // app/speech/web/web_speech.js
 
 let recognition = null;
+let session = 0;
 
 // =========================
 // STT
 // =========================
-function startSTT(lang = 'ko-KR') {
+// stt-result 이벤트: { text, final, session }
+// - final=false: 말하는 도중의 중간 결과 (지금까지의 전체 문장)
+// - final=true : 인식 종료 시 한 번만 (text가 ""이면 인식 실패)
+function sendResult(text, final, id) {
+    flet.sendEvent("stt-result", { text, final, session: id });
+}
+
+function startSTT(lang = 'ko-KR', id = 0) {
+    session = id;
     if (!('webkitSpeechRecognition' in window || 'SpeechRecognition' in window)) {
-        flet.sendEvent("stt-result", { text: "" });
+        sendResult("", true, id);
         return;
     }
 
     const SpeechRecognition =
         window.SpeechRecognition || window.webkitSpeechRecognition;
 
-    recognition = new SpeechRecognition();
-    recognition.lang = lang;
-    recognition.interimResults = false;
-    recognition.maxAlternatives = 1;
+    const rec = new SpeechRecognition();
+    rec.lang = lang;
+    rec.interimResults = true;
+    rec.maxAlternatives = 1;
 
-    recognition.onresult = (event) => {
-        const text = event.results[0][0].transcript;
-        flet.sendEvent("stt-result", { text });
+    let finalText = "";
+    let lastText = "";
+
+    rec.onresult = (event) => {
+        let interim = "";
+        for (let i = event.resultIndex; i < event.results.length; i++) {
+            const transcript = event.results[i][0].transcript;
+            if (event.results[i].isFinal) {
+                finalText += transcript;
+            } else {
+                interim += transcript;
+            }
+        }
+        const text = (finalText + interim).trim();
+        if (text && text !== lastText) {
+            lastText = text;
+            sendResult(text, false, id);
+        }
     };
 
-    recognition.onerror = () => {
-        flet.sendEvent("stt-result", { text: "" });
+    rec.onerror = (event) => {
+        console.warn("talkland: STT error", event.error);
     };
 
-    recognition.start();
+    // 정상 종료 / 오류 / stop() 모두 onend로 끝난다
+    rec.onend = () => {
+        if (recognition === rec) {
+            recognition = null;
+        }
+        sendResult(finalText.trim() || lastText, true, id);
+    };
+
+    recognition = rec;
+    rec.start();
 }
 
 function stopSTT() {
     if (recognition) {
-        recognition.stop();
-        recognition = null;
+        recognition.stop();  // onend에서 최종 결과를 보낸다
+    } else {
+        sendResult("", true, session);
     }
 }
 
@@ -47,3 +81,30 @@ function speak(text, slow = false, lang = 'ko-KR') {
     utter.rate = slow ? 0.7 : 1.0;
     speechSynthesis.speak(utter);
 }
+
+function cancelSpeech() {
+    speechSynthesis.cancel();
+}
+
+// =========================
+// Python 브릿지 (web_bridge.py)
+// =========================
+// 한 프레임 동안 모인 명령을 한 번에 실행한다: [[함수 이름, [인자...]], ...]
+const COMMANDS = { startSTT, stopSTT, speak, cancelSpeech };
+
+function run(commands) {
+    for (const [name, args] of commands) {
+        const fn = COMMANDS[name];
+        if (!fn) {
+            console.warn("talkland: unknown command", name);
+            continue;
+        }
+        try {
+            fn(...args);
+        } catch (err) {
+            console.error("talkland:", name, err);
+        }
+    }
+}
+
+window.talklandSpeech = { run };
@@ -0,0 +1,113 @@
+# app/speech/web_bridge.py
+"""
+WebBridge (Python → JS 호출 묶음 전송)
+
+이 모듈은 Web / Android (Flet Mobile) 환경 전용이다.
+
+- web_speech.js는 페이지마다 한 번만 불러온다. (브라우저 쪽에서도 import promise를 재사용)
+- 한 프레임(약 16ms) 동안 쌓인 명령을 run_js 한 번으로 보낸다.
+  Android WebView에서는 브릿지 왕복 한 번이 비싸다.
+- 인자는 json.dumps로 직렬화한다. (Python repr은 JS 문자열 문법과 다르다)
+- 브릿지 왕복(run_js 호출) 수를 센다.
+
+WebSpeechBackend와 마찬가지로 page의 JS 브릿지 메서드는 getattr로 부른다.
+"""
+
+from __future__ import annotations
+import asyncio
+import json
+import sys
+import threading
+import weakref
+from typing import Any, List, Optional, Tuple
+
+MODULE_URL = "/app/speech/web/web_speech.js"
+FRAME_SECONDS = 0.016
+
+# web_speech.js가 window에 노출하는 함수만 부를 수 있다
+ALLOWED = frozenset({"startSTT", "stopSTT", "speak", "cancelSpeech"})
+
+_bridges: "weakref.WeakKeyDictionary[Any, WebBridge]" = weakref.WeakKeyDictionary()
+_bridges_lock = threading.Lock()
+
+
+def get_bridge(page: Any) -> "WebBridge":
+    """페이지마다 하나의 WebBridge를 반환한다."""
+    with _bridges_lock:
+        bridge = _bridges.get(page)
+        if bridge is None:
+            bridge = WebBridge(page)
+            _bridges[page] = bridge
+        return bridge
+
+
+class WebBridge:
+    """페이지 하나의 JS 호출 묶음 전송기"""
+
+    def __init__(self, page: Any, frame: float = FRAME_SECONDS) -> None:
+        self.page = page
+        self._frame = frame
+        self._queue: List[Tuple[str, list]] = []
+        self._lock = threading.Lock()
+        self._scheduled = False
+        self.round_trips = 0
+        self.commands = 0
+
+    def call(self, fn: str, *args: Any, immediate: bool = False) -> None:
+        """
+        JS 함수 호출을 대기열에 넣는다. 다음 프레임에 한꺼번에 보낸다.
+
+        immediate: 다음 프레임을 기다리지 않고 바로 보낸다 (대기 중인 명령도 함께)
+        """
+        if fn not in ALLOWED:
+            raise ValueError(f"unknown JS bridge function: {fn}")
+        with self._lock:
+            self._queue.append((fn, list(args)))
+            self.commands += 1
+            schedule = not immediate and not self._scheduled
+            if schedule:
+                self._scheduled = True
+        if immediate:
+            self.flush()
+        elif schedule:
+            self._schedule_flush()
+
+    def flush(self) -> None:
+        """대기 중인 명령을 run_js 한 번으로 보낸다."""
+        with self._lock:
+            batch, self._queue = self._queue, []
+            self._scheduled = False
+            if not batch:
+                return
+            self.round_trips += 1
+        getattr(self.page, "run_js")(self._script(batch))
+
+    def stats(self) -> dict:
+        return {"round_trips": self.round_trips, "commands": self.commands}
+
+    # -------------------------
+    # 내부
+    # -------------------------
+
+    def _script(self, batch: List[Tuple[str, list]]) -> str:
+        payload = json.dumps(batch)  # ensure_ascii: 한글, U+2028 등도 \u 이스케이프
+        # 모듈 import promise를 window에 보관해 페이지당 한 번만 불러온다
+        # (페이지를 새로 고쳐도 다음 명령에서 다시 불러온다)
+        return (
+            f"(window.__talklandSpeech = window.__talklandSpeech"
+            f" || import({json.dumps(MODULE_URL)}))"
+            f".then(() => window.talklandSpeech.run({payload}));"
+        )
+
+    def _schedule_flush(self) -> None:
+        loop: Optional[asyncio.AbstractEventLoop]
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = asyncio.get_event_loop() if sys.platform == "emscripten" else None
+        if loop is not None:
+            loop.call_later(self._frame, self.flush)
+        else:
+            timer = threading.Timer(self._frame, self.flush)
+            timer.daemon = True
+            timer.start()
@@ -17,25 +17,43 @@ WebSpeechBackend (INTENTIONALLY UNSAFE IMPLEMENTATION)
 
 # app/speech/web_speech_backend.py
 
+import asyncio
+import json
+import sys
+from concurrent.futures import Future, TimeoutError as FutureTimeout
 from typing import Any, Optional
+from app.utils import tracing
 from .speech_backend import SpeechBackend
+from .web_bridge import get_bridge
+
+# stop 후 브라우저가 최종 결과를 보낼 때까지 기다리는 기본 시간(초)
+DEFAULT_STOP_TIMEOUT = 5.0
 
 class WebSpeechBackend(SpeechBackend):
     """
     Web / Android용 STT / TTS backend
 
     - Web Speech API 사용 (JS)
-    - Flet JS 브릿지를 통해 통신
+    - Flet JS 브릿지를 통해 통신 (WebBridge: 페이지당 JS 한 번 로드, 프레임 단위 묶음 전송)
     - 타입 안정성보다 런타임 안정성 우선
+    - STT 결과는 stt-result 이벤트({text, final, session})로 받는다.
+      최종 결과는 Future로, 중간 결과는 on_partial로 전달한다.
     """
 
-    def __init__(self, page: Any):
+    def __init__(self, page: Any, stop_timeout: float = DEFAULT_STOP_TIMEOUT):
         """
         page: Flet Page (JS 브릿지 포함)
+        stop_timeout: stop_stt가 최종 결과를 기다리는 기본 시간(초)
         """
         self.page: Any = page
-        self._result: Optional[str] = None
+        self.stop_timeout = stop_timeout
+        self._session = 0
+        self._final: Future = Future()
+        self._final.set_result(None)
+        self._interim: Optional[str] = None
+        self._stopping = False
         self._on_silence = None
+        self._on_partial = None
 
         # JS → Python 이벤트 수신
         getattr(self.page, "on_event")(
@@ -43,31 +61,70 @@ class WebSpeechBackend(SpeechBackend):
             self._on_stt_result,
         )
 
-        # JS 로드
-        getattr(self.page, "run_js")(
-            "import('/app/speech/web/web_speech.js');"
-        )
+        # JS는 첫 명령과 함께 페이지당 한 번만 로드된다
+        self.bridge = get_bridge(page)
 
     # =========================
     # STT
     # =========================
 
-    def start_stt(self, on_silence=None, lang: str = "ko-KR") -> None:
+    def start_stt(self, on_silence=None, on_partial=None, lang: str = "ko-KR") -> None:
         """음성 인식 시작 (JS)
         
         Args:
-            on_silence: Callback for silence detection (not implemented in web)
+            on_silence: 브라우저가 말이 끝났다고 보고 인식을 스스로 끝냈을 때 호출
+            on_partial: 중간 인식 결과가 나올 때마다 지금까지의 문장으로 호출
             lang: Language code for STT (e.g., 'ko-KR', 'en-US')
         """
-        self._result = None
+        self._session += 1
+        self._final = Future()
+        self._interim = None
+        self._stopping = False
         self._on_silence = on_silence
-        # Pass language to JS
-        getattr(self.page, "run_js")(f"startSTT('{lang}');")
+        self._on_partial = on_partial
+        # Pass language to JS (마이크 시작은 지연 없이 바로 보낸다)
+        self.bridge.call("startSTT", lang, self._session, immediate=True)
 
-    def stop_stt(self) -> Optional[str]:
-        """음성 인식 종료 및 결과 반환"""
-        getattr(self.page, "run_js")("stopSTT();")
-        return self._result
+    def stop_stt(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        음성 인식을 종료하고 최종 결과를 반환한다.
+
+        - 스레드에서 호출하면 최종 결과(stt-result final)를 timeout까지 기다린다.
+        - Pyodide(단일 스레드)에서는 기다릴 수 없으므로 지금까지의 결과를 반환한다.
+          (기다려야 하면 stop_stt_async를 쓴다)
+        """
+        self._request_stop()
+        if sys.platform != "emscripten":
+            try:
+                return self._final.result(self.stop_timeout if timeout is None else timeout)
+            except FutureTimeout:
+                print("Web STT: final result timed out")
+        return self._current_text()
+
+    async def stop_stt_async(self, timeout: Optional[float] = None) -> Optional[str]:
+        """음성 인식을 종료하고 최종 결과를 이벤트 루프를 막지 않고 기다린다."""
+        self._request_stop()
+        try:
+            # shield: 시간 초과로 wait_for가 취소해도 공유 Future는 취소되지 않게
+            with tracing.span("stt.final_wait", engine="web"):
+                return await asyncio.wait_for(
+                    asyncio.shield(asyncio.wrap_future(self._final)),
+                    self.stop_timeout if timeout is None else timeout,
+                )
+        except asyncio.TimeoutError:
+            print("Web STT: final result timed out")
+            return self._current_text()
+
+    def _request_stop(self) -> None:
+        if self._final.done():
+            return
+        self._stopping = True
+        self.bridge.call("stopSTT", immediate=True)
+
+    def _current_text(self) -> Optional[str]:
+        if self._final.done():
+            return self._final.result()
+        return self._interim or None
 
     # =========================
     # TTS
@@ -81,15 +138,35 @@ class WebSpeechBackend(SpeechBackend):
             slow: Whether to speak slowly
             lang: Language code for TTS (e.g., 'ko-KR', 'es-ES')
         """
-        slow_js = "true" if slow else "false"
-        getattr(self.page, "run_js")(
-            f"speak({text!r}, {slow_js}, '{lang}');"
-        )
+        self.bridge.call("speak", text, slow, lang)
+
+    def stop_speaking(self) -> None:
+        """재생 중인 음성을 멈춘다. (JS)"""
+        self.bridge.call("cancelSpeech")
 
     # =========================
     # 내부 이벤트 핸들러
     # =========================
 
     def _on_stt_result(self, e: Any) -> None:
-        """JS에서 전달된 STT 결과 처리"""
-        self._result = e.data.get("text", "")
\ No newline at end of file
+        """JS에서 전달된 STT 결과 처리 (중간 결과 / 최종 결과)"""
+        data = e.data
+        if isinstance(data, str):
+            data = json.loads(data) if data else {}
+        if data.get("session", self._session) != self._session:
+            return  # 이전 인식 세션의 늦은 이벤트
+
+        text = (data.get("text") or "").strip()
+        if not data.get("final", True):
+            self._interim = text
+            if self._on_partial and text:
+                self._on_partial(text)
+            return
+
+        if self._final.done():
+            return
+        self._final.set_result(text or None)
+        if not self._stopping and self._on_silence:
+            # stop을 누르기 전에 브라우저가 인식을 끝냈다 (말이 끝남)
+            callback, self._on_silence = self._on_silence, None
+            callback()
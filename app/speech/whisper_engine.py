@@ -0,0 +1,146 @@
+# app/speech/whisper_engine.py
+"""
+WhisperEngine (로컬 오프라인 STT)
+
+- openai-whisper 모델을 백그라운드 스레드에서 한 번만 로드하고 계속 재사용한다.
+- CPU 전용 (fp16=False). 네트워크 없이 인식하므로 지연 시간이 일정하다.
+- 입력은 16kHz 모노 float32 배열이다. (녹음 링 버퍼의 int16 view도 받는다)
+- whisper / torch는 로드 스레드 안에서만 import 한다. (앱 시작을 막지 않음)
+"""
+
+from __future__ import annotations
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+
+SAMPLE_RATE = 16000  # whisper 입력 샘플레이트
+DEFAULT_MODEL = "base"
+MODEL_SIZES = ("tiny", "base", "small", "medium", "large")
+
+
+def whisper_language(lang: Optional[str]) -> Optional[str]:
+    """'ko-KR' / 'es_ES' / 'ko' -> 'ko' (None이면 자동 감지)"""
+    if not lang:
+        return None
+    return lang.replace("_", "-").split("-")[0].lower()
+
+
+class WhisperEngine:
+    """
+    상주 Whisper 인식기.
+
+    - load_async(): 백그라운드 로드 시작 (앱 시작 시 호출)
+    - transcribe(): 로드가 끝날 때까지 기다린 뒤 인식
+    - 모델은 스레드 안전하지 않으므로 인식은 한 번에 하나씩 한다.
+    """
+
+    def __init__(
+        self,
+        model_size: str = DEFAULT_MODEL,
+        language: Optional[str] = "ko",
+        download_root: Optional[str] = None,
+    ) -> None:
+        """
+        model_size: tiny | base | small | medium | large (또는 whisper가 아는 모델 이름)
+        language: 기본 인식 언어 ('ko', 'ko-KR' 등, None이면 자동 감지)
+        download_root: 모델 파일 폴더 (기본: whisper 기본 캐시)
+        """
+        self.model_size = model_size
+        self.language = whisper_language(language)
+        self._download_root = download_root
+        self._model = None
+        self._error: Optional[BaseException] = None
+        self._loaded = threading.Event()
+        self._loader: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self.load_seconds: Optional[float] = None
+
+    # -------------------------
+    # 로드
+    # -------------------------
+
+    def load_async(self) -> None:
+        """모델 로드를 백그라운드에서 시작한다. (이미 시작했으면 아무것도 하지 않음)"""
+        with self._start_lock:
+            if self._loader is not None:
+                return
+            self._loader = threading.Thread(
+                target=self._load, name="whisper-load", daemon=True
+            )
+            self._loader.start()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """로드가 끝날 때까지 기다린다. 성공하면 True."""
+        self.load_async()
+        self._loaded.wait(timeout)
+        return self.ready
+
+    @property
+    def ready(self) -> bool:
+        return self._model is not None
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        return self._error
+
+    # -------------------------
+    # 인식
+    # -------------------------
+
+    def transcribe(self, audio: np.ndarray, language: Optional[str] = None) -> Optional[str]:
+        """
+        16kHz 모노 오디오를 인식해 문장을 반환한다. (실패 / 빈 결과면 None)
+
+        audio: float32 [-1, 1] 또는 int16 PCM
+        language: 이번 인식에만 쓸 언어 (기본: 생성 시 언어)
+        """
+        if not len(audio):
+            return None
+        if not self.wait_ready():
+            print(f"Whisper model unavailable: {self._error}")
+            return None
+
+        lang = whisper_language(language) or self.language
+        with self._lock:
+            result = self._model.transcribe(
+                to_float32(audio),
+                language=lang,
+                task="transcribe",
+                fp16=False,
+                temperature=0.0,
+                condition_on_previous_text=False,
+            )
+        text = result.get("text", "").strip()
+        return text or None
+
+    # -------------------------
+    # 내부
+    # -------------------------
+
+    def _load(self) -> None:
+        start = time.perf_counter()
+        try:
+            import whisper
+
+            self._model = whisper.load_model(
+                self.model_size, device="cpu", download_root=self._download_root
+            )
+            self.load_seconds = time.perf_counter() - start
+        except BaseException as e:
+            self._error = e
+            print(f"Whisper load failed ({self.model_size}): {e}")
+        finally:
+            self._loaded.set()
+
+
+def to_float32(audio: np.ndarray) -> np.ndarray:
+    """int16 PCM이면 [-1, 1] float32로 바꾸고, float32면 그대로 반환한다."""
+    audio = audio.reshape(-1)
+    if audio.dtype == np.float32:
+        return audio
+    if audio.dtype == np.int16:
+        return np.multiply(audio, 1.0 / 32768.0, dtype=np.float32)
+    return audio.astype(np.float32)
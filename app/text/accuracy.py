@@ -2,6 +2,8 @@
 from __future__ import annotations
 from typing import Iterable, Tuple, Optional
 
+from .align import Alignment
+
 
 def accuracy(
     compare: Optional[Iterable[Tuple[str, bool]]]
@@ -10,11 +12,15 @@ def accuracy(
     단어 비교 결과로부터 정확도를 계산한다.
 
     - compare가 None 또는 비어 있으면 0.0
+    - Alignment가 오면 미리 센 값을 그대로 사용한다.
     """
 
     if not compare:
         return 0.0
 
+    if isinstance(compare, Alignment):
+        return compare.accuracy
+
     total = 0
     correct = 0
 
@@ -0,0 +1,207 @@
+# app/text/align.py
+"""
+단어 정렬(alignment) 기반 문장 채점 엔진
+
+이 모듈은:
+- 목표 문장과 발화 문장의 단어열을 편집 거리(edit distance)로 정렬한다.
+- STT가 단어를 하나 끼워 넣거나 빠뜨려도 뒤 단어들이 밀려서 틀리지 않는다.
+- 대각선 주변 띠(band)만 계산하므로 메모리는 문장 길이에 선형이다.
+- UI / Flet / SpeechBackend에 의존하지 않는 순수 모듈이다.
+
+토큰은 == 비교만 하므로 문자열이든 정수 ID든 상관없다.
+"""
+
+from __future__ import annotations
+from typing import AbstractSet, Hashable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+# 정렬 연산 코드
+OP_MATCH = "match"
+OP_SUB = "sub"
+OP_DEL = "del"  # 목표 단어를 말하지 않음
+OP_INS = "ins"  # 목표에 없는 단어를 말함
+
+# 상대 가중치: 치환 한 번이 삽입+삭제 한 쌍보다 싸지만 치환 두 번보다는
+# 삽입+삭제가 싸다. 그래서 "단어 하나 끼워 넣기"는 밀림이 아니라 삽입으로 잡힌다.
+SUB_COST = 3
+DEL_COST = 2
+INS_COST = 2
+
+# 길이 차이 외에 대각선에서 벗어날 수 있는 최대 거리
+DEFAULT_BAND = 4
+
+_INF = 1 << 30
+
+# 역추적용 코드 (bytearray에 저장)
+_BT_DIAG = 0
+_BT_DEL = 1
+_BT_INS = 2
+
+
+class AlignedWord(NamedTuple):
+    """정렬된 한 칸"""
+
+    target: Optional[str]
+    spoken: Optional[str]
+    op: str
+    ignored: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """목표 단어를 맞게 말했는지 여부 (무시 단어는 항상 True)"""
+        return self.ignored or self.op == OP_MATCH
+
+
+class Alignment:
+    """
+    정렬 결과.
+
+    - 반복하면 목표 단어마다 (단어, 맞음 여부)를 돌려준다.
+      따라서 compare_sentence 결과와 같은 모양이며
+      accuracy()에 그대로 넘길 수 있다.
+    - 삽입(ins) 칸은 반복에 포함되지 않고 insertions로 따로 본다.
+    """
+
+    __slots__ = ("words", "cost", "correct", "total")
+
+    def __init__(self, words: List[AlignedWord], cost: int) -> None:
+        self.words = words
+        self.cost = cost
+        self.total = 0
+        self.correct = 0
+        for w in words:
+            if w.op != OP_INS:
+                self.total += 1
+                if w.ok:
+                    self.correct += 1
+
+    def __iter__(self) -> Iterator[Tuple[str, bool]]:
+        for w in self.words:
+            if w.op != OP_INS:
+                yield (w.target, w.ok)  # type: ignore[misc]
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __repr__(self) -> str:
+        return f"Alignment(cost={self.cost}, correct={self.correct}/{self.total})"
+
+    @property
+    def accuracy(self) -> float:
+        return self.correct / self.total if self.total else 0.0
+
+    @property
+    def insertions(self) -> List[str]:
+        """목표 문장에 없는데 발화된 단어들"""
+        return [w.spoken for w in self.words if w.op == OP_INS]  # type: ignore[misc]
+
+    @property
+    def missed(self) -> List[str]:
+        """틀리거나 빠뜨린 목표 단어들"""
+        return [w.target for w in self.words if w.op != OP_INS and not w.ok]  # type: ignore[misc]
+
+
+def band_limits(n: int, m: int, band: int = DEFAULT_BAND) -> Tuple[int, int]:
+    """
+    (j - i) 대각선 오프셋의 허용 범위를 반환한다.
+
+    - n: 목표 단어 수, m: 발화 단어 수
+    - 길이 차이만큼은 항상 포함하고 양쪽으로 band 만큼 더 허용한다.
+    """
+    return min(0, m - n) - band, max(0, m - n) + band
+
+
+def align_words(
+    target_words: Sequence[Hashable],
+    spoken_words: Sequence[Hashable],
+    ignore_words: AbstractSet[Hashable] = frozenset(),
+    band: int = DEFAULT_BAND,
+) -> Alignment:
+    """
+    두 단어열을 띠(band) 편집 거리로 정렬한다.
+
+    비용 규칙:
+    - 일치 0, 치환 SUB_COST, 삽입 INS_COST, 삭제 DEL_COST
+    - ignore_words에 있는 목표 단어는 빠뜨려도 비용 0이며 항상 맞음 처리
+    - ignore_words에 있는 발화 단어는 끼워 넣어도 비용 0
+
+    동점일 때는 대각선(일치/치환) > 삭제 > 삽입 순으로 고른다.
+    """
+    n = len(target_words)
+    m = len(spoken_words)
+    lo, hi = band_limits(n, m, band)
+    width = hi - lo + 1
+
+    del_costs = [0 if w in ignore_words else DEL_COST for w in target_words]
+    ins_costs = [0 if w in ignore_words else INS_COST for w in spoken_words]
+
+    # 행 i의 칸 k는 j = i + lo + k 에 해당한다.
+    # 비용 배열은 양 끝에 INF 한 칸씩을 두어 k 를 k + 1 에 저장한다.
+    # 대각선 전이는 이전 행 k + 1, 삭제는 이전 행 k + 2, 삽입은 같은 행 k 이다.
+    prev = [_INF] * (width + 2)
+    trace: List[bytearray] = []
+
+    row0 = bytearray(width)
+    acc = 0
+    for k in range(max(0, -lo), min(width - 1, m - lo) + 1):
+        j = lo + k
+        if j > 0:
+            acc += ins_costs[j - 1]
+            row0[k] = _BT_INS
+        prev[k + 1] = acc
+    trace.append(row0)
+
+    for i in range(1, n + 1):
+        tw = target_words[i - 1]
+        dc = del_costs[i - 1]
+        cur = [_INF] * (width + 2)
+        bt = bytearray(width)
+        base = i + lo
+        k_start = max(0, -base)
+        k_end = min(width - 1, m - base)
+
+        if k_start == -base and k_start <= k_end:
+            # j == 0 열: 삭제로만 도달
+            cur[k_start + 1] = prev[k_start + 2] + dc
+            bt[k_start] = _BT_DEL
+            k_start += 1
+
+        for k in range(k_start, k_end + 1):
+            j1 = base + k - 1
+            # bt 는 0(_BT_DIAG)으로 초기화되어 있으므로 삭제/삽입일 때만 기록한다.
+            c = prev[k + 1]
+            best = c if tw == spoken_words[j1] else c + SUB_COST
+            c = prev[k + 2] + dc
+            if c < best:
+                best = c
+                bt[k] = _BT_DEL
+            c = cur[k] + ins_costs[j1]
+            if c < best:
+                best = c
+                bt[k] = _BT_INS
+            cur[k + 1] = best
+        prev = cur
+        trace.append(bt)
+
+    cost = prev[m - n - lo + 1]
+
+    # 역추적
+    words: List[AlignedWord] = []
+    append = words.append
+    i, j = n, m
+    while i > 0 or j > 0:
+        how = trace[i][j - i - lo]
+        if i > 0 and j > 0 and how == _BT_DIAG:
+            tw, sw = target_words[i - 1], spoken_words[j - 1]
+            append(AlignedWord(tw, sw, OP_MATCH if tw == sw else OP_SUB, tw in ignore_words))  # type: ignore[arg-type]
+            i -= 1
+            j -= 1
+        elif i > 0 and (how == _BT_DEL or j == 0):
+            tw = target_words[i - 1]
+            append(AlignedWord(tw, None, OP_DEL, tw in ignore_words))  # type: ignore[arg-type]
+            i -= 1
+        else:
+            append(AlignedWord(None, spoken_words[j - 1], OP_INS))  # type: ignore[arg-type]
+            j -= 1
+    words.reverse()
+
+    return Alignment(words, cost)
@@ -0,0 +1,264 @@
+# app/text/batch.py
+"""
+연습 세트 일괄 채점 (NumPy)
+
+이 모듈은:
+- normalize_spoken → compare_sentence → accuracy 파이프라인을
+  수천 쌍에 대해 한 번에 계산한다.
+- 단어를 정수 ID로 intern 한 뒤 (목표 단어 × 발화 단어 × 쌍) 격자에서
+  정렬 DP를 쌍 축으로 벡터화한다.
+- 결과는 스칼라 함수와 정확히 같아야 한다.
+  (같은 띠 폭, 같은 비용, 같은 동점 처리 순서)
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .align import DEFAULT_BAND, DEL_COST, INS_COST, SUB_COST
+from .compare import ignore_words_for
+from .normalize import normalize_spoken
+
+# 한 번에 DP 격자에 올리는 최대 쌍 수 (메모리 상한)
+DEFAULT_CHUNK = 2048
+
+_INF = np.int32(1 << 29)
+_BT_DIAG = 0
+_BT_DEL = 1
+_BT_INS = 2
+
+
+@dataclass
+class BatchScores:
+    """
+    score_batch 결과.
+
+    - accuracy: 쌍별 정확도 (float64, 길이 B)
+    - correct: 모든 쌍의 목표 단어별 맞음 여부를 이어 붙인 배열
+    - offsets: 쌍 k의 단어는 correct[offsets[k]:offsets[k + 1]]
+    - word_ids / vocab: 목표 단어 (vocab[word_ids[i]])
+    """
+
+    accuracy: np.ndarray
+    correct: np.ndarray
+    offsets: np.ndarray
+    word_ids: np.ndarray
+    vocab: List[str]
+
+    def __len__(self) -> int:
+        return len(self.accuracy)
+
+    def pairs(self, k: int) -> List[Tuple[str, bool]]:
+        """쌍 k의 결과를 compare_sentence와 같은 모양으로 반환한다."""
+        start, end = int(self.offsets[k]), int(self.offsets[k + 1])
+        vocab = self.vocab
+        return [
+            (vocab[w], bool(ok))
+            for w, ok in zip(self.word_ids[start:end].tolist(), self.correct[start:end].tolist())
+        ]
+
+
+def _intern(
+    texts: Sequence[str], table: Dict[str, int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    문장들을 토큰화해 단어 ID를 이어 붙인 배열과 문장별 offsets를 반환한다.
+
+    - table은 단어 → ID 사전이며 새 단어가 나오면 그 자리에서 늘어난다.
+    """
+    tokens = [t.lower().split() for t in texts]
+    lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=len(tokens))
+    offsets = np.zeros(len(tokens) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    flat = [w for ws in tokens for w in ws]
+    for w in flat:
+        if w not in table:
+            table[w] = len(table)
+    ids = np.fromiter(map(table.__getitem__, flat), dtype=np.int32, count=len(flat))
+    return ids, offsets
+
+
+def _gather(
+    flat: np.ndarray, offsets: np.ndarray, idx: np.ndarray, fill: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    idx가 가리키는 문장들을 (최대 길이, 문장 수) 패딩 배열로 모은다.
+
+    반환: (패딩 배열, 이어 붙인 배열 기준 원소 위치, (행, 열) 위치)
+    """
+    lengths = offsets[idx + 1] - offsets[idx]
+    width = int(lengths.max()) if len(idx) else 0
+    rows = np.repeat(np.arange(len(idx)), lengths)
+    cols = np.arange(len(rows)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    src = np.repeat(offsets[idx], lengths) + cols
+
+    out = np.full((width, len(idx)), fill, dtype=np.int32)
+    out[cols, rows] = flat[src]
+    return out, src, np.stack((cols, rows))
+
+
+def _score_chunk(
+    T: np.ndarray,
+    S: np.ndarray,
+    n: np.ndarray,
+    m: np.ndarray,
+    ignored: np.ndarray,
+    band: int,
+) -> np.ndarray:
+    """
+    한 묶음의 쌍을 정렬하고 (목표 위치, 쌍) 모양의 맞음 여부 배열을 반환한다.
+
+    - T: (N, B) 목표 단어 ID (패딩 -1), S: (M, B) 발화 단어 ID (패딩 -2)
+    - n, m: 쌍별 실제 길이
+
+    격자는 (i, j, b) 순서이며 각 쌍의 띠 밖 칸은 INF로 막는다.
+    쌍 b의 결과 칸 (n_b, m_b)는 그보다 작은 (i, j)에만 의존하므로
+    패딩 칸은 결과에 영향을 주지 않는다.
+    """
+    N, B = T.shape
+    M = S.shape[0]
+
+    t_ign = ignored[np.maximum(T, 0)] & (T >= 0)
+    s_ign = ignored[np.maximum(S, 0)] & (S >= 0)
+    del_c = np.where(t_ign, 0, DEL_COST).astype(np.int32)  # (N, B)
+    ins_c = np.where(s_ign, 0, INS_COST).astype(np.int32)  # (M, B)
+
+    lo = np.minimum(0, m - n) - band  # (B,)
+    hi = np.maximum(0, m - n) + band
+    js = np.arange(M + 1)[:, None]  # (M+1, 1)
+
+    D = np.empty((N + 1, M + 1, B), dtype=np.int32)
+    BT = np.zeros((N + 1, M + 1, B), dtype=np.int8)
+
+    # 0행: 삽입만으로 도달
+    in_band = (js >= lo) & (js <= hi)
+    row = np.zeros((M + 1, B), dtype=np.int32)
+    if M:
+        np.cumsum(ins_c, axis=0, out=row[1:])
+    D[0] = np.where(in_band, row, _INF)
+    BT[0, 1:] = _BT_INS
+
+    for i in range(1, N + 1):
+        prev = D[i - 1]
+        cur = D[i]
+        bt = BT[i]
+        off = js - i
+        in_band = (off >= lo) & (off <= hi)
+
+        # 대각선 후보 (j >= 1)
+        sub = np.where(S == T[i - 1], 0, SUB_COST).astype(np.int32)
+        cur[1:] = prev[:-1] + sub
+        # 삭제 후보: 대각선보다 엄격히 작을 때만
+        dele = prev + del_c[i - 1]
+        cur[0] = dele[0]
+        bt[0] = _BT_DEL
+        take = dele[1:] < cur[1:]
+        np.copyto(cur[1:], dele[1:], where=take)
+        bt[1:][take] = _BT_DEL
+        np.copyto(cur, _INF, where=~in_band)
+
+        # 삽입 후보: 같은 행 왼쪽 칸에서, 현재 최선보다 엄격히 작을 때만
+        for j in range(1, M + 1):
+            ins = cur[j - 1] + ins_c[j - 1]
+            take = (ins < cur[j]) & in_band[j]
+            np.copyto(cur[j], ins, where=take)
+            bt[j][take] = _BT_INS
+
+    # 역추적 (쌍 축으로 벡터화)
+    flat_ok = np.zeros((N, B), dtype=bool)
+    ii = n.copy()
+    jj = m.copy()
+    cols = np.arange(B)
+    active = (ii > 0) | (jj > 0)
+    while active.any():
+        a = cols[active]
+        i_a = ii[a]
+        j_a = jj[a]
+        how = BT[i_a, j_a, a]
+        diag = (i_a > 0) & (j_a > 0) & (how == _BT_DIAG)
+        dele = ~diag & (i_a > 0) & ((how == _BT_DEL) | (j_a == 0))
+        step_t = diag | dele
+
+        if step_t.any():
+            bt_b = a[step_t]
+            ti = i_a[step_t] - 1
+            tw = T[ti, bt_b]
+            ok = ignored[tw]
+            d = diag[step_t]
+            if d.any():
+                sw = S[j_a[step_t][d] - 1, bt_b[d]]
+                ok[d] |= tw[d] == sw
+            flat_ok[ti, bt_b] = ok
+
+        ii[a] -= step_t
+        jj[a] -= diag | ~step_t
+        active = (ii > 0) | (jj > 0)
+
+    return flat_ok
+
+
+def score_batch(
+    targets: Sequence[str],
+    spokens: Sequence[Optional[str]],
+    level: Optional[str],
+    normalize: bool = True,
+    band: int = DEFAULT_BAND,
+    chunk_size: int = DEFAULT_CHUNK,
+    lang: Optional[str] = None,
+) -> BatchScores:
+    """
+    목표/발화 문장 쌍을 한 번에 채점한다.
+
+    - normalize=True이면 발화에 normalize_spoken(s, lang)을 먼저 적용한다.
+    - 결과는 쌍마다 accuracy(compare_sentence(t, normalize_spoken(s), level))와
+      compare_sentence 결과가 정확히 같다.
+    - 길이가 비슷한 쌍끼리 묶어 chunk_size 단위로 계산한다.
+    """
+    if len(targets) != len(spokens):
+        raise ValueError("targets와 spokens의 길이가 다릅니다")
+
+    B = len(targets)
+    table: Dict[str, int] = {}
+
+    t_flat, t_off = _intern(targets, table)
+    if normalize:
+        texts = [normalize_spoken(s, lang) for s in spokens]
+    else:
+        texts = [s or "" for s in spokens]
+    s_flat, s_off = _intern(texts, table)
+
+    ignored = np.zeros(len(table) + 1, dtype=bool)
+    for w in ignore_words_for(level):
+        wid = table.get(w)
+        if wid is not None:
+            ignored[wid] = True
+
+    t_len = np.diff(t_off)
+    s_len = np.diff(s_off)
+    correct = np.zeros(len(t_flat), dtype=bool)
+
+    # 패딩을 줄이기 위해 (목표 길이, 발화 길이) 순으로 묶는다
+    order = np.lexsort((s_len, t_len))
+    for c in range(0, B, chunk_size):
+        idx = order[c : c + chunk_size]
+        T, t_src, t_pos = _gather(t_flat, t_off, idx, -1)
+        S, _, _ = _gather(s_flat, s_off, idx, -2)
+        ok = _score_chunk(T, S, t_len[idx], s_len[idx], ignored, band)
+        correct[t_src] = ok[t_pos[0], t_pos[1]]
+
+    counts = np.zeros(len(correct) + 1, dtype=np.int64)
+    np.cumsum(correct, out=counts[1:])
+    n_correct = counts[t_off[1:]] - counts[t_off[:-1]]
+    acc = np.zeros(B, dtype=np.float64)
+    np.divide(n_correct, t_len, out=acc, where=t_len > 0)
+
+    return BatchScores(
+        accuracy=acc,
+        correct=correct,
+        offsets=t_off,
+        word_ids=t_flat,
+        vocab=list(table),
+    )
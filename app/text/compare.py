@@ -2,6 +2,8 @@
 from __future__ import annotations
 from typing import List, Tuple, Optional, Iterable
 
+from .align import Alignment, align_words
+
 IGNORE_WORDS: dict[str, set[str]] = {
     "Beginner": {"a", "the", "to", "of"},
     "Intermediate": {"a", "the"},
@@ -9,35 +11,45 @@ IGNORE_WORDS: dict[str, set[str]] = {
 }
 
 
-def compare_sentence(
+def ignore_words_for(level: Optional[str]) -> set[str]:
+    """level에 해당하는 무시 단어 집합 (알 수 없는 level은 Beginner)"""
+    return IGNORE_WORDS[level if level in IGNORE_WORDS else "Beginner"]
+
+
+def align_sentence(
     target: str,
     spoken: Optional[str],
     level: Optional[str],
-) -> List[Tuple[str, bool]]:
+) -> Alignment:
     """
-    목표 문장과 발화 문장을 단어 단위로 비교한다.
+    목표 문장과 발화 문장을 단어 정렬로 비교한다.
 
     - spoken / level 이 None이어도 안전
     - level에 따라 무시 단어 적용
-    - 반환값: [(단어, 맞음 여부)]
+    - 반환값: Alignment (accuracy()에 그대로 전달 가능)
     """
 
     spoken_text = spoken or ""
-    safe_level = level if level in IGNORE_WORDS else "Beginner"
 
     target_words = target.lower().split()
     spoken_words = spoken_text.lower().split()
 
-    ignore_words = IGNORE_WORDS[safe_level]
+    return align_words(target_words, spoken_words, ignore_words_for(level))
 
-    result: list[tuple[str, bool]] = []
 
-    for i, word in enumerate(target_words):
-        if word in ignore_words:
-            result.append((word, True))
-            continue
+def compare_sentence(
+    target: str,
+    spoken: Optional[str],
+    level: Optional[str],
+) -> List[Tuple[str, bool]]:
+    """
+    목표 문장과 발화 문장을 단어 단위로 비교한다.
 
-        spoken_word = spoken_words[i] if i < len(spoken_words) else ""
-        result.append((word, word == spoken_word))
+    - spoken / level 이 None이어도 안전
+    - level에 따라 무시 단어 적용
+    - 위치가 아니라 단어 정렬로 비교하므로
+      단어 하나가 끼거나 빠져도 뒤 단어들이 틀리지 않는다.
+    - 반환값: [(단어, 맞음 여부)]
+    """
 
-    return result
+    return list(align_sentence(target, spoken, level))
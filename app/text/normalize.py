@@ -1,19 +1,95 @@
 # app/text/normalize.py
 from __future__ import annotations
-import re
-from typing import Optional
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 
+# ASCII 전용 변환표: 대문자 → 소문자, 영숫자/공백 외 문자 삭제
+_ASCII_TABLE: Dict[int, Optional[int]] = {
+    c: (ord(chr(c).lower()) if chr(c).isalnum() or chr(c).isspace() else None)
+    for c in range(128)
+}
 
-def normalize_spoken(text: Optional[str]) -> str:
+
+class _FoldTable(dict):
+    """
+    str.translate용 유니코드 변환표.
+
+    처음 보는 코드 포인트만 unicodedata로 계산하고 결과를 캐시한다.
+    - 글자/숫자: 소문자로, (설정 시) 악센트를 뗀 기본 글자로
+    - 공백: 유지 (뒤에서 한 칸으로 정리)
+    - 그 외 (문장부호, 기호, 결합 부호, '_'): 삭제
+    """
+
+    def __init__(self, fold_accents: bool, keep: str) -> None:
+        super().__init__(_ASCII_TABLE)
+        self._fold_accents = fold_accents
+        self._keep = frozenset(keep)
+
+    def __missing__(self, cp: int) -> Optional[str]:
+        ch = chr(cp)
+        if ch.isspace():
+            out: Optional[str] = ch
+        elif not ch.isalnum():
+            out = None
+        else:
+            out = ch.lower()
+            if self._fold_accents and out not in self._keep:
+                base = unicodedata.normalize("NFD", out)
+                # 한글 음절은 자모로 분해되므로 접지 않는다
+                if len(base) > 1 and unicodedata.combining(base[1]):
+                    out = "".join(c for c in base if not unicodedata.combining(c))
+        self[cp] = out
+        return out
+
+
+@dataclass(frozen=True)
+class NormalizeProfile:
+    """
+    언어별 정규화 설정.
+
+    - fold_accents: 악센트 제거 (á → a)
+    - keep: 악센트 제거에서 제외할 글자 (es의 ñ 등)
+    """
+
+    name: str
+    fold_accents: bool = True
+    keep: str = ""
+    table: _FoldTable = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "table", _FoldTable(self.fold_accents, self.keep))
+
+
+PROFILES: Dict[str, NormalizeProfile] = {
+    "ko": NormalizeProfile("ko"),
+    "es": NormalizeProfile("es", keep="ñ"),
+    "en": NormalizeProfile("en"),
+}
+
+DEFAULT_PROFILE = PROFILES["en"]
+
+
+def get_profile(lang: Optional[str]) -> NormalizeProfile:
+    """언어 코드("ko", "es-ES" 등)에 맞는 프로필 (없으면 기본)"""
+    if not lang:
+        return DEFAULT_PROFILE
+    return PROFILES.get(lang.split("-")[0].lower(), DEFAULT_PROFILE)
+
+
+def normalize_spoken(text: Optional[str], lang: Optional[str] = None) -> str:
     """
     STT 결과 텍스트를 비교용으로 정규화한다.
 
     처리 내용:
     - None 안전 처리
     - 소문자 변환
-    - 특수문자 제거
+    - 특수문자 제거 (모든 언어의 글자와 숫자는 유지)
+    - 언어 프로필에 따라 악센트 제거
     - 공백 정리
 
+    ASCII 입력은 정규식 없이 변환표 한 번으로 처리한다.
+
     이 함수는:
     - STT 구현과 무관
     - 플랫폼 독립
@@ -23,13 +99,11 @@ def normalize_spoken(text: Optional[str]) -> str:
     if not text:
         return ""
 
-    # 소문자
-    text = text.lower()
-
-    # 특수문자 제거 (알파벳, 숫자, 공백만 유지)
-    text = re.sub(r"[^a-z0-9\s]", "", text)
+    if text.isascii():
+        return " ".join(text.translate(_ASCII_TABLE).split())
 
-    # 공백 정리
-    text = re.sub(r"\s+", " ", text).strip()
+    # 분해형(n + ◌̃)으로 들어온 입력을 조합형으로 맞춘다
+    if not unicodedata.is_normalized("NFC", text):
+        text = unicodedata.normalize("NFC", text)
 
-    return text
+    return " ".join(text.translate(get_profile(lang).table).split())
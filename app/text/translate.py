@@ -7,15 +7,246 @@
 - UI / Flet / SpeechBackend에 의존하지 않는다.
 - Desktop / Web / Android 모두에서 import 안전하다.
 
-초기 버전은 Mock 구현이며,
-추후 Google / DeepL / OpenAI API로 교체 가능하다.
+번역 엔진은 TranslationProvider로 추상화되어 있다.
+- GoogleTranslationProvider: 기본값 (deep_translator)
+- LocalDictionaryProvider: 테스트 / 오프라인용
+
+번역 결과는 TranslationCache(메모리 + 디스크)에 저장되어
+같은 문장은 네트워크 없이 바로 돌려준다.
 """
 
-from deep_translator import GoogleTranslator
+import socket
+import threading
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from app.utils import tracing
+
+from .translation_cache import CACHE_ERRORS, TranslationCache
+
+if TYPE_CHECKING:
+    from deep_translator import GoogleTranslator
+
+
+class TranslationError(RuntimeError):
+    """번역 엔진이 실패했을 때 translate()가 올리는 예외 (원래 예외는 __cause__)"""
+
+
+class TranslationProvider(ABC):
+    """
+    번역 엔진 인터페이스.
+
+    - translate: 한 문장 번역 (실패 시 예외)
+    - translate_many: 여러 문장을 가능한 한 적은 왕복으로 번역
+    - requests: 실제로 보낸 요청(왕복) 수
+    """
+
+    requests: int = 0
+
+    @abstractmethod
+    def translate(self, text: str, src_lang: str, dst_lang: str) -> str:
+        """
+        한 문장을 번역한다.
+
+        실패하면 예외를 올린다. (에러 문자열을 반환하지 않는다)
+        """
+        raise NotImplementedError
+
+    def translate_many(
+        self, texts: Sequence[str], src_lang: str, dst_lang: str
+    ) -> List[str]:
+        """
+        여러 문장을 번역한다. 반환 순서는 입력 순서와 같다.
+
+        기본 구현은 한 문장씩 translate를 호출한다.
+        """
+        return [self.translate(t, src_lang, dst_lang) for t in texts]
+
+    def warm_up(self, src_lang: str, dst_lang: str) -> None:
+        """첫 번역이 느리지 않도록 미리 준비한다. (기본: 아무것도 안 함)"""
+        return None
+
+
+class GoogleTranslationProvider(TranslationProvider):
+    """
+    Google Translate (deep_translator) 기반 번역 엔진.
+
+    - 스레드마다, 언어 쌍마다 GoogleTranslator 인스턴스를 하나씩 만들어 재사용한다.
+      (GoogleTranslator는 요청 텍스트를 인스턴스에 저장하므로 스레드끼리 공유하면
+       동시에 번역할 때 결과가 뒤바뀔 수 있다)
+    - deep_translator(requests 포함)는 첫 번역 때 import 한다. (앱 시작을 가볍게)
+    - translate_many는 문장들을 줄바꿈으로 이어 한 요청으로 보내고
+      결과를 다시 줄 단위로 나눈다. (요청당 MAX_CHARS 이하)
+    """
+
+    MAX_CHARS = 4500  # Google 요청당 5000자 제한보다 여유 있게
+    HOST = "translate.google.com"
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def _client(self, src_lang: str, dst_lang: str) -> "GoogleTranslator":
+        clients: Optional[Dict[Tuple[str, str], "GoogleTranslator"]] = getattr(
+            self._local, "clients", None
+        )
+        if clients is None:
+            clients = self._local.clients = {}
+        key = (src_lang, dst_lang)
+        client = clients.get(key)
+        if client is None:
+            from deep_translator import GoogleTranslator
+
+            client = GoogleTranslator(source=src_lang, target=dst_lang)
+            clients[key] = client
+        return client
+
+    def warm_up(self, src_lang: str, dst_lang: str) -> None:
+        """
+        deep_translator / requests를 import 하고 번역 서버 주소를 미리 조회해 둔다.
+
+        클라이언트는 스레드마다 따로 두므로 여기(워밍업 스레드)서는 만들지 않는다.
+        번역 스레드가 처음 쓸 때 만들며, import가 끝나 있으면 생성 비용은 작다.
+        """
+        import deep_translator  # noqa: F401  (import 비용을 미리 치른다)
+
+        try:
+            socket.getaddrinfo(self.HOST, 443)
+        except OSError:
+            pass  # 오프라인이면 첫 번역 때 평소처럼 실패한다
+
+    def translate(self, text: str, src_lang: str, dst_lang: str) -> str:
+        with self._lock:
+            self.requests += 1
+        return self._client(src_lang, dst_lang).translate(text)
+
+    def translate_many(
+        self, texts: Sequence[str], src_lang: str, dst_lang: str
+    ) -> List[str]:
+        results: List[str] = [""] * len(texts)
+
+        batch: List[int] = []
+        size = 0
+        for i, text in enumerate(texts):
+            if not text.strip():
+                continue
+            if "\n" in text or len(text) > self.MAX_CHARS:
+                # 줄바꿈이 있으면 결과를 나눌 수 없으므로 따로 보낸다
+                results[i] = self.translate(text, src_lang, dst_lang)
+                continue
+            if batch and size + len(text) + 1 > self.MAX_CHARS:
+                self._send_batch(texts, batch, results, src_lang, dst_lang)
+                batch, size = [], 0
+            batch.append(i)
+            size += len(text) + 1
+        if batch:
+            self._send_batch(texts, batch, results, src_lang, dst_lang)
+
+        return results
+
+    def _send_batch(
+        self,
+        texts: Sequence[str],
+        batch: List[int],
+        results: List[str],
+        src_lang: str,
+        dst_lang: str,
+    ) -> None:
+        if len(batch) == 1:
+            results[batch[0]] = self.translate(texts[batch[0]], src_lang, dst_lang)
+            return
+
+        joined = "\n".join(texts[i].strip() for i in batch)
+        parts = self.translate(joined, src_lang, dst_lang).split("\n")
+        if len(parts) != len(batch):
+            # 번역기가 줄을 합치거나 나눴으면 한 문장씩 다시 보낸다
+            for i in batch:
+                results[i] = self.translate(texts[i], src_lang, dst_lang)
+            return
+        for i, part in zip(batch, parts):
+            results[i] = part.strip()
+
+
+class LocalDictionaryProvider(TranslationProvider):
+    """
+    사전 기반 번역 엔진 (테스트 / 오프라인용).
+
+    매개변수:
+    - dictionary: {(src_lang, dst_lang): {원문: 번역문}}
+    - echo_missing: True이면 사전에 없는 문장을 원문 그대로 돌려준다 (mock)
+                    False이면 KeyError를 올린다
+    """
+
+    def __init__(
+        self,
+        dictionary: Optional[Mapping[Tuple[str, str], Mapping[str, str]]] = None,
+        echo_missing: bool = False,
+    ) -> None:
+        self._dictionary = dictionary or {}
+        self._echo_missing = echo_missing
+        self.requests = 0
+
+    def translate(self, text: str, src_lang: str, dst_lang: str) -> str:
+        self.requests += 1
+        return self._lookup(text, src_lang, dst_lang)
+
+    def translate_many(
+        self, texts: Sequence[str], src_lang: str, dst_lang: str
+    ) -> List[str]:
+        self.requests += 1
+        return [self._lookup(t, src_lang, dst_lang) for t in texts]
+
+    def _lookup(self, text: str, src_lang: str, dst_lang: str) -> str:
+        table = self._dictionary.get((src_lang, dst_lang), {})
+        key = " ".join(text.split())
+        if key in table:
+            return table[key]
+        if self._echo_missing:
+            return text
+        raise KeyError(f"no local translation for {key!r} ({src_lang}->{dst_lang})")
+
+
+_provider: Optional[TranslationProvider] = None
+_cache: Optional[TranslationCache] = None
+
+
+def get_translation_provider() -> TranslationProvider:
+    """앱 전역 번역 엔진 (기본: Google)"""
+    global _provider
+    if _provider is None:
+        _provider = GoogleTranslationProvider()
+    return _provider
+
+
+def set_translation_provider(provider: Optional[TranslationProvider]) -> None:
+    """
+    전역 번역 엔진을 교체한다. (테스트 / 오프라인 실행용)
+
+    엔진을 바꿀 때는 set_translation_cache(TranslationCache(path=None)) 등으로
+    캐시도 함께 분리하는 것이 좋다.
+    """
+    global _provider
+    _provider = provider
+
+
+def get_translation_cache() -> TranslationCache:
+    """앱 전역 번역 캐시 (처음 호출할 때 연다)"""
+    global _cache
+    if _cache is None:
+        _cache = TranslationCache()
+    return _cache
+
+
+def set_translation_cache(cache: Optional[TranslationCache]) -> None:
+    """전역 번역 캐시를 교체한다. (테스트 / 설정용)"""
+    global _cache
+    _cache = cache
+
 
 def translate(text: str, src_lang: str, dst_lang: str) -> str:
     """
-    입력 텍스트를 다른 언어로 번역한다. (Google Translate 사용)
+    입력 텍스트를 다른 언어로 번역한다.
 
     매개변수:
     - text: 번역할 원문
@@ -23,16 +254,107 @@ def translate(text: str, src_lang: str, dst_lang: str) -> str:
     - dst_lang: 대상 언어 코드 (ex. "en")
 
     반환값:
-    - 번역된 문자열
-    - 번역 불가 시 에러 메시지 반환
+    - 번역된 문자열 (캐시에 있으면 네트워크 없이 반환)
+
+    번역 엔진이 실패하면 TranslationError를 올린다. (캐시에 저장하지 않음)
+    화면에 보여 줄 오류 문구는 UI가 만든다.
     """
     normalized = text.strip()
     if not normalized:
         return ""
 
+    started = tracing.start()
+    cache = get_translation_cache()
+    cached = _cache_get(cache, normalized, src_lang, dst_lang)
+    if cached is not None:
+        tracing.finish("translate", started, source="cache")
+        return cached
+
     try:
-        translated = GoogleTranslator(source=src_lang, target=dst_lang).translate(normalized)
-        return translated
+        translated = get_translation_provider().translate(normalized, src_lang, dst_lang)
     except Exception as e:
+        tracing.finish("translate", started, source="error")
         print(f"Translation Error: {e}")
-        return f"번역 오류: {e}"
+        raise TranslationError(str(e)) from e
+
+    if translated:
+        _cache_put(cache, normalized, src_lang, dst_lang, translated)
+    tracing.finish("translate", started, source="provider")
+    return translated
+
+
+def translate_many(
+    texts: Sequence[str], src_lang: str, dst_lang: str
+) -> List[Optional[str]]:
+    """
+    여러 문장을 번역한다. (레슨 전체 등)
+
+    - 캐시에 있는 문장은 건너뛰고 나머지만 한 번에 번역 엔진에 보낸다.
+    - 번역에 실패한 문장 자리는 None이다. (캐시에 저장하지 않음)
+    """
+    cache = get_translation_cache()
+    results: List[Optional[str]] = [""] * len(texts)
+    missing: List[int] = []
+
+    for i, text in enumerate(texts):
+        normalized = text.strip()
+        if not normalized:
+            continue
+        cached = _cache_get(cache, normalized, src_lang, dst_lang)
+        if cached is not None:
+            results[i] = cached
+        else:
+            missing.append(i)
+
+    if not missing:
+        return results
+
+    try:
+        translated = get_translation_provider().translate_many(
+            [texts[i].strip() for i in missing], src_lang, dst_lang
+        )
+    except Exception as e:
+        print(f"Translation Error: {e}")
+        for i in missing:
+            results[i] = None
+        return results
+
+    for i, out in zip(missing, translated):
+        results[i] = out
+        if out:
+            _cache_put(cache, texts[i].strip(), src_lang, dst_lang, out)
+    return results
+
+
+def _cache_get(cache: TranslationCache, text: str, src_lang: str, dst_lang: str) -> Optional[str]:
+    """캐시 DB가 잠겼거나 깨졌으면 없는 것으로 보고 번역 엔진으로 넘어간다."""
+    try:
+        return cache.get(text, src_lang, dst_lang)
+    except CACHE_ERRORS as e:
+        print(f"Translation cache error: {e}")
+        return None
+
+
+def _cache_put(cache: TranslationCache, text: str, src_lang: str, dst_lang: str, translated: str) -> None:
+    """캐시에 못 써도 번역 결과는 그대로 돌려준다."""
+    try:
+        cache.put(text, src_lang, dst_lang, translated)
+    except CACHE_ERRORS as e:
+        print(f"Translation cache error: {e}")
+
+
+def prewarm_translations(phrases: Iterable[str], src_lang: str, dst_lang: str) -> int:
+    """
+    문장 목록을 미리 번역해 캐시에 채운다. (수업 시작 전 등)
+
+    반환값: 새로 캐시에 채운 문장 수
+    """
+    return get_translation_cache().prewarm(
+        phrases, src_lang, dst_lang, get_translation_provider().translate_many
+    )
+
+
+def warm_up_translation(src_lang: str, dst_lang: str) -> None:
+    """번역 캐시를 열고 번역 엔진을 준비한다. (앱 시작 워밍업용)"""
+    get_translation_cache()
+    get_translation_provider().warm_up(src_lang, dst_lang)
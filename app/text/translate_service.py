@@ -0,0 +1,121 @@
+# app/text/translate_service.py
+"""
+비동기 번역 서비스 (MODE 1)
+
+이 모듈은:
+- 블로킹 translate()를 제한된 스레드 풀에서 실행해
+  UI 이벤트 루프를 멈추지 않게 한다.
+- 같은 (원문, 언어 쌍) 요청이 진행 중이면 새로 보내지 않고 결과를 공유한다.
+- 채널(입력창 등)마다 최신 요청만 유효하게 하고, 이전 요청은 취소한다.
+- UI / Flet에 의존하지 않는다. (asyncio만 사용)
+"""
+
+from __future__ import annotations
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from .translate import translate as _translate
+from .translation_cache import CacheKey, make_key
+
+DEFAULT_MAX_WORKERS = 4
+
+
+class TranslationService:
+    """
+    asyncio 기반 번역 서비스.
+
+    - translate(): 중복 제거된 비동기 번역
+    - translate_latest(): 채널의 이전 요청을 취소하고 최신 결과만 반환
+    - cancel(): 채널의 진행 중 요청 취소 (입력 텍스트가 바뀌었을 때 등)
+    """
+
+    def __init__(
+        self,
+        translate_fn: Callable[[str, str, str], str] = _translate,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        self._translate_fn = translate_fn
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="translate"
+        )
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        self._waiters: Dict[CacheKey, int] = {}
+        self._latest: Dict[str, asyncio.Task] = {}
+
+    async def translate(self, text: str, src_lang: str, dst_lang: str) -> str:
+        """
+        번역 결과를 기다린다.
+
+        - 같은 요청이 이미 진행 중이면 그 결과를 함께 기다린다.
+        - 기다리던 쪽이 모두 취소되면 아직 시작하지 않은 작업은 풀에서 뺀다.
+        """
+        key = make_key(text, src_lang, dst_lang)
+        fut = self._inflight.get(key)
+        if fut is None:
+            loop = asyncio.get_running_loop()
+            fut = loop.run_in_executor(
+                self._executor, self._translate_fn, text, src_lang, dst_lang
+            )
+            self._inflight[key] = fut
+            self._waiters[key] = 0
+            fut.add_done_callback(lambda f, key=key: self._forget(key, f))
+
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(fut)
+        except asyncio.CancelledError:
+            if self._inflight.get(key) is fut:
+                self._waiters[key] -= 1
+                if self._waiters[key] == 0 and not fut.done():
+                    fut.cancel()
+            raise
+
+    async def translate_latest(
+        self,
+        text: str,
+        src_lang: str,
+        dst_lang: str,
+        channel: str = "default",
+    ) -> Optional[str]:
+        """
+        채널의 이전 요청을 취소하고 이번 요청의 결과를 반환한다.
+
+        이번 요청이 나중 요청이나 cancel()로 밀려나면 None을 반환한다.
+        """
+        self.cancel(channel)
+        task = asyncio.ensure_future(self.translate(text, src_lang, dst_lang))
+        self._latest[channel] = task
+        try:
+            await asyncio.wait({task})
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            if self._latest.get(channel) is task:
+                del self._latest[channel]
+
+        if task.cancelled():
+            return None
+        return task.result()
+
+    def cancel(self, channel: str = "default") -> None:
+        """채널의 진행 중 요청을 취소한다."""
+        task = self._latest.pop(channel, None)
+        if task is not None and not task.done():
+            task.cancel()
+
+    def pending(self) -> int:
+        """진행 중인 (중복 제거된) 번역 요청 수"""
+        return len(self._inflight)
+
+    def shutdown(self) -> None:
+        for task in list(self._latest.values()):
+            task.cancel()
+        self._latest.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _forget(self, key: CacheKey, fut: asyncio.Future) -> None:
+        if self._inflight.get(key) is fut:
+            del self._inflight[key]
+            self._waiters.pop(key, None)
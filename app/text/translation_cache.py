@@ -0,0 +1,281 @@
+# app/text/translation_cache.py
+"""
+번역 결과 캐시 (메모리 LRU + SQLite 디스크)
+
+이 모듈은:
+- (정규화된 원문, 원본 언어, 대상 언어)를 키로 번역 결과를 저장한다.
+- 1차: 프로세스 내 LRU (마이크로초 단위 응답)
+- 2차: SQLite 파일 (앱 재시작 후에도 유지, 오프라인에서도 응답)
+- TTL / 개수 상한으로 오래된 항목을 지운다.
+- 조회(get)는 디스크에 쓰지 않는다. 마지막 사용 시각(used)은 모아 두었다가
+  put / 정리 / close 때, 또는 _TOUCH_BATCH개가 쌓이면 한 트랜잭션으로 쓴다.
+- 성공한 번역만 저장한다. 실패 처리는 호출하는 쪽 책임이다.
+
+sqlite3를 쓸 수 없는 환경(일부 Web 빌드 등)에서는 메모리 캐시만 동작한다.
+"""
+
+from __future__ import annotations
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import sqlite3
+except ImportError:  # pragma: no cover - Pyodide 등
+    sqlite3 = None  # type: ignore[assignment]
+
+from app.utils.paths import DEFAULT_CACHE_DIR
+
+CacheKey = Tuple[str, str, str]
+
+# 디스크 캐시가 잠겨 있거나 깨졌을 때 get / put이 올릴 수 있는 예외
+CACHE_ERRORS: Tuple[type, ...] = (sqlite3.Error,) if sqlite3 is not None else ()
+
+DEFAULT_DB_PATH = os.path.join(DEFAULT_CACHE_DIR, "translations.sqlite3")
+
+DEFAULT_MEMORY_ENTRIES = 1024
+DEFAULT_DISK_ENTRIES = 50_000
+DEFAULT_TTL = 30 * 24 * 3600.0  # 30일
+
+# 디스크 개수 상한은 put 할 때마다가 아니라 이 간격으로 확인한다
+_EVICT_EVERY = 64
+
+# 모아 둔 사용 시각이 이만큼 쌓이면 한 번에 쓴다
+_TOUCH_BATCH = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    text TEXT NOT NULL,
+    src TEXT NOT NULL,
+    dst TEXT NOT NULL,
+    translated TEXT NOT NULL,
+    created REAL NOT NULL,
+    used REAL NOT NULL,
+    PRIMARY KEY (text, src, dst)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS translations_used ON translations (used);
+"""
+
+
+def make_key(text: str, src_lang: str, dst_lang: str) -> CacheKey:
+    """공백을 정리한 원문과 소문자 언어 코드로 캐시 키를 만든다."""
+    return (" ".join(text.split()), src_lang.lower(), dst_lang.lower())
+
+
+class TranslationCache:
+    """
+    2단 번역 캐시.
+
+    - get / put 은 여러 스레드에서 호출해도 안전하다.
+    - path=None 이면 디스크를 쓰지 않는다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = DEFAULT_DB_PATH,
+        max_memory: int = DEFAULT_MEMORY_ENTRIES,
+        max_disk: int = DEFAULT_DISK_ENTRIES,
+        ttl: Optional[float] = DEFAULT_TTL,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[CacheKey, Tuple[str, float]]" = OrderedDict()
+        self._max_memory = max_memory
+        self._max_disk = max_disk
+        self._ttl = ttl
+        self._puts = 0
+        # 아직 디스크에 쓰지 않은 마지막 사용 시각
+        self._touched: Dict[CacheKey, float] = {}
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._db = self._open(path) if path else None
+
+    # -------------------------
+    # 조회 / 저장
+    # -------------------------
+
+    def get(self, text: str, src_lang: str, dst_lang: str) -> Optional[str]:
+        """캐시된 번역을 반환한다. 없거나 만료되었으면 None"""
+        key = make_key(text, src_lang, dst_lang)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[1], now):
+                    self._memory.move_to_end(key)
+                    self._touch(key, now)
+                    self.memory_hits += 1
+                    return entry[0]
+                del self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT translated, created FROM translations "
+                    "WHERE text = ? AND src = ? AND dst = ?",
+                    key,
+                ).fetchone()
+                # 만료된 행은 여기서 지우지 않는다 (_evict_disk의 TTL 정리에서 지워짐)
+                if row is not None and not self._expired(row[1], now):
+                    self._remember(key, row[0], row[1])
+                    self._touch(key, now)
+                    self.disk_hits += 1
+                    return row[0]
+
+            self.misses += 1
+            return None
+
+    def put(self, text: str, src_lang: str, dst_lang: str, translated: str) -> None:
+        """성공한 번역 결과를 저장한다. 빈 결과는 저장하지 않는다."""
+        if not translated:
+            return
+        key = make_key(text, src_lang, dst_lang)
+        now = time.time()
+
+        with self._lock:
+            self._remember(key, translated, now)
+            if self._db is None:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO translations "
+                "(text, src, dst, translated, created, used) VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, translated, now, now),
+            )
+            self._touched.pop(key, None)
+            self._puts += 1
+            if self._puts % _EVICT_EVERY == 0:
+                self._evict_disk(now)
+            else:
+                self._write_touched()
+            self._db.commit()
+
+    def prewarm(
+        self,
+        phrases: Iterable[str],
+        src_lang: str,
+        dst_lang: str,
+        translate_many_fn: Callable[[Sequence[str], str, str], List[str]],
+    ) -> int:
+        """
+        문장 목록을 미리 번역해 캐시에 채운다.
+
+        - 이미 캐시에 있는 문장은 건너뛰고 나머지를 한 번에 translate_many_fn에 넘긴다.
+        - translate_many_fn 이 예외를 내면 아무것도 저장하지 않는다.
+        - 반환값: 새로 채운 문장 수
+        """
+        pending = [p for p in phrases if p.strip() and self.get(p, src_lang, dst_lang) is None]
+        if not pending:
+            return 0
+        try:
+            results = translate_many_fn(pending, src_lang, dst_lang)
+        except Exception as e:
+            print(f"Translation prewarm failed: {e}")
+            return 0
+
+        added = 0
+        for phrase, translated in zip(pending, results):
+            if translated:
+                self.put(phrase, src_lang, dst_lang, translated)
+                added += 1
+        return added
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM translations")
+                self._db.commit()
+
+    def flush(self) -> None:
+        """모아 둔 사용 시각을 디스크에 쓴다."""
+        with self._lock:
+            if self._db is not None and self._touched:
+                self._write_touched()
+                self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                if self._touched:
+                    self._write_touched()
+                    self._db.commit()
+                self._db.close()
+                self._db = None
+
+    # -------------------------
+    # 통계
+    # -------------------------
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+        }
+
+    # -------------------------
+    # 내부
+    # -------------------------
+
+    def _open(self, path: str):
+        if sqlite3 is None:
+            return None
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            db = sqlite3.connect(path, check_same_thread=False)
+            db.executescript(_SCHEMA)
+            return db
+        except Exception as e:
+            print(f"Translation cache disabled on disk ({path}): {e}")
+            return None
+
+    def _touch(self, key: CacheKey, now: float) -> None:
+        if self._db is None:
+            return
+        self._touched[key] = now
+        if len(self._touched) >= _TOUCH_BATCH:
+            # 조회 _TOUCH_BATCH번에 한 번, 한 트랜잭션으로만 쓴다
+            self._write_touched()
+            self._db.commit()
+
+    def _write_touched(self) -> None:
+        """모아 둔 사용 시각을 쓴다. (커밋은 호출하는 쪽에서)"""
+        touched, self._touched = self._touched, {}
+        if touched:
+            self._db.executemany(
+                "UPDATE translations SET used = ? WHERE text = ? AND src = ? AND dst = ?",
+                [(used, *key) for key, used in touched.items()],
+            )
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self._ttl is not None and now - created > self._ttl
+
+    def _remember(self, key: CacheKey, translated: str, created: float) -> None:
+        self._memory[key] = (translated, created)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_memory:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self, now: float) -> None:
+        assert self._db is not None
+        self._write_touched()  # LRU 순서가 최신 사용 시각을 반영하도록 먼저 쓴다
+        if self._ttl is not None:
+            self._db.execute("DELETE FROM translations WHERE created < ?", (now - self._ttl,))
+        (count,) = self._db.execute("SELECT COUNT(*) FROM translations").fetchone()
+        if count > self._max_disk:
+            self._db.execute(
+                "DELETE FROM translations WHERE (text, src, dst) IN ("
+                "SELECT text, src, dst FROM translations ORDER BY used LIMIT ?)",
+                (count - self._max_disk,),
+            )
@@ -1,6 +1,8 @@
-import threading
 import flet as ft
-from app.text.translate import translate
+from app.logic.results_store import get_results_store
+from app.text.translate import TranslationError
+from app.text.translate_service import TranslationService
+from app.utils import tracing
 
 class Mode1Section(ft.Column):
     def __init__(self, page: ft.Page, speech_backend, source_lang="ko", target_lang="es"):
@@ -12,6 +14,9 @@ class Mode1Section(ft.Column):
         self.target_lang = target_lang
         
         self.is_recording = False
+
+        # 번역은 스레드 풀에서 실행하고, 입력이 바뀌면 이전 요청은 버린다
+        self.translation_service = TranslationService()
         
         # UI Components
         # self.mode1_info = ft.Text("🎤 한국어로 말해보세요", size=18) # Removed per request
@@ -24,6 +29,7 @@ class Mode1Section(ft.Column):
             text_size=20,
             text_style=ft.TextStyle(weight=ft.FontWeight.BOLD),
             expand=True,
+            on_change=self.on_source_change,
         )
         self.mode1_translated = ft.Text("", size=26, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE)
         
@@ -112,17 +118,48 @@ class Mode1Section(ft.Column):
         self.visible = True
         self.spacing = 20
 
-    def on_translate_click(self, e):
+    async def on_translate_click(self, e):
         if not self.mode1_result.value:
             return
         
-        translated = translate(self.mode1_result.value, self.source_lang, self.target_lang)
+        try:
+            with tracing.span("mode1.translate"):
+                translated = await self.translation_service.translate_latest(
+                    self.mode1_result.value, self.source_lang, self.target_lang, channel="mode1"
+                )
+        except TranslationError as ex:
+            # 오류 문구는 화면에만 보여 준다 (기록 / 음성 합성 / 듣기 버튼 없음)
+            self.mode1_translated.value = f"번역 오류: {ex}"
+            self.mode1_translated.update()
+            self.mode1_tts_btn.disabled = True
+            self.mode1_tts_btn.update()
+            return
+        if translated is None:
+            # 입력이 바뀌었거나 더 새로운 번역 요청이 있음
+            return
         self.mode1_translated.value = translated
         self.mode1_translated.update()
-        
+
+        # 기록은 큐에 넣기만 한다 (쓰기는 백그라운드 스레드)
+        get_results_store().add_translation(
+            self.mode1_result.value, translated, self.source_lang, self.target_lang
+        )
+        # 번역 직후 듣기 버튼을 누르는 경우가 대부분이므로 음성을 미리 합성해 둔다
+        self.speech_backend.prefetch(translated, lang=self.target_lang)
+
         self.mode1_tts_btn.disabled = False
         self.mode1_tts_btn.update()
 
+    async def on_source_change(self, e):
+        # 입력 텍스트가 바뀌면 진행 중인 번역은 더 이상 의미가 없다
+        # (async 핸들러라 이벤트 루프에서 실행된다 → Task.cancel()을 바로 호출해도 안전)
+        self.translation_service.cancel("mode1")
+        self.speech_backend.cancel_prefetch()
+
+    def close(self):
+        """페이지(세션)가 닫힐 때 번역 스레드 풀을 정리한다. (이벤트 루프에서 호출)"""
+        self.translation_service.shutdown()
+
     def run_mode1(self, e=None):
         print(f"run_mode1 called. Current state: is_recording={self.is_recording}")
         
@@ -136,19 +173,22 @@ class Mode1Section(ft.Column):
                 self.mode1_start_btn.visible = False
                 self.mode1_stop_btn.visible = True
                 
-                self.mode1_result.hint_text = "듣고 있습니다... (10초 무음 시 자동 종료)"
-                # self.mode1_result.value = "듣고 있습니다... (10초 무음 시 자동 종료)"
+                self.mode1_result.hint_text = "듣고 있습니다... (말을 멈추면 자동 종료)"
+                # self.mode1_result.value = "듣고 있습니다... (말을 멈추면 자동 종료)"
                 
                 self.mode1_start_btn.update()
                 self.mode1_stop_btn.update()
                 self.mode1_result.update()
                 self.page.update()
                 
-                self.speech_backend.start_stt(on_silence=self.on_silence_detected)
+                self.speech_backend.start_stt(
+                    on_silence=self.on_silence_detected,
+                    on_partial=self.on_partial_transcript,
+                )
                 print("Backend recording started.")
                 
             else:
-                self.stop_recording_and_transcribe()
+                self.page.run_task(self.stop_recording_and_transcribe)
                 
         except Exception as ex:
             print(f"Error in run_mode1: {ex}")
@@ -161,7 +201,7 @@ class Mode1Section(ft.Column):
             self.mode1_result.update()
             self.page.update()
 
-    def stop_recording_and_transcribe(self, e=None):
+    async def stop_recording_and_transcribe(self, e=None):
         if not self.is_recording:
              return
 
@@ -175,11 +215,14 @@ class Mode1Section(ft.Column):
         self.page.update()
         
         try:
-             text = self.speech_backend.stop_stt()
+             # 인식 결과를 기다리는 동안 UI 이벤트 루프를 막지 않는다
+             with tracing.span("mode1.stop_to_text"):
+                 text = await self.speech_backend.stop_stt_async()
              print(f"Transcribed text: {text}")
              
              if text:
                  self.mode1_result.value = text
+                 get_results_store().add_transcript(text, self.source_lang, mode="mode1")
              else:
                  self.mode1_result.hint_text = "음성을 인식하지 못했습니다. 다시 시도해주세요."
                  # self.mode1_result.value = "음성을 인식하지 못했습니다. 다시 시도해주세요."
@@ -199,9 +242,14 @@ class Mode1Section(ft.Column):
         self.mode1_result.update()
         self.page.update()
 
+    def on_partial_transcript(self, text):
+        # 녹음 중에 인식된 앞부분을 먼저 보여준다 (백그라운드 스레드에서 호출됨)
+        if not self.is_recording:
+            return
+        self.mode1_result.value = text
+        self.mode1_result.update()
+
     def on_silence_detected(self):
         print("Silence detected! Auto-stopping...")
-        def stop_task():
-            self.stop_recording_and_transcribe()
-            
-        threading.Thread(target=stop_task, daemon=True).start()
+        # 오디오 콜백 스레드에서 불리므로 종료 처리는 UI 이벤트 루프로 넘긴다
+        self.page.run_task(self.stop_recording_and_transcribe)
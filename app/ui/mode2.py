@@ -1,15 +1,21 @@
-import flet as ft
+import asyncio
 
-def fake_stt_result() -> str:
-    """임시 STT 결과"""
-    return "안녕하세요"
+import flet as ft
+from app.logic.practice import PracticeItem, PracticeResult, PracticeSession, default_lesson
+from app.logic.results_store import get_results_store
 
 class Mode2Section(ft.Column):
-    def __init__(self, page: ft.Page):
+    def __init__(self, page: ft.Page, speech_backend, source_lang="ko", target_lang="es"):
         super().__init__()
         # self.page = page  <-- REMOVED: Managed by Flet Control
 
-        
+        self.speech_backend = speech_backend
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+
+        # 연습 세션 (START를 누를 때마다 새로 만든다)
+        self.session: PracticeSession | None = None
+
         self.native_sentence = ft.Text(
             "나는 오늘 커피를 마시고 싶다.",
             size=16,
@@ -20,7 +26,7 @@ class Mode2Section(ft.Column):
         self.result_text = ft.Text("")
 
         self.start_btn = ft.Button("START", on_click=self.start_practice)
-        self.stop_btn = ft.Button("STOP") # currently unused in main.py logic but present in UI
+        self.stop_btn = ft.Button("STOP", on_click=self.stop_answer, disabled=True)
 
         self.controls = [
             self.native_sentence,
@@ -41,12 +47,91 @@ class Mode2Section(ft.Column):
         self.visible = False
         self.spacing = 15
 
-    def start_practice(self, e: ft.Event) -> None:
+    async def start_practice(self, e: ft.Event) -> None:
+        if self.session is not None:
+            # 진행 중이면 START(END) 버튼은 세션 종료
+            self.session.stop()
+            return
+
+        self.session = PracticeSession(
+            self.speech_backend,
+            default_lesson(self.source_lang, self.target_lang),
+            on_item=self.on_item,
+            on_tick=self.on_tick,
+            on_partial=self.on_partial,
+            on_result=self.on_result,
+        )
+        self.start_btn.content = "END"
+        self.stop_btn.disabled = False
         self.slot_text.value = "🎰"
-        self.timer_text.value = "발음 중..."
+        self.timer_text.value = "문장 준비 중..."
+        self.result_text.value = ""
         self.page.update()
 
-        spoken = fake_stt_result()
-        self.slot_text.value = spoken
-        self.result_text.value = "정확도: 80%"
+        try:
+            await self.session.run()
+            summary = self.session.summary()
+            if summary["count"]:
+                self.timer_text.value = (
+                    f"{summary['count']}문장 · 평균 정확도: {summary['average']:.0%}"
+                )
+                missed = await self.most_missed_words()
+                if missed:
+                    self.result_text.value = f"자주 틀린 단어: {', '.join(missed)}"
+            else:
+                self.timer_text.value = "연습할 문장이 없습니다."
+        except Exception as ex:
+            print(f"Practice Error: {ex}")
+            self.timer_text.value = f"연습 오류: {ex}"
+        finally:
+            self.session = None
+            self.start_btn.content = "START"
+            self.stop_btn.disabled = True
+            self.page.update()
+
+    async def most_missed_words(self, limit: int = 5) -> list:
+        """지금까지 가장 많이 틀린 단어 (기록 저장소의 요약 테이블)"""
+        store = get_results_store()
+        # 방금 연습한 결과까지 반영되도록 큐를 비운 뒤 조회한다 (이벤트 루프는 막지 않음)
+        await asyncio.to_thread(store.flush, 2.0)
+        rows = await asyncio.to_thread(store.most_missed, self.target_lang, limit)
+        return [word for word, _, _ in rows]
+
+    def close(self) -> None:
+        """페이지(세션)가 닫힐 때 진행 중인 연습을 끝낸다. (이벤트 루프에서 호출)"""
+        if self.session is not None:
+            self.session.stop()
+
+    def stop_answer(self, e: ft.Event) -> None:
+        if self.session is not None:
+            self.session.stop_answer()
+
+    # -------------------------
+    # PracticeSession 콜백 (이벤트 루프에서 호출됨)
+    # -------------------------
+
+    def on_item(self, index: int, item: PracticeItem) -> None:
+        self.native_sentence.value = f"{index + 1}. {item.prompt}"
+        self.slot_text.value = "🎰"
+        self.page.update()
+
+    def on_tick(self, seconds_left: int) -> None:
+        self.timer_text.value = f"발음 중... {seconds_left}초"
+        self.timer_text.update()
+
+    def on_partial(self, text: str) -> None:
+        self.slot_text.value = text
+        self.slot_text.update()
+
+    def on_result(self, result: PracticeResult) -> None:
+        get_results_store().add_attempt(
+            result.item.target, result.spoken, result.accuracy, result.words,
+            result.item.lang, result.item.item_id,
+        )
+        self.slot_text.value = result.spoken or "(인식 실패)"
+        missed = [word for word, ok in result.words if not ok]
+        self.result_text.value = f"정확도: {result.accuracy:.0%}\n정답: {result.item.target}"
+        if missed:
+            self.result_text.value += f"\n틀린 단어: {', '.join(missed)}"
+        self.timer_text.value = ""
         self.page.update()
@@ -0,0 +1,24 @@
+# app/utils/paths.py
+"""
+앱이 파일을 두는 기본 위치
+
+- DEFAULT_DATA_DIR: 지워지면 안 되는 학습 기록 (복습 일정, 채점 결과)
+  환경 변수 TALKLAND_DATA_DIR로 바꿀 수 있다.
+- DEFAULT_CACHE_DIR: 언제 지워도 다시 만들 수 있는 캐시 (번역, TTS 음성)
+  환경 변수 TALKLAND_CACHE_DIR로 바꿀 수 있다.
+
+디렉터리는 쓰는 쪽에서 필요할 때 만든다.
+"""
+
+from __future__ import annotations
+import os
+
+DEFAULT_DATA_DIR = os.environ.get(
+    "TALKLAND_DATA_DIR",
+    os.path.join(os.path.expanduser("~"), ".talkland"),
+)
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "TALKLAND_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".talkland", "cache"),
+)
@@ -0,0 +1,307 @@
+# app/utils/tracing.py
+"""
+구간 시간 측정 (span / histogram)
+
+- Mode 1 한 바퀴(녹음 시작 → 말 끝 감지 → 인식 → 번역 → TTS 합성 → 첫 소리)에서
+  어디에 시간이 드는지 단계별로 잰다.
+- TALKLAND_TRACE가 없으면 꺼져 있다. 꺼져 있을 때 span()은 미리 만들어 둔
+  빈 객체를 돌려줄 뿐이라 비용이 거의 없다. (시계도 읽지 않음)
+- 켜져 있으면 이름(+ 라벨)별 히스토그램에 모은다.
+  - 고정 버킷 (Prometheus histogram)
+  - 최근 RECENT개 값 (JSON의 p50 / p95 / max)
+- TALKLAND_TRACE_INTERVAL초마다, 그리고 종료할 때 파일로 내보낸다. (임시 파일 + os.replace)
+  - *.prom: Prometheus text 형식 (node_exporter textfile collector 등)
+  - 그 외: JSON
+
+설정:
+- TALKLAND_TRACE=1                 → ~/.talkland/trace.json
+- TALKLAND_TRACE=/path/trace.prom  → 해당 파일 (Prometheus text)
+- TALKLAND_TRACE_INTERVAL=30       → 내보내기 간격(초)
+
+UI / Flet에 의존하지 않는다.
+"""
+
+from __future__ import annotations
+import atexit
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+DEFAULT_TRACE_PATH = os.path.join(os.path.expanduser("~"), ".talkland", "trace.json")
+DEFAULT_INTERVAL = 30.0
+
+# 히스토그램 버킷 상한(초)
+BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# 백분위 계산에 쓰는 최근 값 개수
+RECENT = 1024
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """이름 + 라벨 하나의 측정값 모음 (Tracer의 잠금 안에서만 갱신)"""
+
+    __slots__ = ("name", "labels", "counts", "count", "sum", "max", "recent")
+
+    def __init__(self, name: str, labels: Labels) -> None:
+        self.name = name
+        self.labels = labels
+        self.counts = [0] * (len(BUCKETS) + 1)  # 마지막 칸: +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.recent: Deque[float] = deque(maxlen=RECENT)
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.recent.append(seconds)
+
+    def as_dict(self) -> Dict[str, object]:
+        recent = sorted(self.recent)
+
+        def pct(p: float) -> Optional[float]:
+            if not recent:
+                return None
+            return round(recent[min(len(recent) - 1, int(len(recent) * p))] * 1000, 2)
+
+        return {
+            "name": self.name,
+            "labels": dict(self.labels),
+            "count": self.count,
+            "sum_ms": round(self.sum * 1000, 2),
+            "p50_ms": pct(0.5),
+            "p95_ms": pct(0.95),
+            "max_ms": round(self.max * 1000, 2),
+        }
+
+
+class Span:
+    """with 블록 하나의 시간을 잰다."""
+
+    __slots__ = ("_tracer", "_name", "_labels", "_start")
+
+    def __init__(self, tracer: "Tracer", name: str, labels: Labels) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._labels = labels
+        self._start = 0.0
+
+    def __enter__(self) -> "Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        labels = self._labels
+        if exc_type is not None:
+            labels = labels + (("error", exc_type.__name__),)
+        self._tracer.observe(self._name, time.perf_counter() - self._start, labels)
+
+
+class _NoopSpan:
+    """꺼져 있을 때 span()이 돌려주는 객체 (하나를 계속 재사용)"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """
+    히스토그램 모음 + 주기적 내보내기.
+
+    - observe(): 여러 스레드에서 호출해도 안전하다.
+    - start_exporter(): 데몬 스레드로 interval마다 export(), 종료할 때 한 번 더
+    """
+
+    def __init__(self, path: Optional[str] = None, interval: float = DEFAULT_INTERVAL) -> None:
+        self.path = path
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def observe(self, name: str, seconds: float, labels: Labels = ()) -> None:
+        key = (name, labels)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = Histogram(name, labels)
+            hist.observe(seconds)
+
+    def snapshot(self) -> List[Dict[str, object]]:
+        with self._lock:
+            return [h.as_dict() for h in self._histograms.values()]
+
+    # -------------------------
+    # 내보내기
+    # -------------------------
+
+    def export(self, path: Optional[str] = None) -> Optional[str]:
+        """파일로 내보낸다. 내보낸 경로를 반환한다. (경로가 없으면 None)"""
+        path = path or self.path
+        if not path:
+            return None
+        text = self.to_prometheus() if path.endswith(".prom") else self.to_json()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+        return path
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {"generated": time.time(), "pid": os.getpid(), "metrics": self.snapshot()},
+            ensure_ascii=False,
+            indent=1,
+        )
+
+    def to_prometheus(self) -> str:
+        with self._lock:
+            hists = sorted(self._histograms.values(), key=lambda h: (h.name, h.labels))
+            lines: List[str] = []
+            seen = set()
+            for h in hists:
+                metric = "talkland_" + h.name.replace(".", "_").replace("-", "_") + "_seconds"
+                if metric not in seen:
+                    seen.add(metric)
+                    lines.append(f"# TYPE {metric} histogram")
+                base = [f'{k}="{_escape(v)}"' for k, v in h.labels]
+                cumulative = 0
+                for bound, count in zip(BUCKETS + (float("inf"),), h.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    labels = ",".join(base + [f'le="{le}"'])
+                    lines.append(f"{metric}_bucket{{{labels}}} {cumulative}")
+                suffix = "{" + ",".join(base) + "}" if base else ""
+                lines.append(f"{metric}_sum{suffix} {h.sum:.6f}")
+                lines.append(f"{metric}_count{suffix} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def start_exporter(self) -> None:
+        if self._thread is not None or not self.path:
+            return
+        self._thread = threading.Thread(target=self._export_loop, name="trace-export", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        self._stop.set()
+        self._safe_export()
+
+    def _export_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._safe_export()
+
+    def _safe_export(self) -> None:
+        try:
+            self.export()
+        except Exception as e:
+            print(f"Trace export error: {e}")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Dict[str, object]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+# =========================
+# 모듈 API (꺼져 있으면 _tracer is None)
+# =========================
+
+_tracer: Optional[Tracer] = None
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+def span(name: str, **labels: object):
+    """
+    with tracing.span("stt.recognize", engine="google"): ...
+
+    꺼져 있으면 아무것도 하지 않는 공용 객체를 돌려준다.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP_SPAN
+    return Span(tracer, name, _labels(labels) if labels else ())
+
+
+def start() -> Optional[float]:
+    """콜백을 건너가는 구간의 시작 시각 (꺼져 있으면 None). finish()와 짝으로 쓴다."""
+    return time.perf_counter() if _tracer is not None else None
+
+
+def finish(name: str, started: Optional[float], **labels: object) -> None:
+    """start()로 받은 시각부터 지금까지를 기록한다. (started가 None이면 무시)"""
+    tracer = _tracer
+    if tracer is None or started is None:
+        return
+    tracer.observe(name, time.perf_counter() - started, _labels(labels) if labels else ())
+
+
+def record(name: str, seconds: float, **labels: object) -> None:
+    """이미 잰 시간(초)을 기록한다. (다른 프로세스가 보낸 값 등)"""
+    tracer = _tracer
+    if tracer is not None:
+        tracer.observe(name, seconds, _labels(labels) if labels else ())
+
+
+def configure(path: Optional[str] = None, interval: float = DEFAULT_INTERVAL) -> Tracer:
+    """측정을 켠다. path가 있으면 interval마다 내보낸다."""
+    global _tracer
+    if _tracer is not None:
+        _tracer.close()
+    _tracer = Tracer(path, interval)
+    _tracer.start_exporter()
+    return _tracer
+
+
+def disable() -> None:
+    """측정을 끈다. (내보내기 경로가 있으면 마지막으로 한 번 내보낸다)"""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.close()
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+def _configure_from_env() -> None:
+    value = os.environ.get("TALKLAND_TRACE", "").strip()
+    if not value or value == "0":
+        return
+    path = DEFAULT_TRACE_PATH if value == "1" else value
+    try:
+        interval = float(os.environ.get("TALKLAND_TRACE_INTERVAL", DEFAULT_INTERVAL))
+    except ValueError:
+        interval = DEFAULT_INTERVAL
+    configure(path, interval)
+
+
+_configure_from_env()
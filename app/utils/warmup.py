@@ -0,0 +1,130 @@
+# app/utils/warmup.py
+"""
+앱 시작 워밍업
+
+- 첫 마이크 / 번역 / 듣기 버튼이 늦지 않도록 무거운 초기화를 미리 해 둔다.
+  (PortAudio 장치 조회, 번역 클라이언트, TTS 워커 프로세스 등)
+- 첫 화면을 그린 뒤 자원마다 백그라운드 스레드에서 실행한다.
+- 자원별 준비 상태(pending / running / ready / failed)와 걸린 시간을 알려준다.
+- 워밍업이 실패해도 앱은 그대로 동작한다. (첫 사용 때 평소처럼 초기화됨)
+
+UI / Flet에 의존하지 않는다.
+"""
+
+from __future__ import annotations
+import threading
+import time
+from typing import Callable, Dict, Mapping, Optional
+
+PENDING = "pending"
+RUNNING = "running"
+READY = "ready"
+FAILED = "failed"
+
+WarmupTasks = Mapping[str, Callable[[], None]]
+
+
+class ResourceStatus:
+    """자원 하나의 워밍업 상태"""
+
+    __slots__ = ("name", "state", "seconds", "error", "_done")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.state = PENDING
+        self.seconds: Optional[float] = None
+        self.error: Optional[str] = None
+        self._done = threading.Event()
+
+    def as_dict(self) -> Dict[str, object]:
+        return {"state": self.state, "seconds": self.seconds, "error": self.error}
+
+
+class Warmup:
+    """
+    자원별 백그라운드 워밍업.
+
+    - start(): 작업마다 데몬 스레드 하나로 실행 (한 번만)
+    - ready(name) / wait(name): 준비 여부 확인 / 대기
+    - status(): {이름: {"state", "seconds", "error"}}
+    """
+
+    def __init__(
+        self,
+        tasks: WarmupTasks,
+        on_change: Optional[Callable[[ResourceStatus], None]] = None,
+    ) -> None:
+        """
+        tasks: {자원 이름: 초기화 함수}
+        on_change: 자원 상태가 바뀔 때마다 호출 (워밍업 스레드에서 호출됨)
+        """
+        self._tasks = dict(tasks)
+        self._on_change = on_change
+        self._status = {name: ResourceStatus(name) for name in self._tasks}
+        self._started = False
+        self._lock = threading.Lock()
+
+    def start(self) -> "Warmup":
+        with self._lock:
+            if self._started:
+                return self
+            self._started = True
+        for name, fn in self._tasks.items():
+            threading.Thread(
+                target=self._run, args=(self._status[name], fn),
+                name=f"warmup-{name}", daemon=True,
+            ).start()
+        return self
+
+    def ready(self, name: str) -> bool:
+        status = self._status.get(name)
+        return status is not None and status.state == READY
+
+    def wait(self, name: str, timeout: Optional[float] = None) -> bool:
+        """자원 워밍업이 끝날 때까지 기다린다. 준비됐으면 True."""
+        status = self._status.get(name)
+        if status is None:
+            return False
+        status._done.wait(timeout)
+        return status.state == READY
+
+    def wait_all(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        for name in self._status:
+            left = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            self.wait(name, left)
+        return all(s.state == READY for s in self._status.values())
+
+    def status(self) -> Dict[str, Dict[str, object]]:
+        return {name: s.as_dict() for name, s in self._status.items()}
+
+    def _run(self, status: ResourceStatus, fn: Callable[[], None]) -> None:
+        start = time.perf_counter()
+        self._set(status, RUNNING)
+        try:
+            fn()
+        except Exception as e:
+            status.error = f"{type(e).__name__}: {e}"
+            status.seconds = time.perf_counter() - start
+            self._set(status, FAILED)
+        else:
+            status.seconds = time.perf_counter() - start
+            self._set(status, READY)
+        finally:
+            status._done.set()
+
+    def _set(self, status: ResourceStatus, state: str) -> None:
+        status.state = state
+        if self._on_change:
+            try:
+                self._on_change(status)
+            except Exception as e:
+                print(f"Warmup callback error: {e}")
+
+
+def log_status(status: ResourceStatus) -> None:
+    """on_change용 기본 로그 출력"""
+    if status.state == READY:
+        print(f"[warmup] {status.name}: ready ({status.seconds:.2f}s)")
+    elif status.state == FAILED:
+        print(f"[warmup] {status.name}: failed ({status.error})")
@@ -0,0 +1,100 @@
+"""
+마이크 캡처 버퍼 벤치마크
+
+- sounddevice 없이 오디오 콜백을 흉내 내어 블록을 계속 넣는다.
+- 이전 방식(블록마다 indata.copy() 후 리스트에 추가, 종료 시 concatenate + int16 변환)과
+  PcmRingBuffer 방식을 비교한다.
+- 캡처 1초당 새로 살아남는 할당 수, 최대 메모리, 종료(stop) 처리 시간을 출력한다.
+
+실행: python -m benchmarks.bench_capture_buffer [녹음 길이(초)]
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from app.speech.audio_buffer import PcmRingBuffer
+
+FS = 16000
+BLOCK = 512
+
+
+def make_blocks(seconds: float):
+    rng = np.random.default_rng(0)
+    # 실제 콜백처럼 같은 입력 버퍼를 재사용한다
+    indata = (rng.standard_normal((BLOCK, 1)) * 0.1).astype(np.float32)
+    return indata, int(seconds * FS / BLOCK)
+
+
+class Legacy:
+    """이전 DesktopSpeechBackend 방식"""
+
+    def __init__(self, seconds: float) -> None:
+        self.recording = []
+
+    def write(self, indata) -> None:
+        self.recording.append(indata.copy())
+
+    def stop(self):
+        audio = np.concatenate(self.recording, axis=0)
+        return np.int16(audio * 32767).reshape(-1)
+
+
+class Ring:
+    """PcmRingBuffer 방식"""
+
+    def __init__(self, seconds: float) -> None:
+        self.ring = PcmRingBuffer(int(FS * seconds) + BLOCK, block_hint=BLOCK)
+
+    def write(self, indata) -> None:
+        self.ring.write(indata)
+
+    def stop(self):
+        return self.ring.latest()
+
+
+def measure(label, cls, indata, blocks, seconds):
+    # 1) 시간 측정 (tracemalloc 없이)
+    capture = cls(seconds)
+    start = time.perf_counter()
+    for _ in range(blocks):
+        capture.write(indata)
+    write_time = time.perf_counter() - start
+
+    # 2) 콜백 한 번마다 추적 메모리가 늘었는지로 할당 횟수를 센다
+    capture = cls(seconds)
+    tracemalloc.start()
+    allocs = 0
+    for _ in range(blocks):
+        before = tracemalloc.get_traced_memory()[0]
+        capture.write(indata)
+        if tracemalloc.get_traced_memory()[0] > before:
+            allocs += 1
+
+    start = time.perf_counter()
+    pcm = capture.stop()
+    stop_time = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{label:8s} allocs/s of capture {allocs / seconds:7.1f} | "
+        f"callback {write_time / blocks * 1e6:6.2f} us | "
+        f"peak {peak / 1e6:7.2f} MB | stop {stop_time * 1000:7.3f} ms"
+    )
+    return pcm
+
+
+def main() -> None:
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 60.0
+    indata, blocks = make_blocks(seconds)
+
+    legacy = measure("legacy", Legacy, indata, blocks, seconds)
+    ring = measure("ring", Ring, indata, blocks, seconds)
+    print(f"identical: {np.array_equal(legacy, ring)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+연습 문장 코퍼스 로드 벤치마크
+
+- 임시 디렉터리에 합성 문장 N개로 코퍼스를 만든다. (처음 한 번, 빌드 시간도 출력)
+- 측정
+  - open      : Corpus(path) (헤더 확인 + mmap)
+  - first     : 열고 나서 첫 문장 하나를 꺼내기까지
+  - random    : 무작위 위치 문장 꺼내기 (문장당)
+  - sequential: 앞에서부터 차례로 꺼내기 (초당 문장 수)
+  - vocab     : 채점용 단어 목록 첫 로드
+  - compare   : 저장된 단어 ID로 채점 (Corpus.compare, 문장당)
+- 비교용으로 같은 문장을 TSV에서 리스트로 모두 읽는 시간도 잰다.
+- open 직후 Python 힙 증가량(tracemalloc)을 보여 준다. (파일 크기와 무관해야 함)
+
+실행: python -m benchmarks.bench_corpus_load [문장 수] [코퍼스 경로]
+"""
+
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from app.logic.corpus import Corpus, build_corpus
+
+WORDS = (
+    "yo quiero beber un café hoy mañana ella él va a casa nosotros "
+    "vamos estación después de la escuela y luego cenar juntos señor niño"
+).split()
+
+
+def make_pairs(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    for i in range(count):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(4, 14))]
+        yield f"문장 {i}", " ".join(words).capitalize() + "."
+
+
+def timed(fn, repeat: int = 7) -> float:
+    """fn을 repeat번 실행한 중앙값(초)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    tmp = None
+    if len(sys.argv) > 2:
+        path = sys.argv[2]
+    else:
+        tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(tmp.name, "bench.tlc")
+
+    if not os.path.exists(path):
+        start = time.perf_counter()
+        build_corpus(path, make_pairs(count))
+        print(f"build         : {count:,} sentences in {time.perf_counter() - start:.1f} s")
+    size = sum(os.path.getsize(path + s) for s in ("", ".idx", ".vocab"))
+    print(f"corpus size   : {size / 1e6:.1f} MB")
+
+    def open_close():
+        Corpus(path).close()
+
+    open_s = timed(open_close)
+
+    def open_first():
+        with Corpus(path) as c:
+            c[0]
+
+    first_s = timed(open_first)
+
+    tracemalloc.start()
+    corpus = Corpus(path)
+    heap, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    n = len(corpus)
+    rng = random.Random(1)
+    picks = [rng.randrange(n) for _ in range(100_000)]
+    start = time.perf_counter()
+    for i in picks:
+        corpus[i]
+    random_us = (time.perf_counter() - start) / len(picks) * 1e6
+
+    seq_n = min(n, 200_000)
+    start = time.perf_counter()
+    for _, _ in zip(range(seq_n), corpus.sequential()):
+        pass
+    seq_rate = seq_n / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    corpus.word_id("")
+    vocab_ms = (time.perf_counter() - start) * 1000
+
+    sentences = [corpus[i] for i in picks[:10_000]]
+    start = time.perf_counter()
+    for s in sentences:
+        corpus.compare(s, s.target.lower(), "Beginner")
+    compare_us = (time.perf_counter() - start) / len(sentences) * 1e6
+    corpus.close()
+
+    tsv = path + ".bench.tsv"
+    if not os.path.exists(tsv):
+        with open(tsv, "w", encoding="utf-8") as f:
+            for prompt, target in make_pairs(n):
+                f.write(f"{prompt}\t{target}\n")
+
+    def read_tsv():
+        with open(tsv, encoding="utf-8") as f:
+            [line.rstrip("\n").split("\t") for line in f]
+
+    tsv_s = timed(read_tsv, repeat=3)
+
+    print(f"sentences     : {n:,}")
+    print(f"open          : {open_s * 1000:8.3f} ms")
+    print(f"open + first  : {first_s * 1000:8.3f} ms")
+    print(f"heap on open  : {heap / 1024:8.1f} KiB")
+    print(f"random access : {random_us:8.2f} us/sentence")
+    print(f"sequential    : {seq_rate:12,.0f} sentences/s")
+    print(f"vocab load    : {vocab_ms:8.2f} ms")
+    print(f"compare (ids) : {compare_us:8.2f} us/sentence")
+    print(f"TSV full load : {tsv_s * 1000:8.1f} ms (비교용)")
+
+    if tmp is not None:
+        tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+앱 시작(import) 시간 벤치마크 (python -X importtime 방식)
+
+- 새 인터프리터에서 시나리오별 코드를 -X importtime으로 실행하고
+  최상위 import의 누적 시간을 더해 콜드 스타트 import 비용을 잰다.
+- 시나리오
+  - eager  : 이전 방식 (두 백엔드 + deep_translator를 시작 시 모두 import)
+  - desktop: main + 데스크탑 백엔드 클래스 선택
+  - web    : main + 웹 백엔드 클래스 선택 (emscripten / Android와 같은 import 경로)
+- 시나리오마다 무거운 모듈(sounddevice, numpy, speech_recognition 등)이
+  실제로 import 됐는지도 함께 보여준다.
+
+실행: python -m benchmarks.bench_importtime [반복 횟수] [상위 모듈 수]
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY = ("sounddevice", "numpy", "scipy", "speech_recognition", "deep_translator", "requests")
+
+SCENARIOS = {
+    "eager": (
+        "import main\n"
+        "import app.speech.web_speech_backend, app.speech.desktop_speech_backend\n"
+        "import deep_translator, sounddevice, speech_recognition, scipy.io.wavfile\n"
+    ),
+    "desktop": (
+        "import main\n"
+        "from app.speech.speech_backend_factory import load_backend_class\n"
+        "load_backend_class('desktop')\n"
+    ),
+    "web": (
+        "import main\n"
+        "from app.speech.speech_backend_factory import load_backend_class\n"
+        "load_backend_class('web')\n"
+    ),
+}
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(code: str):
+    """(총 import 시간 us, {모듈: 누적 us}, import된 무거운 모듈, 오류)"""
+    probe = code + (
+        "import sys\n"
+        f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    total = 0
+    top = {}
+    for line in proc.stderr.splitlines():
+        m = _LINE.match(line)
+        if not m:
+            continue
+        cumulative, indent, name = int(m.group(2)), m.group(3), m.group(4)
+        if len(indent) <= 1:  # 최상위 import
+            total += cumulative
+            top[name] = top.get(name, 0) + cumulative
+    if proc.returncode != 0:
+        error = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "failed"
+        return total, top, [], error
+    lines = proc.stdout.splitlines()
+    heavy = [m for m in (lines[-1] if lines else "").split(",") if m]
+    return total, top, heavy, None
+
+
+def main() -> None:
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    show = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    for name, code in SCENARIOS.items():
+        runs = [measure(code) for _ in range(repeat)]
+        error = next((r[3] for r in runs if r[3]), None)
+        if error:
+            print(f"{name:8s}: 실행 실패 ({error})")
+            continue
+        totals = sorted(r[0] for r in runs)
+        _, top, heavy, _ = runs[len(runs) // 2]
+        print(f"{name:8s}: median {totals[len(totals) // 2] / 1000:8.1f} ms "
+              f"(min {totals[0] / 1000:.1f} ms, {repeat} runs)")
+        print(f"          heavy modules: {', '.join(heavy) or '-'}")
+        for mod, us in sorted(top.items(), key=lambda kv: -kv[1])[:show]:
+            print(f"          {us / 1000:8.1f} ms  {mod}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+normalize_spoken 마이크로 벤치마크
+
+- 이전 구현(정규식 두 번, ASCII만 유지)과 현재 구현을
+  STT 결과처럼 생긴 문자열 10만 개로 비교한다.
+- ASCII 입력에 대해서는 두 구현의 결과가 같아야 한다.
+
+실행: python -m benchmarks.bench_normalize [문자열 수]
+"""
+
+import random
+import re
+import sys
+import time
+from typing import Optional
+
+from app.text.normalize import normalize_spoken
+
+SAMPLES = [
+    "I want to drink coffee today.",
+    "Hello, how are you?  I'm fine -- thanks!",
+    "Where is the train station? It's near the park.",
+    "나는 오늘 커피를 마시고 싶다.",
+    "안녕하세요! 만나서 반갑습니다.",
+    "Quiero tomar un café, por favor.",
+    "¿Dónde está la estación? Mañana a las ocho.",
+]
+
+
+def legacy_normalize(text: Optional[str]) -> str:
+    """이전 normalize_spoken (비교용)"""
+    if not text:
+        return ""
+    text = text.lower()
+    text = re.sub(r"[^a-z0-9\s]", "", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    return text
+
+
+def make_inputs(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    out = []
+    for i in range(count):
+        s = rng.choice(SAMPLES)
+        if rng.random() < 0.5:
+            s = s.upper() if rng.random() < 0.5 else s + f" {i}"
+        out.append(s)
+    return out
+
+
+def bench(fn, inputs, **kwargs) -> float:
+    start = time.perf_counter()
+    for s in inputs:
+        fn(s, **kwargs)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    inputs = make_inputs(count)
+    ascii_inputs = [s for s in inputs if s.isascii()]
+
+    assert all(legacy_normalize(s) == normalize_spoken(s) for s in ascii_inputs)
+
+    print(f"strings: {count} (ascii {len(ascii_inputs)})")
+    for label, data in (("mixed", inputs), ("ascii", ascii_inputs)):
+        old = bench(legacy_normalize, data)
+        new = bench(normalize_spoken, data)
+        print(
+            f"{label:6s} legacy {old * 1000:8.1f} ms | "
+            f"new {new * 1000:8.1f} ms | {old / new:.2f}x"
+        )
+
+    print()
+    for s in SAMPLES[3:]:
+        print(f"{s!r:50} -> {normalize_spoken(s, 'es')!r}")
+
+
+if __name__ == "__main__":
+    main()
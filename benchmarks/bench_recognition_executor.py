@@ -0,0 +1,73 @@
+"""
+인식 워커 풀 부하 벤치마크 (키오스크처럼 발화가 연달아 들어오는 상황)
+
+- 가짜 인식기(고정 지연 + 약간의 흔들림)로 워커 수에 따른 큐 깊이 / 대기 시간을 비교한다.
+- 발화(INTERACTIVE) 사이사이에 백그라운드 재채점(BACKGROUND) 작업을 섞어 넣어
+  우선순위 처리와 배압(밀어내기 / 거절)을 확인한다.
+- 실제 STT 엔진은 부르지 않는다.
+
+실행: python -m benchmarks.bench_recognition_executor [발화 수] [인식 지연(ms)] [발화 간격(ms)]
+"""
+
+import random
+import sys
+import time
+
+from app.speech.recognition_executor import (
+    BACKGROUND,
+    INTERACTIVE,
+    QueueFull,
+    RecognitionExecutor,
+)
+
+
+def fake_recognize(latency: float, rng: random.Random) -> str:
+    time.sleep(latency * rng.uniform(0.7, 1.3))
+    return "ok"
+
+
+def run(workers: int, utterances: int, latency: float, gap: float) -> dict:
+    rng = random.Random(0)
+    executor = RecognitionExecutor(max_workers=workers, max_queue=16, default_timeout=10.0)
+    futures = []
+    for i in range(utterances):
+        try:
+            futures.append(executor.submit(fake_recognize, latency, rng, priority=INTERACTIVE))
+        except QueueFull:
+            pass  # 발화까지 거절될 정도면 워커가 부족한 것 (rejected로 집계됨)
+        for _ in range(2):
+            try:
+                executor.submit(fake_recognize, latency, rng, priority=BACKGROUND)
+            except QueueFull:
+                pass
+        time.sleep(gap)
+
+    start = time.perf_counter()
+    for f in futures:
+        f.exception()  # 타임아웃도 완료로 본다 (expired로 집계됨)
+    drain = time.perf_counter() - start
+    stats = executor.stats()
+    executor.shutdown(wait=False)
+    stats["drain_s"] = drain
+    return stats
+
+
+def main() -> None:
+    utterances = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.05
+    gap = float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 0.03
+
+    print(f"utterances {utterances} | latency {latency * 1000:.0f} ms | gap {gap * 1000:.0f} ms")
+    print("workers | max depth | wait p50 / p95 (ms) | run p50 (ms) | dropped | rejected | expired")
+    for workers in (1, 2, 4):
+        s = run(workers, utterances, latency, gap)
+        print(
+            f"{workers:7d} | {s['max_queue_depth']:9d} | "
+            f"{s['wait_ms']['p50']:8.1f} / {s['wait_ms']['p95']:8.1f} | "
+            f"{s['run_ms']['p50']:12.1f} | {s['dropped']:7d} | {s['rejected']:8d} | "
+            f"{s['expired']:7d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
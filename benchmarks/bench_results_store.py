@@ -0,0 +1,117 @@
+"""
+학습 기록 저장소 벤치마크 (이벤트 하나마다 커밋 vs write-behind)
+
+- naive       : UI 핸들러에서 INSERT + COMMIT을 바로 하는 방식 (기본 저널 모드)
+- write-behind: ResultsStore.add_attempt (큐에 넣기만 함) + 마지막 flush
+- 호출하는 쪽(UI 스레드)이 이벤트 하나에 막히는 시간 p50 / p99 / max와
+  전체를 디스크에 쓰기까지 걸린 시간을 비교한다.
+- 요약 테이블 조회(most_missed)와 같은 결과를 attempts 전체에서 계산하는 시간도 비교한다.
+
+실행: python -m benchmarks.bench_results_store [이벤트 수]
+"""
+
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from collections import Counter
+
+from app.logic.results_store import ResultsStore
+
+WORDS = "yo quiero beber un café hoy mañana ella va a casa nosotros vamos".split()
+
+
+def make_attempts(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    out = []
+    for i in range(count):
+        target = [rng.choice(WORDS) for _ in range(rng.randint(3, 8))]
+        words = [(w, rng.random() > 0.2) for w in target]
+        acc = sum(ok for _, ok in words) / len(words)
+        out.append((" ".join(target), " ".join(w for w, ok in words if ok), acc, words, i))
+    return out
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def report(name, latencies, total):
+    print(f"{name:13s}: p50 {percentile(latencies, 0.5) * 1e6:9.1f} us  "
+          f"p99 {percentile(latencies, 0.99) * 1e6:9.1f} us  "
+          f"max {max(latencies) * 1e3:7.2f} ms  total {total:6.2f} s")
+
+
+def naive(path, attempts):
+    db = sqlite3.connect(path)
+    db.execute(
+        "CREATE TABLE attempts (id INTEGER PRIMARY KEY, ts REAL, item INTEGER, lang TEXT, "
+        "target TEXT, spoken TEXT, accuracy REAL, words TEXT)"
+    )
+    latencies = []
+    start = time.perf_counter()
+    for target, spoken, acc, words, item in attempts:
+        t = time.perf_counter()
+        db.execute(
+            "INSERT INTO attempts (ts, item, lang, target, spoken, accuracy, words) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (time.time(), item, "es", target, spoken, acc, json.dumps(words)),
+        )
+        db.commit()
+        latencies.append(time.perf_counter() - t)
+    total = time.perf_counter() - start
+
+    start = time.perf_counter()
+    missed = Counter()
+    for (words,) in db.execute("SELECT words FROM attempts"):
+        for w, ok in json.loads(words):
+            if not ok:
+                missed[w] += 1
+    scan = time.perf_counter() - start
+    db.close()
+    return latencies, total, scan, [w for w, _ in missed.most_common(5)]
+
+
+def write_behind(path, attempts):
+    store = ResultsStore(path)
+    latencies = []
+    start = time.perf_counter()
+    for target, spoken, acc, words, item in attempts:
+        t = time.perf_counter()
+        store.add_attempt(target, spoken, acc, words, "es", item)
+        latencies.append(time.perf_counter() - t)
+    store.flush()
+    total = time.perf_counter() - start
+
+    start = time.perf_counter()
+    top = [w for w, _, _ in store.most_missed("es", 5)]
+    query = time.perf_counter() - start
+    stats = store.stats()
+    store.close()
+    return latencies, total, query, top, stats
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    attempts = make_attempts(count)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        n_lat, n_total, n_scan, n_top = naive(os.path.join(tmp, "naive.sqlite3"), attempts)
+        w_lat, w_total, w_query, w_top, stats = write_behind(
+            os.path.join(tmp, "store.sqlite3"), attempts
+        )
+
+    print(f"events        : {count:,}")
+    report("naive commit", n_lat, n_total)
+    report("write-behind", w_lat, w_total)
+    print(f"batches       : {stats['batches']} (dropped {stats['dropped']})")
+    print(f"most missed   : summary {w_query * 1e3:.2f} ms vs full scan {n_scan * 1e3:.1f} ms")
+    print(f"same top words: {n_top == w_top} {w_top}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+SM-2 스케줄러 벤치마크
+
+- 문장 수 × 학습자 수 규모의 복습 기록을 임시 SQLite 파일에 채운다.
+  (학습자마다 본 문장 수만큼 무작위 상태, 기본 100k 문장 × 1k 학습자 × 1k 기록 = 1M 행)
+- 측정
+  - next_due   : 인덱스로 "다음 N개" (학습자 무작위, p50 / p95)
+  - history    : 같은 결과를 학습자 기록 전체를 읽어 고르는 방식 (비교용)
+  - full scan  : 인덱스 없이 테이블 전체를 훑는 방식 (비교용, 몇 번만)
+  - record     : 결과 하나 기록 (커밋 포함)
+  - next_items : 복습 + 새 문장으로 N개 채우기
+- 결과가 같은지와 쿼리 계획도 보여 준다.
+
+실행: python -m benchmarks.bench_scheduler [문장 수] [학습자 수] [학습자당 기록 수] [N]
+"""
+
+import heapq
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from app.logic.scheduler import DAY, Scheduler, ReviewState
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def fill(scheduler: Scheduler, items: int, learners: int, per_learner: int, now: int, seed: int = 0) -> int:
+    """무작위 복습 상태를 한꺼번에 넣는다. (SM-2 계산 없이 설정용)"""
+    rng = random.Random(seed)
+    db = scheduler._db
+    total = 0
+    with db:
+        for learner in range(learners):
+            rows = []
+            for item in rng.sample(range(items), min(per_learner, items)):
+                interval = rng.choice((0, 1, 6, 15, 40, 100))
+                due = now + rng.randint(-30 * DAY, 60 * DAY)
+                rows.append(ReviewState(learner, item, due, interval, 2.5, 2, 0, 0.8).to_row())
+            db.executemany("INSERT INTO reviews VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            total += len(rows)
+    return total
+
+
+def main() -> None:
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    learners = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    per_learner = int(sys.argv[3]) if len(sys.argv) > 3 else 1_000
+    n = int(sys.argv[4]) if len(sys.argv) > 4 else 20
+    now = 1_700_000_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "reviews.sqlite3")
+        scheduler = Scheduler(path)
+
+        start = time.perf_counter()
+        rows = fill(scheduler, items, learners, per_learner, now)
+        fill_s = time.perf_counter() - start
+        size = os.path.getsize(path)
+
+        rng = random.Random(1)
+        picks = [rng.randrange(learners) for _ in range(2000)]
+        db = scheduler._db
+
+        indexed = []
+        for learner in picks:
+            start = time.perf_counter()
+            scheduler.next_due(learner, n, now)
+            indexed.append(time.perf_counter() - start)
+
+        history = []
+        same = True
+        for learner in picks[:500]:
+            start = time.perf_counter()
+            rows_l = db.execute(
+                "SELECT item, due FROM reviews WHERE learner = ?", (learner,)
+            ).fetchall()
+            best = heapq.nsmallest(n, ((due, item) for item, due in rows_l if due <= now))
+            history.append(time.perf_counter() - start)
+            expected = [due for due, _ in best]
+            got = [scheduler.get(learner, i).due for i in scheduler.next_due(learner, n, now)]
+            same = same and got == expected
+
+        full = []
+        for learner in picks[:5]:
+            start = time.perf_counter()
+            db.execute(
+                "SELECT item FROM reviews WHERE +learner = ? AND +due <= ? ORDER BY due LIMIT ?",
+                (learner, now, n),
+            ).fetchall()
+            full.append(time.perf_counter() - start)
+
+        record = []
+        for learner in picks[:500]:
+            item = rng.randrange(items)
+            start = time.perf_counter()
+            scheduler.record(learner, item, rng.random(), now)
+            record.append(time.perf_counter() - start)
+
+        fill_new = []
+        for learner in picks[:500]:
+            start = time.perf_counter()
+            scheduler.next_items(learner, n * 5, range(items), now)
+            fill_new.append(time.perf_counter() - start)
+
+        plan = db.execute(
+            "EXPLAIN QUERY PLAN SELECT item FROM reviews WHERE learner = ? AND due <= ? "
+            "ORDER BY due LIMIT ?",
+            (0, now, n),
+        ).fetchall()
+        scheduler.close()
+
+    def ms(values):
+        return (f"p50 {statistics.median(values) * 1000:8.3f} ms  "
+                f"p95 {percentile(values, 0.95) * 1000:8.3f} ms")
+
+    print(f"rows          : {rows:,} ({items:,} items x {learners:,} learners, "
+          f"{per_learner:,} each) in {fill_s:.1f} s, {size / 1e6:.1f} MB")
+    print(f"query plan    : {plan[0][-1]}")
+    print(f"next_due({n})  : {ms(indexed)}")
+    print(f"history scan  : {ms(history)} (비교용)")
+    print(f"full scan     : {ms(full)} (비교용)")
+    print(f"record        : {ms(record)}")
+    print(f"next_items({n * 5}): {ms(fill_new)}")
+    print(f"identical     : {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+score_batch 벤치마크
+
+- 같은 연습 세트를 스칼라 루프(normalize_spoken → compare_sentence → accuracy)와
+  score_batch로 각각 채점하고 초당 처리 쌍 수를 비교한다.
+- 두 결과가 정확히 같은지도 함께 확인한다.
+
+실행: python -m benchmarks.bench_score_batch [쌍 수]
+"""
+
+import random
+import sys
+import time
+
+from app.text.accuracy import accuracy
+from app.text.batch import score_batch
+from app.text.compare import compare_sentence
+from app.text.normalize import normalize_spoken
+
+WORDS = (
+    "i want to drink the coffee a of today tomorrow she he is going home "
+    "we will meet at station after school and then eat dinner together"
+).split()
+
+
+def make_pairs(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    targets, spokens = [], []
+    for _ in range(count):
+        target = [rng.choice(WORDS) for _ in range(rng.randint(4, 16))]
+        spoken = list(target)
+        # STT 오류 흉내: 삽입 / 삭제 / 치환
+        for _ in range(rng.randint(0, 3)):
+            r = rng.random()
+            if r < 0.33 and spoken:
+                del spoken[rng.randrange(len(spoken))]
+            elif r < 0.66:
+                spoken.insert(rng.randint(0, len(spoken)), rng.choice(WORDS) + "!")
+            elif spoken:
+                spoken[rng.randrange(len(spoken))] = rng.choice(WORDS).upper()
+        targets.append(" ".join(target))
+        spokens.append(" ".join(spoken))
+    return targets, spokens
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    level = "Beginner"
+    targets, spokens = make_pairs(count)
+
+    start = time.perf_counter()
+    scalar = [
+        accuracy(compare_sentence(t, normalize_spoken(s), level))
+        for t, s in zip(targets, spokens)
+    ]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = score_batch(targets, spokens, level)
+    batch_time = time.perf_counter() - start
+
+    same = all(a == b for a, b in zip(scalar, batch.accuracy.tolist()))
+
+    print(f"pairs         : {count}")
+    print(f"scalar loop   : {count / scalar_time:12,.0f} pairs/s ({scalar_time * 1000:.1f} ms)")
+    print(f"score_batch   : {count / batch_time:12,.0f} pairs/s ({batch_time * 1000:.1f} ms)")
+    print(f"speedup       : {scalar_time / batch_time:.1f}x")
+    print(f"identical     : {same}")
+
+
+if __name__ == "__main__":
+    main()
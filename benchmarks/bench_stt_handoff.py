@@ -0,0 +1,67 @@
+"""
+인식기 전달(hand-off) 지연 벤치마크
+
+- 녹음된 int16 PCM을 speech_recognition.AudioData로 만드는 데 걸리는 시간을 비교한다.
+  - 이전: 임시 WAV 파일 쓰기 → sr.AudioFile로 다시 열기 → record → 파일 삭제
+  - 현재: PCM 바이트로 AudioData를 바로 생성
+- 네트워크 인식 시간은 포함하지 않는다.
+
+실행: python -m benchmarks.bench_stt_handoff [발화 길이(초)] [임시 폴더]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import scipy.io.wavfile as wav
+import speech_recognition as sr
+
+FS = 16000
+
+
+def via_temp_file(recognizer, pcm, directory):
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False, dir=directory) as f:
+        wav.write(f.name, FS, pcm)
+        path = f.name
+    try:
+        with sr.AudioFile(path) as source:
+            return recognizer.record(source)
+    finally:
+        os.remove(path)
+
+
+def in_memory(recognizer, pcm, directory):
+    return sr.AudioData(pcm.tobytes(), FS, 2)
+
+
+def bench(fn, recognizer, pcm, directory, repeat=50):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        data = fn(recognizer, pcm, directory)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return data, times[len(times) // 2], times[int(len(times) * 0.95) - 1]
+
+
+def main() -> None:
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    directory = sys.argv[2] if len(sys.argv) > 2 else None
+
+    rng = np.random.default_rng(0)
+    pcm = (rng.standard_normal(int(FS * seconds)) * 3000).astype(np.int16)
+    recognizer = sr.Recognizer()
+
+    file_data, file_p50, file_p95 = bench(via_temp_file, recognizer, pcm, directory)
+    mem_data, mem_p50, mem_p95 = bench(in_memory, recognizer, pcm, directory)
+
+    print(f"utterance  : {seconds:.1f} s ({len(pcm)} samples)")
+    print(f"temp file  : p50 {file_p50 * 1000:7.3f} ms | p95 {file_p95 * 1000:7.3f} ms")
+    print(f"in memory  : p50 {mem_p50 * 1000:7.3f} ms | p95 {mem_p95 * 1000:7.3f} ms")
+    print(f"identical  : {file_data.get_raw_data() == mem_data.get_raw_data()}")
+
+
+if __name__ == "__main__":
+    main()
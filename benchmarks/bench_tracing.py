@@ -0,0 +1,84 @@
+"""
+구간 시간 측정(tracing) 오버헤드 벤치마크
+
+- 빈 with 블록 / span (꺼짐) / span (켜짐, 라벨 없음 / 라벨 있음) / start+finish (켜짐)
+  한 번에 드는 시간을 비교한다.
+- 켜진 상태로 모은 값을 JSON과 Prometheus text로 내보내는 시간과 결과 일부도 보여 준다.
+
+실행: python -m benchmarks.bench_tracing [반복 수]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from contextlib import nullcontext
+
+from app.utils import tracing
+
+
+def per_call(fn, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return (time.perf_counter() - start) / count
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    null = nullcontext()
+
+    def baseline():
+        with null:
+            pass
+
+    def plain():
+        with tracing.span("stt.recognize"):
+            pass
+
+    def labelled():
+        with tracing.span("stt.recognize", engine="google"):
+            pass
+
+    def start_finish():
+        tracing.finish("stt.vad_end_to_text", tracing.start())
+
+    tracing.disable()
+    base = per_call(baseline, count)
+    off = per_call(labelled, count)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tracing.configure(None)
+        on_plain = per_call(plain, count)
+        on_labelled = per_call(labelled, count)
+        on_pair = per_call(start_finish, count)
+        tracer = tracing.get_tracer()
+
+        start = time.perf_counter()
+        json_path = tracer.export(os.path.join(tmp, "trace.json"))
+        json_s = time.perf_counter() - start
+        start = time.perf_counter()
+        prom_path = tracer.export(os.path.join(tmp, "trace.prom"))
+        prom_s = time.perf_counter() - start
+        with open(prom_path, encoding="utf-8") as f:
+            prom_head = f.read().splitlines()[:3]
+        json_size = os.path.getsize(json_path)
+        snapshot = tracer.snapshot()
+        tracing.disable()
+
+    print(f"calls          : {count:,}")
+    print(f"empty with     : {base * 1e9:7.0f} ns")
+    print(f"span (off)     : {off * 1e9:7.0f} ns")
+    print(f"span (on)      : {on_plain * 1e9:7.0f} ns")
+    print(f"span+label (on): {on_labelled * 1e9:7.0f} ns")
+    print(f"start/finish   : {on_pair * 1e9:7.0f} ns")
+    print(f"export json    : {json_s * 1e3:.2f} ms ({json_size} bytes)")
+    print(f"export prom    : {prom_s * 1e3:.2f} ms")
+    for row in snapshot:
+        print(f"  {row['name']} {row['labels']} n={row['count']} p50={row['p50_ms']} ms")
+    for line in prom_head:
+        print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+로컬 Whisper 인식 실시간 배율(RTF) 벤치마크
+
+- RTF = 인식에 걸린 시간 / 오디오 길이 (1보다 작으면 실시간보다 빠름)
+- 모델 로드 시간은 따로 보고한다. (앱에서는 시작 시 백그라운드로 한 번만 로드)
+- WAV 파일(16kHz 모노)을 주면 그 소리로, 없으면 합성 신호로 측정한다.
+  (합성 신호는 인식 결과가 비어 있어도 디코딩 비용 측정에는 충분하다)
+
+실행: python -m benchmarks.bench_whisper_rtf [모델 크기] [반복 횟수] [WAV 파일]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from app.speech.whisper_engine import SAMPLE_RATE, WhisperEngine
+
+
+def load_audio(path):
+    if path is None:
+        rng = np.random.default_rng(0)
+        t = np.arange(SAMPLE_RATE * 5) / SAMPLE_RATE
+        tone = 0.2 * np.sin(2 * np.pi * 220 * t) * (np.sin(2 * np.pi * 2 * t) > 0)
+        return (tone + rng.standard_normal(len(t)) * 0.01).astype(np.float32)
+
+    import scipy.io.wavfile as wav
+
+    fs, data = wav.read(path)
+    if fs != SAMPLE_RATE:
+        raise SystemExit(f"{path}: {fs} Hz (16000 Hz WAV가 필요합니다)")
+    if data.ndim > 1:
+        data = data[:, 0]
+    return data
+
+
+def main() -> None:
+    model = sys.argv[1] if len(sys.argv) > 1 else "base"
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    path = sys.argv[3] if len(sys.argv) > 3 else None
+
+    audio = load_audio(path)
+    seconds = len(audio) / SAMPLE_RATE
+
+    engine = WhisperEngine(model, language="ko")
+    if not engine.wait_ready():
+        raise SystemExit(f"model load failed: {engine.error}")
+
+    # 첫 호출은 워밍업으로 따로 잰다
+    start = time.perf_counter()
+    text = engine.transcribe(audio)
+    first = time.perf_counter() - start
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        engine.transcribe(audio)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    p50 = times[len(times) // 2]
+
+    print(f"model      : {model} (cpu, fp16=False)")
+    print(f"load       : {engine.load_seconds:.2f} s")
+    print(f"audio      : {seconds:.1f} s")
+    print(f"first call : {first:.2f} s | RTF {first / seconds:.3f}")
+    print(f"steady p50 : {p50:.2f} s | RTF {p50 / seconds:.3f} ({repeat} runs)")
+    print(f"text       : {text!r}")
+
+
+if __name__ == "__main__":
+    main()
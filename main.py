@@ -1,6 +1,8 @@
 import flet as ft
-from app.text.translate import translate
 from app.speech.speech_backend_factory import create_speech_backend
+from app.logic.results_store import get_results_store
+from app.text.translate import warm_up_translation
+from app.utils.warmup import Warmup, log_status
 from app.ui.mode1 import Mode1Section
 from app.ui.mode2 import Mode2Section
 
@@ -34,7 +36,7 @@ def main(page: ft.Page) -> None:
     # MODE 1 & 2 UI (Refactored)
     # -----------------
     mode1_section = Mode1Section(page, speech_backend, SOURCE_LANG, TARGET_LANG)
-    mode2_section = Mode2Section(page)
+    mode2_section = Mode2Section(page, speech_backend, SOURCE_LANG, TARGET_LANG)
 
     # -----------------
     # MODE 전환 로직
@@ -50,6 +52,15 @@ def main(page: ft.Page) -> None:
 
     mode_selector.on_change = on_mode_change
 
+    async def on_close(e) -> None:
+        # 세션이 끝나면 백그라운드 자원을 정리한다 (async: 이벤트 루프에서 작업 취소)
+        # 번역 스레드 풀 → 음성 백엔드(TTS 워커 프로세스 / 인식 스레드) → MODE 2 연습 세션
+        mode1_section.close()
+        speech_backend.close()
+        mode2_section.close()
+
+    page.on_close = on_close
+
     # -----------------
     # 레이아웃
     # -----------------
@@ -62,4 +73,15 @@ def main(page: ft.Page) -> None:
         mode2_section,
     )
 
-ft.run(main)
+    # -----------------
+    # 워밍업 (첫 화면을 그린 뒤 백그라운드에서)
+    # -----------------
+    warmup_tasks = {
+        "translation": lambda: warm_up_translation(SOURCE_LANG, TARGET_LANG),
+        "results": get_results_store,
+    }
+    warmup_tasks.update(speech_backend.warmup_tasks())
+    page.data = {"warmup": Warmup(warmup_tasks, on_change=log_status).start()}
+
+if __name__ == "__main__":
+    ft.run(main)
@@ -0,0 +1,7 @@
+# tests/conftest.py
+"""저장소 루트에서 `python -m pytest` 없이 `pytest`로 실행해도 app 패키지를 찾도록 한다."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,109 @@
+# tests/test_align.py
+"""단어 정렬(app.text.align / compare) 테스트"""
+
+import random
+
+from app.text.accuracy import accuracy
+from app.text.align import DEL_COST, INS_COST, OP_DEL, OP_INS, OP_MATCH, OP_SUB, SUB_COST, align_words
+from app.text.compare import compare_sentence
+
+WORDS = "a the to of i want drink coffee tea x y".split()
+
+
+def full_cost(target, spoken, ignore):
+    """띠 없이 전체 격자를 채우는 기준 편집 거리"""
+    n, m = len(target), len(spoken)
+    dp = [[0] * (m + 1) for _ in range(n + 1)]
+    for j in range(1, m + 1):
+        dp[0][j] = dp[0][j - 1] + (0 if spoken[j - 1] in ignore else INS_COST)
+    for i in range(1, n + 1):
+        dc = 0 if target[i - 1] in ignore else DEL_COST
+        dp[i][0] = dp[i - 1][0] + dc
+        for j in range(1, m + 1):
+            diag = dp[i - 1][j - 1] + (0 if target[i - 1] == spoken[j - 1] else SUB_COST)
+            dp[i][j] = min(
+                diag,
+                dp[i - 1][j] + dc,
+                dp[i][j - 1] + (0 if spoken[j - 1] in ignore else INS_COST),
+            )
+    return dp[n][m]
+
+
+def path_cost(alignment, ignore):
+    cost = 0
+    for w in alignment.words:
+        if w.op == OP_SUB:
+            cost += SUB_COST
+        elif w.op == OP_DEL:
+            cost += 0 if w.target in ignore else DEL_COST
+        elif w.op == OP_INS:
+            cost += 0 if w.spoken in ignore else INS_COST
+    return cost
+
+
+def random_pair(rng):
+    target = [rng.choice(WORDS) for _ in range(rng.randint(0, 12))]
+    spoken = list(target)
+    for _ in range(rng.randint(0, 4)):
+        op = rng.random()
+        if op < 0.33 and spoken:
+            del spoken[rng.randrange(len(spoken))]
+        elif op < 0.66:
+            spoken.insert(rng.randint(0, len(spoken)), rng.choice(WORDS))
+        elif spoken:
+            spoken[rng.randrange(len(spoken))] = rng.choice(WORDS)
+    if rng.random() < 0.2:
+        spoken = [rng.choice(WORDS) for _ in range(rng.randint(0, 20))]
+    return target, spoken
+
+
+def test_insertion_does_not_shift_following_words():
+    result = compare_sentence("i want to drink coffee", "i really want to drink coffee", "Advanced")
+    assert result == [(w, True) for w in "i want to drink coffee".split()]
+
+
+def test_deletion_marks_only_the_missing_word():
+    result = compare_sentence("i want to drink coffee", "want to drink coffee", "Advanced")
+    assert result == [("i", False), ("want", True), ("to", True), ("drink", True), ("coffee", True)]
+
+
+def test_ignored_words_are_always_correct():
+    result = compare_sentence("i want the coffee", "i want coffee", "Beginner")
+    assert result == [("i", True), ("want", True), ("the", True), ("coffee", True)]
+
+
+def test_empty_inputs():
+    assert compare_sentence("the cat", None, None) == [("the", True), ("cat", False)]
+    assert compare_sentence("", "hello", None) == []
+    assert accuracy(compare_sentence("", "hello", None)) == 0.0
+
+
+def test_alignment_path_covers_both_sentences():
+    rng = random.Random(1)
+    for _ in range(500):
+        target, spoken = random_pair(rng)
+        alignment = align_words(target, spoken)
+        assert [w.target for w in alignment.words if w.op != OP_INS] == target
+        assert [w.spoken for w in alignment.words if w.op != OP_DEL] == spoken
+        for w in alignment.words:
+            if w.op in (OP_MATCH, OP_SUB):
+                assert (w.op == OP_MATCH) == (w.target == w.spoken)
+        assert path_cost(alignment, frozenset()) == alignment.cost
+
+
+def test_wide_band_matches_full_edit_distance():
+    rng = random.Random(2)
+    ignore = frozenset({"a", "the"})
+    for _ in range(500):
+        target, spoken = random_pair(rng)
+        band = max(len(target), len(spoken)) + 1
+        alignment = align_words(target, spoken, ignore, band=band)
+        assert alignment.cost == full_cost(target, spoken, ignore)
+        assert path_cost(alignment, ignore) == alignment.cost
+
+
+def test_default_band_is_never_cheaper_than_full():
+    rng = random.Random(3)
+    for _ in range(500):
+        target, spoken = random_pair(rng)
+        assert align_words(target, spoken).cost >= full_cost(target, spoken, frozenset())
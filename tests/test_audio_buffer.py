@@ -0,0 +1,65 @@
+# tests/test_audio_buffer.py
+"""PcmRingBuffer 테스트"""
+
+import numpy as np
+import pytest
+
+from app.speech.audio_buffer import PcmRingBuffer
+
+
+def to_int16(x):
+    return np.clip(x * 32767.0, -32768, 32767).astype(np.int16)
+
+
+def test_converts_and_reads_back():
+    buf = PcmRingBuffer(100, block_hint=16)
+    block = np.linspace(-1.2, 1.2, 40, dtype=np.float32).reshape(-1, 1)  # (frames, 1), 범위 밖 포함
+    buf.write(block)
+    assert buf.total == 40 and buf.start == 0
+    np.testing.assert_array_equal(buf.latest(), to_int16(block.reshape(-1)))
+
+
+def test_wraparound_views_are_contiguous_and_correct():
+    rng = np.random.default_rng(0)
+    capacity = 64
+    buf = PcmRingBuffer(capacity, block_hint=8)
+    written = []
+    for _ in range(50):
+        block = rng.uniform(-1, 1, rng.integers(1, 30)).astype(np.float32)
+        buf.write(block)
+        written.append(to_int16(block))
+        history = np.concatenate(written)
+        assert buf.total == len(history)
+        assert buf.start == max(0, len(history) - capacity)
+
+        latest = buf.latest()
+        assert latest.flags["C_CONTIGUOUS"]
+        np.testing.assert_array_equal(latest, history[buf.start :])
+
+        start = int(rng.integers(0, buf.total + 1))
+        end = int(rng.integers(start, buf.total + 1))
+        view = buf.view(start, end)
+        # 덮어쓰인 앞부분은 잘린다
+        np.testing.assert_array_equal(view, history[max(start, buf.start) : end])
+
+
+def test_view_shares_memory_and_block_larger_than_capacity():
+    buf = PcmRingBuffer(10)
+    buf.write(np.full(25, 0.5, dtype=np.float32))
+    assert buf.total == 25 and buf.start == 15
+    view = buf.latest()
+    assert len(view) == 10
+    assert np.shares_memory(view, buf.view(15, 25))
+    assert len(buf.view(0, 5)) == 0
+
+
+def test_reset_reuses_memory():
+    buf = PcmRingBuffer(10)
+    buf.write(np.ones(8, dtype=np.float32))
+    buf.reset()
+    assert buf.total == 0 and len(buf.latest()) == 0
+
+
+def test_rejects_non_positive_capacity():
+    with pytest.raises(ValueError):
+        PcmRingBuffer(0)
@@ -0,0 +1,63 @@
+# tests/test_batch.py
+"""score_batch가 스칼라 경로(normalize_spoken → compare_sentence → accuracy)와 같은지"""
+
+import random
+
+import pytest
+
+from app.text.accuracy import accuracy
+from app.text.batch import score_batch
+from app.text.compare import compare_sentence
+from app.text.normalize import normalize_spoken
+
+WORDS = "I want to drink the coffee a of today tomorrow She he is going home".split()
+
+
+def random_pairs(seed, count):
+    rng = random.Random(seed)
+    targets, spokens = [], []
+    for _ in range(count):
+        target = " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 15)))
+        words = target.split()
+        for _ in range(rng.randint(0, 4)):
+            op = rng.random()
+            if op < 0.33 and words:
+                del words[rng.randrange(len(words))]
+            elif op < 0.66:
+                words.insert(rng.randint(0, len(words)), rng.choice(WORDS) + rng.choice(["", ",", "!"]))
+            elif words:
+                words[rng.randrange(len(words))] = rng.choice(WORDS)
+        roll = rng.random()
+        if roll < 0.1:
+            spoken = None
+        elif roll < 0.3:
+            spoken = " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 20)))
+        else:
+            spoken = " ".join(words)
+        targets.append(target)
+        spokens.append(spoken)
+    return targets, spokens
+
+
+@pytest.mark.parametrize("level", ["Beginner", "Intermediate", "Advanced", None])
+def test_matches_scalar_path(level):
+    targets, spokens = random_pairs(1, 2000)
+    # chunk_size를 작게 잡아 여러 청크에 걸친 경우도 본다
+    result = score_batch(targets, spokens, level, chunk_size=300)
+    assert len(result) == len(targets)
+    for k, (target, spoken) in enumerate(zip(targets, spokens)):
+        expected = compare_sentence(target, normalize_spoken(spoken), level)
+        assert result.pairs(k) == expected
+        assert result.accuracy[k] == accuracy(expected)
+
+
+def test_empty_batch_and_empty_pairs():
+    assert len(score_batch([], [], None)) == 0
+    result = score_batch(["", "the cat"], [None, ""], None)
+    assert result.pairs(0) == [] and result.accuracy[0] == 0.0
+    assert result.pairs(1) == compare_sentence("the cat", "", None)
+
+
+def test_length_mismatch_is_rejected():
+    with pytest.raises(ValueError):
+        score_batch(["a"], [], None)
@@ -0,0 +1,127 @@
+# tests/test_corpus.py
+"""mmap 코퍼스 파일 형식 테스트"""
+
+import os
+import random
+
+import pytest
+
+from app.logic.corpus import Corpus, CorpusError, CorpusWriter, build_corpus
+from app.text.compare import compare_sentence
+from app.text.normalize import normalize_spoken
+
+PAIRS = [
+    ("커피 주세요.", "Un café, por favor."),
+    ("화장실이 어디예요?", "¿Dónde está el baño?"),
+    ("감사합니다!", "¡Muchas gracias!"),
+    ("내일 봐요.", "Hasta mañana."),
+]
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "lesson.tlc")
+
+
+def test_round_trip(path):
+    assert build_corpus(path, PAIRS, "ko", "es", chunk=3) == len(PAIRS)
+    with Corpus(path) as corpus:
+        assert (corpus.src_lang, corpus.dst_lang, len(corpus)) == ("ko", "es", len(PAIRS))
+        for i, (prompt, target) in enumerate(PAIRS):
+            s = corpus[i]
+            assert (s.index, s.prompt, s.target) == (i, prompt, target)
+            assert s.normalized == normalize_spoken(target, "es")
+            assert corpus.words(s) == s.normalized.split()
+        assert corpus[-1].prompt == PAIRS[-1][0]
+        with pytest.raises(IndexError):
+            corpus[len(PAIRS)]
+
+
+def test_append_keeps_word_ids(path):
+    build_corpus(path, PAIRS[:2])
+    with Corpus(path) as corpus:
+        before = {w: corpus.word_id(w) for w in corpus.vocab}
+    build_corpus(path, PAIRS[2:] + [("또 커피", "Otro café")])
+    with Corpus(path) as corpus:
+        assert len(corpus) == len(PAIRS) + 1
+        assert all(corpus.word_id(w) == i for w, i in before.items())
+        assert corpus[-1].word_ids[-1] == before["cafe"]
+        assert corpus.word_id("없는단어") == -1
+
+
+def test_truncated_tail_is_ignored_and_overwritten(path):
+    build_corpus(path, PAIRS[:2])
+    # 쓰다가 끊긴 것처럼: 데이터 뒤에 쓰레기, 인덱스에 반쪽 항목
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02\x03")
+    with open(path + ".idx", "ab") as f:
+        f.write(b"\x00\x00\x00")
+    with Corpus(path) as corpus:
+        assert len(corpus) == 2
+    build_corpus(path, PAIRS[2:])
+    with Corpus(path) as corpus:
+        assert [s.prompt for s in corpus] == [p for p, _ in PAIRS]
+
+
+def test_not_a_corpus(path):
+    for suffix in ("", ".idx"):
+        with open(path + suffix, "wb") as f:
+            f.write(b"\0" * 64)
+    with pytest.raises(CorpusError):
+        Corpus(path)
+
+
+def test_too_long_sentence_leaves_vocab_untouched(path):
+    with CorpusWriter(path) as writer:
+        writer.add(*PAIRS[0])
+        with pytest.raises(ValueError):
+            writer.add("길다", " ".join(f"w{i}" for i in range(0x10000)))
+        assert len(writer) == 1
+    with Corpus(path) as corpus:
+        assert corpus.vocab == corpus[0].normalized.split()
+
+
+def test_orders(path):
+    build_corpus(path, [(f"p{i}", f"t{i}") for i in range(30)])
+    with Corpus(path) as corpus:
+        assert [s.index for s in corpus.sequential(25)] == list(range(25, 30))
+        shuffled = [s.index for s in corpus.random(seed=1)]
+        assert sorted(shuffled) == list(range(30)) and shuffled != list(range(30))
+        assert [s.index for s in corpus.random(seed=1)] == shuffled
+        items = list(corpus.lesson("sequential"))
+        assert items[3] == corpus.practice_item(3)
+        assert (items[3].item_id, items[3].lang, items[3].normalized) == (3, "es", "t3")
+        with pytest.raises(ValueError):
+            next(corpus.lesson("bogus"))
+
+
+def test_spaced_repeats_missed_sentence(path):
+    build_corpus(path, [(f"p{i}", f"t{i}") for i in range(6)])
+    with Corpus(path) as corpus:
+        spaced = corpus.spaced(gaps=(2,))
+        seen = []
+        for s in spaced:
+            seen.append(s.index)
+            # 0번만 처음에 틀린다
+            spaced.grade(s.index, s.index != 0 or seen.count(0) > 1)
+        # 맞힌 문장은 새로 한 번 + 복습 한 번, 틀린 문장은 한 번 더
+        assert [seen.count(i) for i in range(6)] == [3, 2, 2, 2, 2, 2]
+        assert seen[:3] == [0, 1, 2] and seen[3] == 0
+
+
+def test_compare_matches_compare_sentence(path):
+    words = "el la un café por favor dónde está baño gracias hasta mañana x".split()
+    rng = random.Random(0)
+    targets = [" ".join(rng.choice(words) for _ in range(rng.randint(1, 10))) for _ in range(200)]
+    build_corpus(path, [(f"p{i}", t) for i, t in enumerate(targets)])
+    with Corpus(path) as corpus:
+        for s in corpus:
+            spoken = " ".join(rng.choice(words + ["nuevo"]) for _ in range(rng.randint(0, 12)))
+            for level in ("Beginner", "Advanced", None):
+                expected = compare_sentence(s.normalized, normalize_spoken(spoken, "es"), level)
+                assert corpus.compare(s, spoken, level) == expected
+
+
+def test_index_and_vocab_files_exist(path):
+    build_corpus(path, PAIRS)
+    assert os.path.exists(path + ".idx") and os.path.exists(path + ".vocab")
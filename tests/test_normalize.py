@@ -0,0 +1,48 @@
+# tests/test_normalize.py
+"""normalize_spoken 언어 프로필 테스트"""
+
+import unicodedata
+
+import pytest
+
+from app.text.normalize import DEFAULT_PROFILE, PROFILES, get_profile, normalize_spoken
+
+
+@pytest.mark.parametrize(
+    "text, lang, expected",
+    [
+        (None, None, ""),
+        ("", "es", ""),
+        ("Hello, World!!", None, "hello world"),
+        ("  I   want\tcoffee.\n", "en", "i want coffee"),
+        ("snake_case  x", None, "snakecase x"),
+        ("¿Dónde está el baño?", "es", "donde esta el baño"),
+        ("Mañana", "es-ES", "mañana"),
+        ("Mañana", "en", "manana"),
+        ("Café", None, "cafe"),
+        ("안녕하세요, 반가워요!", "ko", "안녕하세요 반가워요"),
+        ("Über 3 €", None, "uber 3"),
+    ],
+)
+def test_normalize(text, lang, expected):
+    assert normalize_spoken(text, lang) == expected
+
+
+def test_decomposed_input_matches_composed():
+    composed = "El niño comió"
+    decomposed = unicodedata.normalize("NFD", composed)
+    assert decomposed != composed
+    assert normalize_spoken(decomposed, "es") == normalize_spoken(composed, "es") == "el niño comio"
+
+
+def test_ascii_fast_path_matches_unicode_table():
+    text = "It's 5 O'Clock -- Time_for TEA!"
+    # 뒤에 비ASCII 공백을 붙여 유니코드 경로를 타게 한다
+    assert normalize_spoken(text + "\u00a0", "en") == normalize_spoken(text, "en")
+
+
+def test_get_profile():
+    assert get_profile("es-ES") is PROFILES["es"]
+    assert get_profile("KO") is PROFILES["ko"]
+    assert get_profile("fr") is DEFAULT_PROFILE
+    assert get_profile(None) is DEFAULT_PROFILE
@@ -0,0 +1,98 @@
+# tests/test_recognition_executor.py
+"""RecognitionExecutor 우선순위 / 배압 / 타임아웃 테스트"""
+
+import threading
+import time
+
+import pytest
+
+from app.speech.recognition_executor import BACKGROUND, INTERACTIVE, QueueFull, RecognitionExecutor
+
+
+@pytest.fixture
+def blocked():
+    """워커 하나를 막아 두고 나머지 작업을 큐에 쌓는다."""
+    executor = RecognitionExecutor(max_workers=1, max_queue=3)
+    gate = threading.Event()
+    started = threading.Event()
+
+    def hold():
+        started.set()
+        gate.wait(5)
+
+    first = executor.submit(hold)
+    assert started.wait(5)
+    yield executor, gate, first
+    gate.set()
+    executor.shutdown()
+
+
+def test_interactive_runs_before_background(blocked):
+    executor, gate, _ = blocked
+    order = []
+    futures = [
+        executor.submit(order.append, "bg1", priority=BACKGROUND),
+        executor.submit(order.append, "live", priority=INTERACTIVE),
+        executor.submit(order.append, "bg2", priority=BACKGROUND),
+    ]
+    gate.set()
+    for f in futures:
+        f.result(5)
+    assert order == ["live", "bg1", "bg2"]
+
+
+def test_full_queue_drops_lower_priority_then_rejects(blocked):
+    executor, gate, _ = blocked
+    background = [executor.submit(lambda: None, priority=BACKGROUND) for _ in range(3)]
+    live = executor.submit(lambda: "live", priority=INTERACTIVE)
+    # 가장 늦게 들어온 백그라운드 작업이 밀려난다
+    with pytest.raises(QueueFull):
+        background[-1].result(1)
+    more = [executor.submit(lambda: None, priority=INTERACTIVE) for _ in range(2)]
+    with pytest.raises(QueueFull):
+        executor.submit(lambda: None, priority=INTERACTIVE)
+    with pytest.raises(QueueFull):
+        background[-2].result(1)
+
+    gate.set()
+    assert live.result(5) == "live"
+    for f in more:
+        f.result(5)
+    stats = executor.stats()
+    assert stats["dropped"] == 3 and stats["rejected"] == 1
+
+
+def test_job_past_deadline_is_not_started(blocked):
+    executor, gate, _ = blocked
+    ran = []
+    future = executor.submit(ran.append, 1, timeout=0.01)
+    time.sleep(0.05)
+    gate.set()
+    with pytest.raises(TimeoutError):
+        future.result(5)
+    assert ran == [] and executor.stats()["expired"] == 1
+
+
+def test_run_timeout_cancels_job_that_has_not_started(blocked):
+    executor, gate, _ = blocked
+    ran = []
+    with pytest.raises(TimeoutError):
+        executor.run(ran.append, 1, timeout=0.05)
+    gate.set()
+    # 취소된 작업은 건너뛰고 워커는 계속 동작한다
+    assert executor.run(lambda: "ok") == "ok"
+    assert ran == []
+
+
+def test_errors_reach_the_caller():
+    executor = RecognitionExecutor(max_workers=1)
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        executor.run(fail)
+    assert executor.stats()["failed"] == 1
+    executor.shutdown()
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
@@ -0,0 +1,74 @@
+# tests/test_results_store.py
+"""write-behind 학습 기록 저장소 테스트"""
+
+import sqlite3
+import time
+
+import pytest
+
+from app.logic.results_store import ResultsStore, day_of
+
+
+@pytest.fixture
+def store():
+    s = ResultsStore(None, flush_interval=0.05)
+    yield s
+    s.close()
+
+
+def test_add_returns_before_write_and_flush_persists(store):
+    store.add_transcript("hola", "es")
+    store.add_translation("안녕", "hola", "ko", "es")
+    store.add_transcript("", "es")  # 빈 문장은 무시
+    assert store.flush(5)
+    assert store.stats()["written"] == 2
+    assert store._query("SELECT text FROM transcripts", ()) == [("hola",)]
+
+
+def test_attempt_summaries(store):
+    store.add_attempt("un café", "un cafe", 1.0, [("un", True), ("cafe", True)], "es", item=3)
+    store.add_attempt("el baño", "el", 0.5, [("el", True), ("baño", False)], "es")
+    store.add_attempt("el baño", "", 0.0, [("el", False), ("baño", False)], "es")
+    assert store.flush(5)
+
+    (today, attempts, avg), = store.accuracy_over_time()
+    assert today == day_of(time.time())
+    assert attempts == 3 and avg == pytest.approx(0.5)
+    assert store.most_missed("es") == [("baño", 2, 2), ("el", 1, 2)]
+    assert store.most_missed("ko") == []
+    recent = store.recent_attempts(2)
+    assert [r["spoken"] for r in recent] == ["", "el"]
+    assert store.recent_attempts(3)[-1]["item"] == 3
+
+
+def test_batches_writes(store):
+    for i in range(100):
+        store.add_transcript(f"t{i}", "es")
+    assert store.flush(5)
+    stats = store.stats()
+    assert stats["written"] == 100 and stats["batches"] < 10
+
+
+def test_full_queue_drops_instead_of_blocking():
+    store = ResultsStore(None, flush_interval=0.05, max_queue=1)
+    # 쓰기 스레드가 큐를 비우기 전에 여러 개를 넣으면 일부는 버려진다
+    for i in range(1000):
+        store.add_transcript(f"t{i}", "es")
+    assert store.flush(5)
+    stats = store.stats()
+    assert stats["written"] + stats["dropped"] == 1000 and stats["dropped"] > 0
+    store.close()
+
+
+def test_close_writes_pending_and_is_idempotent(tmp_path):
+    path = str(tmp_path / "results.sqlite3")
+    store = ResultsStore(path, flush_interval=60)
+    store.add_transcript("adiós", "es")
+    store.close()
+    store.close()
+    store.add_transcript("ignored", "es")  # 닫힌 뒤에는 버린다
+
+    db = sqlite3.connect(path)
+    assert db.execute("SELECT text FROM transcripts").fetchall() == [("adiós",)]
+    assert db.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    db.close()
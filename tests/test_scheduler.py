@@ -0,0 +1,127 @@
+# tests/test_scheduler.py
+"""SM-2 스케줄러 테스트"""
+
+import threading
+
+import pytest
+
+from app.logic.scheduler import (
+    DAY,
+    INITIAL_EASE,
+    MIN_EASE,
+    RELEARN_SECONDS,
+    ReviewState,
+    Scheduler,
+    quality_from_accuracy,
+    sm2_update,
+)
+
+NOW = 1_700_000_000
+
+
+@pytest.fixture
+def scheduler():
+    s = Scheduler(None)
+    yield s
+    s.close()
+
+
+def test_quality_from_accuracy():
+    accs = (0.0, 0.09, 0.1, 0.5, 0.59, 0.6, 1.0)
+    assert [quality_from_accuracy(a) for a in accs] == [0, 0, 1, 3, 3, 3, 5]
+
+
+def test_sm2_intervals_grow_and_failures_relearn():
+    state = sm2_update(None, 0, 1, 5, NOW)
+    assert (state.interval, state.reps, state.due) == (1, 1, NOW + DAY)
+    assert state.ease == pytest.approx(INITIAL_EASE + 0.1)
+    state = sm2_update(state, 0, 1, 5, NOW)
+    assert state.interval == 6
+    previous = state
+    state = sm2_update(state, 0, 1, 4, NOW)
+    assert state.interval == round(6 * previous.ease) and state.reps == 3
+
+    state = sm2_update(state, 0, 1, 1, NOW)
+    assert (state.interval, state.reps, state.lapses) == (0, 0, 1)
+    assert state.due == NOW + RELEARN_SECONDS
+
+
+def test_ease_never_drops_below_minimum():
+    state = None
+    for _ in range(20):
+        state = sm2_update(state, 0, 1, 0, NOW)
+    assert state.ease == MIN_EASE
+
+
+def test_state_round_trips_through_row():
+    state = sm2_update(None, 3, 7, 4, NOW)
+    assert ReviewState.from_row(state.to_row()) == state
+
+
+def test_record_and_due_order(scheduler):
+    for item, acc in ((1, 1.0), (2, 0.2), (3, 1.0)):
+        scheduler.record(0, item, acc, now=NOW)
+    scheduler.record(1, 9, 0.0, now=NOW)  # 다른 학습자
+    assert scheduler.next_due(0, now=NOW) == []
+    assert scheduler.next_due(0, now=NOW + RELEARN_SECONDS) == [2]
+    assert scheduler.next_due(0, now=NOW + DAY) == [2, 1, 3]
+    assert scheduler.next_due(0, n=2, now=NOW + DAY) == [2, 1]
+    assert scheduler.due_count(0, now=NOW + DAY) == 3
+    assert scheduler.get(0, 2).lapses == 1
+
+
+def test_record_many_matches_record(scheduler):
+    other = Scheduler(None)
+    results = [(0, 1, 0.9), (0, 2, 0.3), (0, 1, 1.0)]
+    assert scheduler.record_many(results, now=NOW) == 3
+    for learner, item, acc in results:
+        other.record(learner, item, acc, now=NOW)
+    for item in (1, 2):
+        assert scheduler.get(0, item) == other.get(0, item)
+    other.close()
+
+
+def test_next_items_fills_with_unseen(scheduler):
+    scheduler.record(0, 0, 1.0, now=NOW - 2 * DAY)  # 복습할 때가 됨
+    scheduler.record(0, 1, 1.0, now=NOW)  # 아직 아님
+    items = scheduler.next_items(0, 3, iter(range(10)), now=NOW)
+    assert items == [0, 2, 3]
+
+
+def test_lesson_relearns_failed_items_until_recorded(scheduler):
+    lesson = scheduler.lesson(range(2), wait=1.0)
+    seen = []
+    wrong = {1: 1}
+    for item in lesson:
+        seen.append(item)
+        acc = 0.0 if wrong.get(item) else 1.0
+        wrong[item] = 0
+        scheduler.record(0, item, acc)
+    assert seen == [0, 1, 1]
+
+
+def test_lesson_waits_for_pending_item(scheduler):
+    lesson = scheduler.lesson(range(1), wait=5.0)
+    assert next(lesson) == 0
+    # 채점 중인 문장이 틀린 것으로 기록되면 다시 나온다
+    threading.Timer(0.05, scheduler.record, (0, 0, 0.0)).start()
+    assert next(lesson) == 0
+    scheduler.record(0, 0, 1.0)
+    assert next(lesson, None) is None
+
+
+def test_release_ends_waiting_lesson(scheduler):
+    lesson = scheduler.lesson(range(1), wait=5.0)
+    assert next(lesson) == 0
+    threading.Timer(0.05, scheduler.release, (0, [0])).start()
+    assert next(lesson, None) is None
+
+
+def test_closed_scheduler_raises(scheduler):
+    scheduler.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        scheduler.record(0, 1, 1.0)
+    with pytest.raises(RuntimeError, match="closed"):
+        scheduler.next_due(0)
+    with pytest.raises(RuntimeError, match="closed"):
+        next(scheduler.lesson(range(3)))
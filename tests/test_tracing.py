@@ -0,0 +1,87 @@
+# tests/test_tracing.py
+"""구간 시간 측정(tracing) 테스트"""
+
+import json
+
+import pytest
+
+from app.utils import tracing
+from app.utils.tracing import BUCKETS, Tracer
+
+
+@pytest.fixture(autouse=True)
+def tracing_off():
+    tracing.disable()
+    yield
+    tracing.disable()
+
+
+def test_disabled_is_noop():
+    assert not tracing.enabled()
+    assert tracing.start() is None
+    with tracing.span("stt.recognize", engine="google") as s:
+        pass
+    assert s is tracing.span("other")  # 같은 공용 객체
+    tracing.finish("x", None)
+    tracing.record("x", 1.0)
+    assert tracing.get_tracer() is None
+
+
+def test_span_records_labels_and_errors():
+    tracer = tracing.configure(None)
+    with tracing.span("stt.recognize", engine="google"):
+        pass
+    with pytest.raises(ValueError):
+        with tracing.span("stt.recognize", engine="google"):
+            raise ValueError
+    tracing.finish("translate", tracing.start(), source="cache")
+    tracing.record("tts.synth", 0.2)
+
+    rows = {(r["name"], tuple(sorted(r["labels"].items()))): r for r in tracer.snapshot()}
+    assert rows[("stt.recognize", (("engine", "google"),))]["count"] == 1
+    assert rows[("stt.recognize", (("engine", "google"), ("error", "ValueError")))]["count"] == 1
+    assert rows[("translate", (("source", "cache"),))]["count"] == 1
+    synth = rows[("tts.synth", ())]
+    assert synth["p50_ms"] == synth["max_ms"] == pytest.approx(200.0)
+
+
+def test_histogram_buckets_and_percentiles():
+    tracer = Tracer()
+    for ms in range(1, 101):
+        tracer.observe("stt.vad_end", ms / 1000)
+    (row,) = tracer.snapshot()
+    assert row["count"] == 100
+    assert row["p50_ms"] == pytest.approx(51.0)
+    assert row["p95_ms"] == pytest.approx(96.0)
+    assert row["max_ms"] == pytest.approx(100.0)
+    assert row["sum_ms"] == pytest.approx(5050.0)
+
+
+def test_prometheus_export(tmp_path):
+    tracer = Tracer()
+    tracer.observe("stt.recognize", 0.003, (("engine", 'go"og'),))
+    tracer.observe("stt.recognize", 0.2, (("engine", 'go"og'),))
+    tracer.observe("stt.recognize", 60.0, (("engine", 'go"og'),))
+    path = tracer.export(str(tmp_path / "trace.prom"))
+    lines = open(path, encoding="utf-8").read().splitlines()
+
+    metric = "talkland_stt_recognize_seconds"
+    assert lines[0] == f"# TYPE {metric} histogram"
+    buckets = [line for line in lines if line.startswith(metric + "_bucket")]
+    assert len(buckets) == len(BUCKETS) + 1
+    assert buckets[0] == metric + '_bucket{engine="go\\"og",le="0.005"} 1'
+    assert buckets[-1] == metric + '_bucket{engine="go\\"og",le="+Inf"} 3'
+    counts = [int(line.rsplit(" ", 1)[1]) for line in buckets]
+    assert counts == sorted(counts)  # 누적
+    assert metric + '_count{engine="go\\"og"} 3' in lines
+
+
+def test_json_export_and_close(tmp_path):
+    path = str(tmp_path / "sub" / "trace.json")
+    tracer = tracing.configure(path, interval=3600)
+    tracing.record("translate", 0.01, source="provider")
+    tracing.disable()  # 끌 때 한 번 더 내보낸다
+    data = json.load(open(path, encoding="utf-8"))
+    assert [m["name"] for m in data["metrics"]] == ["translate"]
+    assert tracer.export(None) == path
+    assert Tracer().export() is None
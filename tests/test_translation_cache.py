@@ -0,0 +1,137 @@
+# tests/test_translation_cache.py
+"""번역 캐시(메모리 LRU + SQLite) 테스트"""
+
+import sqlite3
+
+import pytest
+
+from app.text import translate as tr
+from app.text import translation_cache
+from app.text.translate import LocalDictionaryProvider
+from app.text.translation_cache import TranslationCache
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "translations.sqlite3")
+
+
+def test_key_ignores_whitespace_and_language_case():
+    cache = TranslationCache(path=None)
+    cache.put("  안녕   하세요 ", "ko", "es", "hola")
+    assert cache.get("안녕 하세요", "KO", "ES") == "hola"
+    assert cache.get("안녕 하세요", "ko", "en") is None
+
+
+def test_empty_translation_is_not_stored():
+    cache = TranslationCache(path=None)
+    cache.put("안녕", "ko", "es", "")
+    assert cache.get("안녕", "ko", "es") is None
+
+
+def test_memory_lru_keeps_recently_used():
+    cache = TranslationCache(path=None, max_memory=2)
+    cache.put("a", "ko", "es", "A")
+    cache.put("b", "ko", "es", "B")
+    assert cache.get("a", "ko", "es") == "A"  # a가 최근 사용
+    cache.put("c", "ko", "es", "C")
+    assert cache.get("b", "ko", "es") is None
+    assert cache.get("a", "ko", "es") == "A"
+    assert cache.get("c", "ko", "es") == "C"
+
+
+def test_disk_survives_reopen(db_path):
+    cache = TranslationCache(db_path)
+    cache.put("고마워요", "ko", "es", "gracias")
+    cache.close()
+
+    cache = TranslationCache(db_path)
+    assert cache.get("고마워요", "ko", "es") == "gracias"
+    assert cache.disk_hits == 1
+    assert cache.get("고마워요", "ko", "es") == "gracias"
+    assert cache.memory_hits == 1
+    cache.close()
+
+
+def test_expired_entries_are_misses(db_path, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(translation_cache.time, "time", lambda: now[0])
+    cache = TranslationCache(db_path, ttl=60)
+    cache.put("물", "ko", "es", "agua")
+    now[0] += 61
+    assert cache.get("물", "ko", "es") is None
+    cache.close()
+
+
+def test_get_does_not_write_until_flush(db_path, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(translation_cache.time, "time", lambda: now[0])
+    cache = TranslationCache(db_path)
+    cache.put("빵", "ko", "es", "pan")
+    now[0] += 10
+
+    reader = sqlite3.connect(db_path)
+    used = "SELECT used FROM translations WHERE text = '빵'"
+    assert cache.get("빵", "ko", "es") == "pan"
+    assert reader.execute(used).fetchone() == (1_000_000.0,)
+    cache.flush()
+    assert reader.execute(used).fetchone() == (1_000_010.0,)
+    reader.close()
+    cache.close()
+
+
+def test_disk_eviction_drops_least_recently_used(db_path, monkeypatch):
+    monkeypatch.setattr(translation_cache, "_EVICT_EVERY", 1)
+    now = [1_000_000.0]
+    monkeypatch.setattr(translation_cache.time, "time", lambda: now[0])
+    cache = TranslationCache(db_path, max_memory=1, max_disk=2)
+    for text in ("a", "b"):
+        cache.put(text, "ko", "es", text.upper())
+        now[0] += 1
+    assert cache.get("a", "ko", "es") == "A"  # 디스크에서 읽고 사용 시각 갱신
+    now[0] += 1
+    cache.put("c", "ko", "es", "C")
+    cache.close()
+
+    cache = TranslationCache(db_path)
+    assert cache.get("b", "ko", "es") is None
+    assert cache.get("a", "ko", "es") == "A"
+    assert cache.get("c", "ko", "es") == "C"
+    cache.close()
+
+
+def test_prewarm_translates_only_missing():
+    cache = TranslationCache(path=None)
+    cache.put("하나", "ko", "es", "uno")
+    calls = []
+
+    def translate_many(texts, src, dst):
+        calls.append(list(texts))
+        return [t.upper() for t in texts]
+
+    assert cache.prewarm(["하나", "둘", " "], "ko", "es", translate_many) == 1
+    assert calls == [["둘"]]
+
+
+@pytest.fixture
+def local_translation():
+    provider = LocalDictionaryProvider({("ko", "es"): {"하나": "uno", "둘": "dos"}})
+    tr.set_translation_provider(provider)
+    yield provider
+    tr.set_translation_provider(None)
+    tr.set_translation_cache(None)
+
+
+def test_translate_uses_cache(local_translation):
+    tr.set_translation_cache(TranslationCache(path=None))
+    assert tr.translate("하나", "ko", "es") == "uno"
+    assert tr.translate(" 하나 ", "ko", "es") == "uno"
+    assert local_translation.requests == 1
+
+
+def test_translate_falls_back_when_cache_db_fails(local_translation, db_path):
+    cache = TranslationCache(db_path)
+    tr.set_translation_cache(cache)
+    cache._db.close()  # 잠기거나 깨진 DB 대신
+    assert tr.translate("하나", "ko", "es") == "uno"
+    assert tr.translate_many(["둘", "하나"], "ko", "es") == ["dos", "uno"]
@@ -0,0 +1,74 @@
+# tests/test_tts_cache.py
+"""TTS 음성 디스크 캐시 테스트"""
+
+import os
+import time
+
+import pytest
+
+from app.speech.tts_cache import TtsAudioCache, make_key, rate_for, voice_for
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "tts")
+
+
+def test_key_and_voice_helpers():
+    assert make_key(" hola   mundo ", "v", "+0%") == make_key("hola mundo", "v", "+0%")
+    assert make_key("hola", "v", "+0%") != make_key("hola", "v", rate_for(True))
+    assert voice_for("es-ES") == voice_for("es") != voice_for("ko")
+    assert voice_for("xx") == voice_for("ko")
+
+
+def test_put_get_and_stats(cache_dir):
+    cache = TtsAudioCache(cache_dir)
+    assert cache.get("hola", "v", "+0%") is None
+    path = cache.put("hola", "v", "+0%", b"mp3")
+    assert cache.get("hola", "v", "+0%") == path
+    assert open(path, "rb").read() == b"mp3"
+    assert cache.missing(["hola", "adiós", "adiós", " "], "v", "+0%") == ["adiós"]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["bytes"]) == (1, 1, 3)
+
+
+def test_writer_commit_and_abort(cache_dir):
+    cache = TtsAudioCache(cache_dir)
+    writer = cache.open_writer("uno", "v", "+0%")
+    writer.write(b"ab")
+    assert not cache.contains("uno", "v", "+0%")
+    writer.write(b"cd")
+    assert open(writer.commit(), "rb").read() == b"abcd"
+
+    writer = cache.open_writer("dos", "v", "+0%")
+    writer.write(b"xx")
+    writer.abort()
+    assert not cache.contains("dos", "v", "+0%")
+    assert os.listdir(cache_dir) == [os.path.basename(cache.path_for("uno", "v", "+0%"))]
+
+
+def test_evicts_least_recently_used(cache_dir):
+    cache = TtsAudioCache(cache_dir, max_bytes=250)
+    now = time.time()
+    for i, text in enumerate(("a", "b", "c")):
+        path = cache.put(text, "v", "+0%", b"x" * 100 if i < 2 else b"y" * 10)
+        os.utime(path, (now - 100 + i, now - 100 + i))
+    os.utime(cache.path_for("a", "v", "+0%"), (now, now))  # a를 최근에 씀
+    cache.put("d", "v", "+0%", b"z" * 100)
+    assert cache.contains("a", "v", "+0%") and cache.contains("d", "v", "+0%")
+    assert not cache.contains("b", "v", "+0%")
+    assert cache.stats()["bytes"] <= 250
+
+
+def test_stale_part_files_are_removed_on_open(cache_dir):
+    os.makedirs(cache_dir)
+    stale = os.path.join(cache_dir, "old.part")
+    fresh = os.path.join(cache_dir, "new.part")
+    for path in (stale, fresh):
+        with open(path, "wb") as f:
+            f.write(b"partial")
+    old = time.time() - 2 * 3600
+    os.utime(stale, (old, old))
+    TtsAudioCache(cache_dir)
+    assert not os.path.exists(stale)
+    assert os.path.exists(fresh)  # 다른 프로세스가 쓰는 중일 수 있다
@@ -0,0 +1,76 @@
+# tests/test_tts_stream.py
+"""Mp3Segmenter 테스트 (합성 프레임)"""
+
+import pytest
+
+from app.speech.tts_stream import Mp3Segmenter, parse_frame_header
+
+# MPEG-2 Layer III, 48 kbps, 24 kHz, 모노 → 144바이트 / 576샘플
+HEADER = bytes((0xFF, 0xF3, 0x64, 0xC4))
+FRAME_LEN = 144
+FRAME_SAMPLES = 576
+
+
+def frame(tag: int) -> bytes:
+    return HEADER + bytes([tag]) * (FRAME_LEN - 4)
+
+
+def info_frame() -> bytes:
+    body = bytearray(FRAME_LEN - 4)
+    body[9:13] = b"Info"  # MPEG-2 모노: side info 9바이트 뒤
+    return HEADER + bytes(body)
+
+
+def id3_tag(size: int) -> bytes:
+    syncsafe = bytes(((size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F))
+    return b"ID3\x04\x00\x00" + syncsafe + b"\0" * size
+
+
+def test_parse_frame_header():
+    assert parse_frame_header(HEADER) == (FRAME_LEN, 24000, FRAME_SAMPLES)
+    # MPEG-1 Layer III 128 kbps 44.1 kHz, padding
+    assert parse_frame_header(bytes((0xFF, 0xFB, 0x92, 0x00))) == (418, 44100, 1152)
+    assert parse_frame_header(b"ID3\x04") is None
+    assert parse_frame_header(bytes((0xFF, 0xFD, 0x64, 0xC4))) is None  # Layer II
+    assert parse_frame_header(HEADER[:3]) is None
+
+
+def segments_for(stream: bytes, chunk: int, **kwargs):
+    seg = Mp3Segmenter(**kwargs)
+    out = []
+    for i in range(0, len(stream), chunk):
+        out += seg.feed(stream[i : i + chunk])
+    return seg, out + seg.finish()
+
+
+@pytest.mark.parametrize("chunk", [1, 100, 1000, 100_000])
+def test_segments_cover_every_frame_once(chunk):
+    frames = [frame(i) for i in range(40)]
+    stream = id3_tag(30) + info_frame() + b"".join(frames) + b"\xff\xf3\x64"  # 끝에 잘린 헤더
+    seg, segments = segments_for(stream, chunk, first_frames=4, max_frames=16, overlap_frames=2)
+
+    assert seg.frames == 40
+    assert [s.samples // FRAME_SAMPLES for s in segments] == [4, 8, 16, 12]
+    assert all(s.sample_rate == 24000 for s in segments)
+    new = b""
+    for k, s in enumerate(segments):
+        overlap = 0 if k == 0 else 2
+        assert s.skip_samples == overlap * FRAME_SAMPLES
+        assert len(s.data) == (overlap * FRAME_SAMPLES + s.samples) // FRAME_SAMPLES * FRAME_LEN
+        new += s.data[overlap * FRAME_LEN :]
+        if k:
+            # 겹침 프레임은 앞 구간의 마지막 프레임들
+            assert s.data[: overlap * FRAME_LEN] == segments[k - 1].data[-overlap * FRAME_LEN :]
+    assert new == b"".join(frames)
+
+
+def test_resyncs_after_garbage():
+    stream = frame(1) + b"\x00\x12garbage" + frame(2) + frame(3)
+    _, segments = segments_for(stream, 7, first_frames=8)
+    assert len(segments) == 1
+    assert segments[0].data == frame(1) + frame(2) + frame(3)
+
+
+def test_empty_stream():
+    seg = Mp3Segmenter()
+    assert seg.feed(b"") == [] and seg.finish() == []
@@ -0,0 +1,100 @@
+# tests/test_vad.py
+"""에너지 VAD 테스트 (합성 신호)"""
+
+import numpy as np
+import pytest
+
+from app.speech.vad import NO_SPEECH, SEGMENT, UTTERANCE_END, VadConfig, VoiceActivityDetector
+
+SR = 16000
+NOISE = 0.01
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+def noise(rng, seconds, rms=NOISE):
+    return (rng.standard_normal(int(seconds * SR)) * rms).astype(np.float32)
+
+
+def voice(rng, seconds, rms):
+    t = np.arange(int(seconds * SR)) / SR
+    tone = np.sin(2 * np.pi * 220 * t) * rms * np.sqrt(2)
+    return (tone + noise(rng, seconds)).astype(np.float32)
+
+
+def run(signal, block=1024, config=None):
+    vad = VoiceActivityDetector(config)
+    events = []
+    for i in range(0, len(signal), block):
+        events += vad.process(signal[i : i + block])
+    return vad, events
+
+
+def kinds(events):
+    return [e.kind for e in events]
+
+
+def test_one_utterance(rng):
+    signal = np.concatenate([noise(rng, 1), voice(rng, 1, 0.1), noise(rng, 1.5)])
+    vad, events = run(signal)
+    assert kinds(events) == [SEGMENT, UTTERANCE_END]
+    pad = int(VadConfig().pad * SR)
+    start, end = events[0].start, events[0].end
+    assert abs(start - (SR - pad)) <= 0.05 * SR
+    assert abs(end - (2 * SR + pad)) <= 0.05 * SR
+    assert vad.speech_bounds(len(signal)) == (start, end)
+
+
+def test_events_do_not_depend_on_block_size(rng):
+    signal = np.concatenate([noise(rng, 1), voice(rng, 1, 0.1), noise(rng, 1.5)])
+    assert run(signal, 1024)[1] == run(signal, 777)[1] == run(signal, len(signal))[1]
+
+
+def test_hysteresis_keeps_quieter_tail_in_the_segment(rng):
+    # 0.02는 시작 임계값(잡음 × 3)보다 낮고 유지 임계값(잡음 × 1.8)보다 높다
+    loud_then_quiet = np.concatenate(
+        [noise(rng, 1), voice(rng, 0.5, 0.1), voice(rng, 0.5, 0.02), noise(rng, 1.5)]
+    )
+    _, events = run(loud_then_quiet)
+    assert kinds(events) == [SEGMENT, UTTERANCE_END]
+    assert events[0].end >= 2 * SR
+
+    quiet_only = np.concatenate([noise(rng, 1), voice(rng, 1, 0.02), noise(rng, 1.5)])
+    assert run(quiet_only)[1] == []
+
+
+def test_short_pause_does_not_split(rng):
+    short_gap = np.concatenate(
+        [noise(rng, 1), voice(rng, 0.5, 0.1), noise(rng, 0.1), voice(rng, 0.5, 0.1), noise(rng, 1.5)]
+    )
+    assert kinds(run(short_gap)[1]) == [SEGMENT, UTTERANCE_END]
+
+    long_gap = np.concatenate(
+        [noise(rng, 1), voice(rng, 0.5, 0.1), noise(rng, 0.6), voice(rng, 0.5, 0.1), noise(rng, 1.5)]
+    )
+    assert kinds(run(long_gap)[1]) == [SEGMENT, SEGMENT, UTTERANCE_END]
+
+
+def test_no_speech_timeout(rng):
+    config = VadConfig(no_speech_timeout=2.0)
+    _, events = run(noise(rng, 3), config=config)
+    assert kinds(events) == [NO_SPEECH]
+    assert events[0].start == pytest.approx(2 * SR, abs=VadConfig().frame_ms * SR // 1000)
+
+
+def test_noise_floor_adapts_to_loud_room(rng):
+    vad, events = run(noise(rng, 5, rms=0.05))
+    assert events == []
+    assert 0.03 < vad.noise < 0.05
+
+
+def test_flush_returns_open_segment(rng):
+    signal = np.concatenate([noise(rng, 1), voice(rng, 1, 0.1)])
+    vad, events = run(signal)
+    assert events == []
+    start, end = vad.flush(len(signal))
+    assert start < SR < end == len(signal)
+    assert vad.flush() is None